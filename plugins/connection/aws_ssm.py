@@ -29,13 +29,15 @@ notes:
     plaintext in those files in S3 indefinitely, visible to anyone with access to that bucket. Therefore it is recommended to use a bucket with versioning
     disabled/suspended.
   - The files in S3 will be deleted even if the C(keep_remote_files) setting is C(true).
+  - Files smaller than I(inline_transfer_threshold) bytes, which includes most module payloads, are sent directly over
+    the SSM session rather than through the S3 bucket.
 
 requirements:
   - The remote EC2 instance must be running the AWS Systems Manager Agent (SSM Agent).
     U(https://docs.aws.amazon.com/systems-manager/latest/userguide/session-manager-getting-started.html)
   - The control machine must have the AWS session manager plugin installed.
     U(https://docs.aws.amazon.com/systems-manager/latest/userguide/session-manager-working-with-install-plugin.html)
-  - The remote EC2 Linux instance must have curl installed.
+  - The remote EC2 Linux instance must have curl and base64 installed.
   - The remote EC2 Linux instance and the controller both need network connectivity to S3.
   - The remote instance does not require IAM credentials for S3. This module will generate a presigned URL for S3 from the controller,
     and then will pass that URL to the target over SSM, telling the target to download/upload from S3 with C(curl).
@@ -142,6 +144,77 @@ options:
     version_added: 5.2.0
     vars:
     - name: ansible_aws_ssm_s3_addressing_style
+  s3_max_concurrency:
+    description:
+    - Maximum number of parallel requests used when transferring a file to or from the S3 bucket.
+    - Applies both to the controller and, for files larger than I(s3_multipart_threshold), to the remote host.
+    type: integer
+    default: 10
+    version_added: 9.0.0
+    vars:
+    - name: ansible_aws_ssm_s3_max_concurrency
+  s3_multipart_threshold:
+    description:
+    - Files of this number of bytes or larger are transferred between the remote host and the S3 bucket in parts,
+      using up to I(s3_max_concurrency) parallel C(curl) processes, or PowerShell jobs on Windows.
+    - Set to C(0) to always transfer files in a single request.
+    type: integer
+    default: 67108864
+    version_added: 9.0.0
+    vars:
+    - name: ansible_aws_ssm_s3_multipart_threshold
+  s3_multipart_chunksize:
+    description:
+    - Size, in bytes, of the parts used for transfers larger than I(s3_multipart_threshold).
+    - Parts are rounded up to a whole number of MiB, and are at least 5 MiB.
+    type: integer
+    default: 16777216
+    version_added: 9.0.0
+    vars:
+    - name: ansible_aws_ssm_s3_multipart_chunksize
+  inline_transfer_threshold:
+    description:
+    - Files smaller than this number of bytes are transferred directly over the SSM session, base64 encoded,
+      instead of being staged in the S3 bucket.
+    - Larger files, and files which can't be transferred directly, use the S3 bucket.
+    - On Windows hosts only files which fit in a single command (6 KiB) are sent directly to the host.
+    - Set to C(0) to always use the S3 bucket.
+    type: integer
+    default: 131072
+    version_added: 9.0.0
+    vars:
+    - name: ansible_aws_ssm_inline_transfer_threshold
+  session_pool:
+    description:
+    - Keep the SSM session, with its terminal already prepared, alive after the task completes so that
+      later tasks and forks targeting the same instance can reuse it.
+    - Pooled sessions are keyed by I(instance_id), I(region), I(profile) and I(ssm_document), and are owned by a
+      small background process on the controller which relays the terminal over a local UNIX socket, similar
+      to the C(ControlPersist) feature of OpenSSH.
+    - Reusing a pooled session skips both the C(StartSession) API call and the terminal setup.
+    type: boolean
+    default: false
+    version_added: 9.0.0
+    vars:
+    - name: ansible_aws_ssm_session_pool
+  session_pool_idle_timeout:
+    description:
+    - Number of seconds a pooled session may remain unused before it is terminated.
+    - Only used when I(session_pool=true).
+    type: integer
+    default: 300
+    version_added: 9.0.0
+    vars:
+    - name: ansible_aws_ssm_session_pool_idle_timeout
+  session_pool_dir:
+    description:
+    - Directory on the controller in which the control sockets of pooled sessions are created.
+    - Only used when I(session_pool=true).
+    type: path
+    default: '~/.ansible/cp'
+    version_added: 9.0.0
+    vars:
+    - name: ansible_aws_ssm_session_pool_dir
 """
 
 EXAMPLES = r"""
@@ -283,11 +356,26 @@ EXAMPLES = r"""
       yum:
         name: nginx
         state: present
+
+# Reuse the same SSM session for all the tasks run against an instance
+- name: Install a Nginx Package
+  vars:
+    ansible_connection: aws_ssm
+    ansible_aws_ssm_bucket_name: nameofthebucket
+    ansible_aws_ssm_region: us-west-2
+    ansible_aws_ssm_session_pool: true
+    ansible_aws_ssm_session_pool_idle_timeout: 120
+  tasks:
+    - name: Install a Nginx Package
+      yum:
+        name: nginx
+        state: present
 """
 
-import os
+import base64
 import getpass
 import json
+import os
 import pty
 import random
 import re
@@ -298,6 +386,7 @@ import time
 
 try:
     import boto3
+    from boto3.s3.transfer import TransferConfig
     from botocore.client import Config
 except ImportError as e:
     pass
@@ -315,8 +404,20 @@ from ansible.plugins.connection import ConnectionBase
 from ansible.plugins.shell.powershell import _common_args
 from ansible.utils.display import Display
 
+from ansible_collections.community.aws.plugins.plugin_utils.ssm.sessionpool import connect_session_pool
+from ansible_collections.community.aws.plugins.plugin_utils.ssm.sessionpool import session_pool_key
+from ansible_collections.community.aws.plugins.plugin_utils.ssm.sessionpool import session_pool_lock
+from ansible_collections.community.aws.plugins.plugin_utils.ssm.sessionpool import session_pool_path
+from ansible_collections.community.aws.plugins.plugin_utils.ssm.sessionpool import spawn_session_pool
+
 display = Display()
 
+# Terminal control sequences found in Windows sessions, these never span lines
+OSC_FILTER = re.compile(r"\x1b\][^\x07\n]*\x07")
+ANSI_FILTER = re.compile(r"(\x9B|\x1B\[)[0-?]*[ -/]*[@-~]")
+# Lines wrapped at the terminal width
+WRAP_FILTER = re.compile(r"^([^\n]{200})\n", re.MULTILINE)
+
 
 def _ssm_retry(func):
     """
@@ -365,6 +466,12 @@ def _ssm_retry(func):
     return wrapped
 
 
+MIB = 1024 * 1024
+# S3 multipart upload limits
+S3_MIN_PART_SIZE = 5 * MIB
+S3_MAX_PARTS = 10000
+
+
 def chunks(lst, n):
     """Yield successive n-sized chunks from lst."""
     for i in range(0, len(lst), n):
@@ -387,10 +494,21 @@ class Connection(ConnectionBase):
     _session = None
     _stdout = None
     _session_id = ""
+    _session_pooled = False
     _timeout = False
+    _quiet = False
     MARK_LENGTH = 26
+    READ_SIZE = 65536
+    INLINE_LINE_LENGTH = 1024
+    # PowerShell commands are sent as an encoded command line, which is limited to 32767 characters
+    WINDOWS_INLINE_LIMIT = 6144
+    # Number of characters of presigned URLs which fit in a single encoded PowerShell command
+    WINDOWS_URL_BUDGET = 8192
 
     def _display(self, f, message):
+        # The process owning a pooled session is detached from the worker
+        if self._quiet:
+            return
         if self.host:
             host_args = {"host": self.host}
         else:
@@ -507,6 +625,9 @@ class Connection(ConnectionBase):
     def reset(self):
         """start a fresh ssm session"""
         self._vvvv("reset called on ssm connection")
+        if self._session_id and self._session_pooled:
+            # Don't hand the same terminal back out of the pool
+            self._session.terminate()
         self.close()
         return self.start_session()
 
@@ -526,6 +647,14 @@ class Connection(ConnectionBase):
 
         self._init_clients()
 
+        if self.get_option("session_pool"):
+            return self._start_pooled_session(executable)
+
+        return self._start_session_process(executable)
+
+    def _start_session_process(self, executable):
+        """call StartSession and launch the session-manager-plugin"""
+
         self._vvvv(f"START SSM SESSION: {self.instance_id}")
         start_session_args = dict(Target=self.instance_id, Parameters={})
         document_name = self.get_option("ssm_document")
@@ -571,6 +700,97 @@ class Connection(ConnectionBase):
 
         return session
 
+    def _start_pooled_session(self, executable):
+        """attach to a pooled ssm session, starting the pool process if needed"""
+
+        socket_path = session_pool_path(
+            self.get_option("session_pool_dir"),
+            session_pool_key(
+                self.instance_id,
+                self.get_option("region"),
+                self.get_option("profile"),
+                self.get_option("ssm_document"),
+            ),
+        )
+
+        def _serve_session():
+            self._quiet = True
+            session = self._start_session_process(executable)
+            return session, self._stdout, self._session_id
+
+        def _close_served_session():
+            # The terminal may be busy if the session is being evicted
+            self._timeout = True
+            self.close()
+
+        # The first attempt may find a pooled session which has gone stale,
+        # in which case it's evicted and replaced by a fresh one.
+        for attempt in range(2):
+            with session_pool_lock(socket_path):
+                session = connect_session_pool(socket_path)
+                if session is None:
+                    self._vvvv(f"SSM SESSION POOL: starting session for {self.instance_id} on {socket_path}")
+                    error = spawn_session_pool(
+                        socket_path,
+                        _serve_session,
+                        _close_served_session,
+                        self.get_option("session_pool_idle_timeout"),
+                    )
+                    if error:
+                        raise AnsibleConnectionFailure(
+                            f"SSM session pool failed to start on host {self.instance_id}: {error}"
+                        )
+                    session = connect_session_pool(socket_path)
+
+            if session is None or not session.handshake(self.get_option("ssm_timeout")):
+                self._vvvv(f"SSM SESSION POOL: unable to attach to {socket_path}")
+                if session is not None:
+                    session.close()
+                continue
+
+            self._session = session
+            self._stdout = session.stdout
+            self._session_id = session.session_id
+            self._session_pooled = True
+            self._poll_stdout = select.poll()
+            self._poll_stdout.register(self._stdout, select.POLLIN)
+
+            if self._check_pooled_terminal():
+                self._vvvv(f"SSM CONNECTION ID: {self._session_id} (pooled)")
+                return session
+
+            self._vvvv(f"SSM SESSION POOL: evicting unresponsive session {self._session_id}")
+            session.terminate()
+            self._session_id = ""
+            self._session_pooled = False
+
+        raise AnsibleConnectionFailure(f"SSM session pool unable to provide a session for host: {self.instance_id}")
+
+    def _check_pooled_terminal(self):
+        """make sure a pooled terminal is idle and responsive before reusing it"""
+
+        mark = "".join([random.choice(string.ascii_letters) for i in xrange(self.MARK_LENGTH)])
+        # Split the mark so an echoed command is never mistaken for the reply
+        half = self.MARK_LENGTH // 2
+        if self.is_windows:
+            cmd = f"echo ('{mark[:half]}' + '{mark[half:]}')\n"
+        else:
+            cmd = f"printf '%s%s\\n' '{mark[:half]}' '{mark[half:]}'\n"
+        self._session.stdin.write(to_bytes(cmd, errors="surrogate_or_strict"))
+
+        stdout = ""
+        stop_time = int(round(time.time())) + self.get_option("ssm_timeout")
+        while self._session.poll() is None and int(round(time.time())) < stop_time:
+            if not self._poll_stdout.poll(1000):
+                continue
+            data = self._stdout.read(1024)
+            if not data:
+                break
+            stdout += to_text(data)
+            if mark in stdout:
+                return True
+        return False
+
     @_ssm_retry
     def exec_command(self, cmd, in_data=None, sudoable=True):
         """run a command on the ssm host"""
@@ -596,44 +816,72 @@ class Connection(ConnectionBase):
         for chunk in chunks(cmd, 1024):
             session.stdin.write(to_bytes(chunk, errors="surrogate_or_strict"))
 
-        # Read stdout between the markers
-        stdout = ""
+        stdout = self._read_command_output(session, mark_start, mark_end)
+
+        self._vvvv(f"POST_PROCESS: \n{to_text(stdout)}")
+        returncode, stdout = self._post_process(stdout, mark_begin)
+        self._vvvv(f"POST_PROCESSED: \n{to_text(stdout)}")
+
+        stderr = self._flush_stderr(session)
+
+        return (returncode, stdout, stderr)
+
+    def _read_command_output(self, session, mark_start, mark_end):
+        """read the output of a command, from the line after mark_start up to the line containing mark_end"""
+
+        stdout_fd = self._stdout.fileno()
+        mark_end = to_bytes(mark_end, errors="surrogate_or_strict")
+        pending = b""
         win_line = ""
         begin = False
+        # Output is collected as raw bytes, the ANSI filtering and decoding is
+        # done once the whole output has been received.
+        output = bytearray()
+        scanned = 0
         stop_time = int(round(time.time())) + self.get_option("ssm_timeout")
         while session.poll() is None:
             remaining = stop_time - int(round(time.time()))
             if remaining < 1:
                 self._timeout = True
-                self._vvvv(f"EXEC timeout stdout: \n{to_text(stdout)}")
+                self._vvvv(f"EXEC timeout stdout: \n{to_text(bytes(output) or pending)}")
                 raise AnsibleConnectionFailure(f"SSM exec_command timeout on host: {self.instance_id}")
-            if self._poll_stdout.poll(1000):
-                line = self._filter_ansi(self._stdout.readline())
-                self._vvvv(f"EXEC stdout line: \n{to_text(line)}")
-            else:
+            if not self._poll_stdout.poll(1000):
                 self._vvvv(f"EXEC remaining: {remaining}")
                 continue
 
-            if not begin and self.is_windows:
-                win_line = win_line + line
-                line = win_line
-
-            if mark_start in line:
-                begin = True
-                if not line.startswith(mark_start):
-                    stdout = ""
+            chunk = os.read(stdout_fd, self.READ_SIZE)
+            self._vvvv(f"EXEC stdout chunk: {len(chunk)} bytes")
+
+            if not begin:
+                # Anything before the start marker is noise (prompts, echoed
+                # commands), it's only ever a few lines so is searched line by line.
+                lines = (pending + chunk).split(b"\n")
+                pending = lines.pop()
+                for index, line in enumerate(lines):
+                    line = self._filter_ansi(line + b"\n")
+                    if self.is_windows:
+                        win_line = win_line + line
+                        line = win_line
+                    if mark_start in line:
+                        begin = True
+                        chunk = b"\n".join(lines[index + 1:] + [pending])  # fmt: skip
+                        break
+                if not begin:
+                    continue
+
+            output += chunk
+            # The end marker may be split across chunks, so overlap the search
+            # with the tail of the data which has already been scanned.
+            found = output.find(mark_end, max(0, scanned - len(mark_end) + 1))
+            if found == -1:
+                scanned = len(output)
                 continue
-            if begin:
-                if mark_end in line:
-                    self._vvvv(f"POST_PROCESS: \n{to_text(stdout)}")
-                    returncode, stdout = self._post_process(stdout, mark_begin)
-                    self._vvvv(f"POST_PROCESSED: \n{to_text(stdout)}")
-                    break
-                stdout = stdout + line
 
-        stderr = self._flush_stderr(session)
+            # Drop the line containing the end marker
+            del output[output.rfind(b"\n", 0, found) + 1:]  # fmt: skip
+            return self._filter_ansi(bytes(output))
 
-        return (returncode, stdout, stderr)
+        raise AnsibleConnectionFailure(f"SSM process closed during exec_command on host: {self.instance_id}")
 
     def _prepare_terminal(self):
         """perform any one-time terminal settings"""
@@ -653,7 +901,9 @@ class Connection(ConnectionBase):
         disable_prompt_complete = None
         end_mark = "".join([random.choice(string.ascii_letters) for i in xrange(self.MARK_LENGTH)])
         disable_prompt_cmd = to_bytes(
-            "PS1='' ; bind 'set enable-bracketed-paste off'; printf '\\n%s\\n' '" + end_mark + "'\n",
+            # Line editing isn't needed and slows down reading long inputs such as inline file transfers
+            "PS1='' ; PS2='' ; bind 'set enable-bracketed-paste off'; set +o emacs +o vi 2>/dev/null; "
+            "printf '\\n%s\\n' '" + end_mark + "'\n",
             errors="surrogate_or_strict",
         )
         disable_prompt_reply = re.compile(r"\r\r\n" + re.escape(end_mark) + r"\r\r\n", re.MULTILINE)
@@ -728,10 +978,15 @@ class Connection(ConnectionBase):
         """extract command status and strip unwanted lines"""
 
         if not self.is_windows:
-            # Get command return code
-            returncode = int(stdout.splitlines()[-2])
+            # Only the last few lines hold the status, avoid splitting the whole output
+            trailer = stdout.rsplit("\n", 3)
+            if len(trailer) == 4:
+                # Get command return code
+                returncode = int("\n".join(trailer[1:]).splitlines()[-2])
+                # Throw away final lines
+                return (returncode, trailer[0])
 
-            # Throw away final lines
+            returncode = int(stdout.splitlines()[-2])
             for _x in range(0, 3):
                 stdout = stdout[:stdout.rfind('\n')]  # fmt: skip
 
@@ -759,14 +1014,13 @@ class Connection(ConnectionBase):
         line = to_text(line)
 
         if self.is_windows:
-            osc_filter = re.compile(r"\x1b\][^\x07]*\x07")
-            line = osc_filter.sub("", line)
-            ansi_filter = re.compile(r"(\x9B|\x1B\[)[0-?]*[ -/]*[@-~]")
-            line = ansi_filter.sub("", line)
+            line = OSC_FILTER.sub("", line)
+            line = ANSI_FILTER.sub("", line)
 
             # Replace or strip sequence (at terminal width)
             line = line.replace("\r\r\n", "\n")
-            if len(line) == 201:
+            line = WRAP_FILTER.sub(r"\1", line)
+            if len(line) - (line.rfind("\n") + 1) == 201:
                 line = line[:-1]
 
         return line
@@ -774,9 +1028,13 @@ class Connection(ConnectionBase):
     def _flush_stderr(self, session_process):
         """read and return stderr with minimal blocking"""
 
+        stderr = ""
+        # Pooled sessions don't relay stderr
+        if session_process.stderr is None:
+            return stderr
+
         poll_stderr = select.poll()
         poll_stderr.register(session_process.stderr, select.POLLIN)
-        stderr = ""
 
         while session_process.poll() is None:
             if not poll_stderr.poll(1):
@@ -926,16 +1184,311 @@ class Connection(ConnectionBase):
             if ssm_action == "get":
                 (returncode, stdout, stderr) = self._exec_transport_commands(in_path, out_path, put_commands)
                 with open(to_bytes(out_path, errors="surrogate_or_strict"), "wb") as data:
-                    client.download_fileobj(bucket_name, s3_path, data)
+                    client.download_fileobj(bucket_name, s3_path, data, Config=self._transfer_config())
             else:
                 with open(to_bytes(in_path, errors="surrogate_or_strict"), "rb") as data:
-                    client.upload_fileobj(data, bucket_name, s3_path, ExtraArgs=put_args)
+                    client.upload_fileobj(
+                        data, bucket_name, s3_path, ExtraArgs=put_args, Config=self._transfer_config()
+                    )
                 (returncode, stdout, stderr) = self._exec_transport_commands(in_path, out_path, get_commands)
             return (returncode, stdout, stderr)
         finally:
             # Remove the files from the bucket after they've been transferred
             client.delete_object(Bucket=bucket_name, Key=s3_path)
 
+    def _transfer_config(self):
+        return TransferConfig(
+            multipart_threshold=self.get_option("s3_multipart_threshold") or S3_MIN_PART_SIZE,
+            multipart_chunksize=self.get_option("s3_multipart_chunksize"),
+            max_concurrency=self.get_option("s3_max_concurrency"),
+        )
+
+    def _multipart_part_size(self, size):
+        """Size of each part, S3 limits the number of parts and their minimum size"""
+        part_size = max(self.get_option("s3_multipart_chunksize"), S3_MIN_PART_SIZE, -(-size // S3_MAX_PARTS))
+        # Parts are reassembled on the host with dd, in units of 1 MiB
+        return -(-part_size // MIB) * MIB
+
+    def _generate_multipart_get_commands(self, bucket_name, s3_path, out_path, size, part_size):
+        """Generate the commands which download a file from S3 to the host with parallel ranged GETs"""
+
+        # The Range header isn't part of the signature, a single URL serves every part
+        get_url = self._get_url("get_object", bucket_name, s3_path, "GET")
+        concurrency = self.get_option("s3_max_concurrency")
+
+        if self.is_windows:
+            return [
+                (
+                    f"$url = '{get_url}'; $out = '{out_path}'; $size = {size}; $partSize = {part_size}\n"
+                    "$dir = New-Item -ItemType Directory -Path (Join-Path ([IO.Path]::GetTempPath()) ([IO.Path]::GetRandomFileName()))\n"
+                    "$get = {\n"
+                    "    param($url, $start, $end, $path)\n"
+                    "    $request = [Net.HttpWebRequest]::Create($url)\n"
+                    "    $request.AddRange([long]$start, [long]$end)\n"
+                    "    $response = $request.GetResponse()\n"
+                    "    $stream = [IO.File]::Create($path)\n"
+                    "    try { $response.GetResponseStream().CopyTo($stream) } finally { $stream.Close(); $response.Close() }\n"
+                    "}\n"
+                    "$jobs = @()\n"
+                    "for ($start = 0; $start -lt $size; $start += $partSize) {\n"
+                    f"    while (@($jobs | Where-Object {{ $_.State -eq 'Running' }}).Count -ge {concurrency}) {{\n"
+                    "        Wait-Job -Job @($jobs | Where-Object { $_.State -eq 'Running' }) -Any | Out-Null\n"
+                    "    }\n"
+                    "    $end = [Math]::Min($start + $partSize, $size) - 1\n"
+                    "    $jobs += Start-Job -ScriptBlock $get -ArgumentList $url, $start, $end, (Join-Path $dir $start)\n"
+                    "}\n"
+                    "$jobs | Wait-Job | Out-Null\n"
+                    "$failed = @($jobs | Where-Object { $_.State -ne 'Completed' }).Count\n"
+                    "if ($failed -eq 0) {\n"
+                    "    $output = [IO.File]::Create($out)\n"
+                    "    try {\n"
+                    "        for ($start = 0; $start -lt $size; $start += $partSize) {\n"
+                    "            $part = [IO.File]::OpenRead((Join-Path $dir $start))\n"
+                    "            try { $part.CopyTo($output) } finally { $part.Close() }\n"
+                    "        }\n"
+                    "    } finally { $output.Close() }\n"
+                    "}\n"
+                    "Remove-Item -Recurse -Force $dir\n"
+                    "if ($failed -ne 0) { exit 1 }"
+                ),
+            ]  # fmt: skip
+
+        # Each part is downloaded to a temporary file then written into place,
+        # waiting for every batch of parts to complete before starting more.
+        return [
+            (
+                "( d=$(mktemp -d) || exit 1\n"
+                f": > '{out_path}' || exit 1\n"
+                f"u='{get_url}'\n"
+                "n=0\n"
+                f"while [ $((n * {part_size})) -lt {size} ]; do\n"
+                f"s=$((n * {part_size})); e=$((s + {part_size} - 1))\n"
+                '{ curl -sSf -r "$s-$e" -o "$d/$n" "$u" && '
+                f"dd if=\"$d/$n\" of='{out_path}' obs={MIB} seek=$((s / {MIB})) conv=notrunc 2>/dev/null || "
+                'touch "$d/failed"; rm -f "$d/$n"; } &\n'
+                "n=$((n + 1))\n"
+                f"[ $((n % {concurrency})) -eq 0 ] && wait\n"
+                "done\n"
+                "wait\n"
+                '[ ! -e "$d/failed" ]; rc=$?\n'
+                'rm -rf "$d"\n'
+                "exit $rc )"
+            ),
+        ]  # fmt: skip
+
+    def _generate_multipart_put_commands(self, bucket_name, s3_path, upload_id, in_path, size, part_size):
+        """Generate the commands which upload a file from the host to S3 in parallel parts, one command per batch"""
+
+        parts = []
+        for number, start in enumerate(range(0, size, part_size), 1):
+            url = self._get_url(
+                "upload_part",
+                bucket_name,
+                s3_path,
+                "PUT",
+                extra_args={"UploadId": upload_id, "PartNumber": number},
+            )
+            parts.append((start, min(part_size, size - start), url))
+
+        concurrency = self.get_option("s3_max_concurrency")
+        batches = []
+        for part in parts:
+            if batches and len(batches[-1]) < concurrency:
+                # Windows commands have a limited length
+                if not self.is_windows or sum(len(p[2]) for p in batches[-1]) + len(part[2]) <= self.WINDOWS_URL_BUDGET:
+                    batches[-1].append(part)
+                    continue
+            batches.append([part])
+
+        commands = []
+        for batch in batches:
+            if self.is_windows:
+                jobs = "\n".join(
+                    f"    Start-Job -ScriptBlock $put -ArgumentList $path, {start}, {length}, '{url}'"
+                    for start, length, url in batch
+                )
+                commands.append(
+                    f"$path = '{in_path}'\n"
+                    "$put = {\n"
+                    "    param($path, $start, $length, $url)\n"
+                    "    $buffer = New-Object byte[] $length\n"
+                    "    $stream = [IO.File]::OpenRead($path)\n"
+                    "    try {\n"
+                    "        [void]$stream.Seek($start, [IO.SeekOrigin]::Begin)\n"
+                    "        $read = 0\n"
+                    "        while ($read -lt $length) {\n"
+                    "            $count = $stream.Read($buffer, $read, $length - $read)\n"
+                    "            if ($count -le 0) { throw 'unexpected end of file' }\n"
+                    "            $read += $count\n"
+                    "        }\n"
+                    "    } finally { $stream.Close() }\n"
+                    "    Invoke-WebRequest -Method PUT -Uri $url -Body $buffer -UseBasicParsing | Out-Null\n"
+                    "}\n"
+                    f"$jobs = @(\n{jobs}\n)\n"
+                    "$jobs | Wait-Job | Out-Null\n"
+                    "if (@($jobs | Where-Object { $_.State -ne 'Completed' }).Count -ne 0) { exit 1 }"
+                )  # fmt: skip
+            else:
+                jobs = "\n".join(
+                    f"{{ {{ dd if='{in_path}' of=\"$d/{start}\" bs={MIB} skip={start // MIB} count={-(-length // MIB)} 2>/dev/null && "
+                    f'curl -sSf -o /dev/null -T "$d/{start}" \'{url}\'; }} || touch "$d/failed"; rm -f "$d/{start}"; }} &'
+                    for start, length, url in batch
+                )
+                commands.append(
+                    "( d=$(mktemp -d) || exit 1\n"
+                    f"{jobs}\n"
+                    "wait\n"
+                    '[ ! -e "$d/failed" ]; rc=$?\n'
+                    'rm -rf "$d"\n'
+                    "exit $rc )"
+                )  # fmt: skip
+        return commands
+
+    def _remote_file_size(self, in_path):
+        """size of a file on the host, None if it can't be read"""
+        if self.is_windows:
+            command = f"(Get-Item -LiteralPath '{in_path}').Length"
+        else:
+            command = f"wc -c < '{in_path}'"
+        (returncode, stdout, stderr) = self.exec_command(command, in_data=None, sudoable=False)
+        try:
+            return int(stdout.strip()) if returncode == 0 else None
+        except ValueError:
+            return None
+
+    @_ssm_retry
+    def _multipart_file_transport_command(self, in_path, out_path, ssm_action, size):
+        """transfer a large file to/from host in parallel parts using an intermediate S3 bucket"""
+
+        bucket_name = self.get_option("bucket_name")
+        s3_path = self._escape_path(f"{self.instance_id}/{out_path}")
+        part_size = self._multipart_part_size(size)
+        put_args, put_headers = self._generate_encryption_settings()
+
+        client = self._s3_client
+
+        try:
+            if ssm_action == "get":
+                upload_id = client.create_multipart_upload(Bucket=bucket_name, Key=s3_path, **put_args)["UploadId"]
+                try:
+                    commands = self._generate_multipart_put_commands(
+                        bucket_name, s3_path, upload_id, in_path, size, part_size
+                    )
+                    (returncode, stdout, stderr) = self._exec_transport_commands(in_path, out_path, commands)
+
+                    # The host doesn't report the ETags of the parts, S3 does
+                    paginator = client.get_paginator("list_parts")
+                    parts = [
+                        {"ETag": part["ETag"], "PartNumber": part["PartNumber"]}
+                        for page in paginator.paginate(Bucket=bucket_name, Key=s3_path, UploadId=upload_id)
+                        for part in page.get("Parts", [])
+                    ]
+                    part_count = len(range(0, size, part_size))
+                    if len(parts) != part_count:
+                        raise AnsibleError(
+                            f"failed to transfer file to {in_path} {out_path}: "
+                            f"only {len(parts)} of {part_count} parts were uploaded"
+                        )
+                    client.complete_multipart_upload(
+                        Bucket=bucket_name,
+                        Key=s3_path,
+                        UploadId=upload_id,
+                        MultipartUpload={"Parts": parts},
+                    )
+                except Exception:
+                    client.abort_multipart_upload(Bucket=bucket_name, Key=s3_path, UploadId=upload_id)
+                    raise
+                with open(to_bytes(out_path, errors="surrogate_or_strict"), "wb") as data:
+                    client.download_fileobj(bucket_name, s3_path, data, Config=self._transfer_config())
+            else:
+                with open(to_bytes(in_path, errors="surrogate_or_strict"), "rb") as data:
+                    client.upload_fileobj(
+                        data, bucket_name, s3_path, ExtraArgs=put_args, Config=self._transfer_config()
+                    )
+                commands = self._generate_multipart_get_commands(bucket_name, s3_path, out_path, size, part_size)
+                (returncode, stdout, stderr) = self._exec_transport_commands(in_path, out_path, commands)
+            return (returncode, stdout, stderr)
+        finally:
+            # Remove the files from the bucket after they've been transferred
+            client.delete_object(Bucket=bucket_name, Key=s3_path)
+
+    def _inline_put_commands(self, in_path, out_path):
+        """Generate the commands which write a local file on the host"""
+
+        with open(to_bytes(in_path, errors="surrogate_or_strict"), "rb") as f:
+            content = f.read()
+
+        if self.is_windows:
+            encoded = to_text(base64.b64encode(content))
+            return [
+                (
+                    f"$bytes = [Convert]::FromBase64String('{encoded}'); "
+                    f"[IO.File]::WriteAllBytes('{out_path}', $bytes)"
+                ),
+            ]  # fmt: skip
+
+        # Keep lines well under the canonical line limit of the remote terminal
+        encoded = to_text(base64.b64encode(content))
+        lines = "\n".join(chunks(encoded, self.INLINE_LINE_LENGTH))
+        delimiter = "".join([random.choice(string.ascii_letters) for i in xrange(self.MARK_LENGTH)])
+        return [
+            (
+                f"{{ base64 -d > '{out_path}' <<'{delimiter}'\n"
+                f"{lines}\n"
+                f"{delimiter}\n"
+                f"}} && test \"$(wc -c < '{out_path}')\" -eq {len(content)}"
+            ),
+        ]  # fmt: skip
+
+    @_ssm_retry
+    def _inline_put_file(self, in_path, out_path):
+        """transfer a file to the host directly over the ssm session"""
+        commands = self._inline_put_commands(in_path, out_path)
+        return self._exec_transport_commands(in_path, out_path, commands)
+
+    @_ssm_retry
+    def _inline_fetch_file(self, in_path, out_path, threshold):
+        """
+        transfer a file from the host directly over the ssm session
+
+        returns None if the file isn't small enough to be transferred directly
+        """
+
+        if self.is_windows:
+            command = (
+                f"$file = Get-Item -LiteralPath '{in_path}'; "
+                f"if ($file.Length -ge {threshold}) {{ exit 1 }}; "
+                "Write-Output $file.Length; "
+                "[Convert]::ToBase64String([IO.File]::ReadAllBytes($file.FullName))"
+            )  # fmt: skip
+        else:
+            command = (
+                f"{{ size=$(wc -c < '{in_path}') && test \"$size\" -lt {threshold} && "
+                f"echo \"$size\" && base64 < '{in_path}'; }}"
+            )  # fmt: skip
+
+        (returncode, stdout, stderr) = self.exec_command(command, in_data=None, sudoable=False)
+        if returncode != 0:
+            return None
+
+        # The size comes first, followed by the base64 encoded content
+        size, _sep, encoded = stdout.strip().partition("\n")
+        content = base64.b64decode(to_bytes(encoded, errors="surrogate_or_strict"))
+        if len(content) != int(size):
+            raise AnsibleError(
+                f"failed to transfer file to {in_path} {out_path}: received {len(content)} of {int(size)} bytes"
+            )
+
+        with open(to_bytes(out_path, errors="surrogate_or_strict"), "wb") as f:
+            f.write(content)
+        return (returncode, "", stderr)
+
+    def _inline_transfer_threshold(self):
+        threshold = self.get_option("inline_transfer_threshold") or 0
+        if self.is_windows:
+            threshold = min(threshold, self.WINDOWS_INLINE_LIMIT)
+        return threshold
+
     def put_file(self, in_path, out_path):
         """transfer a file from local to remote"""
 
@@ -945,7 +1498,20 @@ class Connection(ConnectionBase):
         if not os.path.exists(to_bytes(in_path, errors="surrogate_or_strict")):
             raise AnsibleFileNotFound(f"file or module does not exist: {in_path}")
 
-        return self._file_transport_command(in_path, out_path, "put")
+        start = time.time()
+        size = os.path.getsize(to_bytes(in_path, errors="surrogate_or_strict"))
+        multipart_threshold = self.get_option("s3_multipart_threshold")
+        if size < self._inline_transfer_threshold():
+            result = self._inline_put_file(in_path, out_path)
+            method = "SSM session"
+        elif multipart_threshold and size >= multipart_threshold:
+            result = self._multipart_file_transport_command(in_path, out_path, "put", size)
+            method = "S3 (multipart)"
+        else:
+            result = self._file_transport_command(in_path, out_path, "put")
+            method = "S3"
+        self._vvvv(f"PUT {in_path}: {size} bytes via {method} in {time.time() - start:.3f}s")
+        return result
 
     def fetch_file(self, in_path, out_path):
         """fetch a file from remote to local"""
@@ -953,11 +1519,39 @@ class Connection(ConnectionBase):
         super().fetch_file(in_path, out_path)
 
         self._vvv(f"FETCH {in_path} TO {out_path}")
-        return self._file_transport_command(in_path, out_path, "get")
+
+        start = time.time()
+        result = None
+        method = "SSM session"
+        # Windows can receive larger files over the session than it can send
+        threshold = self.get_option("inline_transfer_threshold") or 0
+        if threshold:
+            result = self._inline_fetch_file(in_path, out_path, threshold)
+        if result is None:
+            multipart_threshold = self.get_option("s3_multipart_threshold")
+            remote_size = self._remote_file_size(in_path) if multipart_threshold else None
+            if remote_size is not None and remote_size >= multipart_threshold:
+                result = self._multipart_file_transport_command(in_path, out_path, "get", remote_size)
+                method = "S3 (multipart)"
+            else:
+                result = self._file_transport_command(in_path, out_path, "get")
+                method = "S3"
+        size = os.path.getsize(to_bytes(out_path, errors="surrogate_or_strict"))
+        self._vvvv(f"FETCH {in_path}: {size} bytes via {method} in {time.time() - start:.3f}s")
+        return result
 
     def close(self):
         """terminate the connection"""
-        if self._session_id:
+        if self._session_id and self._session_pooled:
+            self._vvv(f"DETACHING FROM POOLED SSM CONNECTION TO: {self.instance_id}")
+            if self._timeout:
+                # The terminal may still be busy, don't hand it to anyone else
+                self._session.terminate()
+            else:
+                self._session.close()
+            self._session_id = ""
+            self._session_pooled = False
+        elif self._session_id:
             self._vvv(f"CLOSING SSM CONNECTION TO: {self.instance_id}")
             if self._timeout:
                 self._session.terminate()
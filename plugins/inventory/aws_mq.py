@@ -36,6 +36,32 @@ options:
     description:
       - The prefix for host variables names coming from AWS.
     type: str
+  region_cache_ttl:
+    description:
+      - When set, and O(cache) is enabled, the inventory is cached per region and per broker, and a stale
+        cache is refreshed incrementally rather than by querying every region and broker again.
+      - The number of seconds for which the brokers listed in a region are re-used before the region is listed again.
+      - Set to C(0) to list the brokers in every region on each run, while still only describing the brokers
+        which are new or whose state changed, see O(broker_cache_ttl).
+      - The whole cache still expires after O(cache_timeout) seconds.
+    type: int
+    version_added: 9.0.0
+  broker_cache_ttl:
+    description:
+      - The number of seconds for which the details of a broker are re-used, as long as the broker's
+        creation time and state are unchanged when its region is listed again.
+      - Only used when O(region_cache_ttl) is set.
+    type: int
+    default: 3600
+    version_added: 9.0.0
+  max_concurrency:
+    description:
+      - The maximum number of regions listed concurrently, and the maximum number of brokers described concurrently.
+      - Throttled requests are retried with an exponential backoff.
+      - Set to C(1) to query the regions and brokers one at a time.
+    type: int
+    default: 10
+    version_added: 9.0.0
   hostvars_suffix:
     description:
       - The suffix for host variables names coming from AWS.
@@ -83,8 +109,27 @@ compose:
   app: 'tags.Applications|split(",")'
 hostvars_prefix: aws_
 hostvars_suffix: _mq
+
+---
+
+# Example refreshing a long lived cache incrementally, each run lists the brokers
+# in every region but only describes the brokers which are new or changed
+plugin: community.aws.aws_mq
+regions:
+  - us-east-1
+  - eu-west-1
+cache: true
+cache_plugin: jsonfile
+cache_connection: /tmp/aws_mq_cache
+cache_timeout: 86400
+region_cache_ttl: 0
+broker_cache_ttl: 3600
 """
 
+import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 try:
     import botocore
 except ImportError:
@@ -95,6 +140,7 @@ from ansible.module_utils._text import to_native
 from ansible.module_utils.common.dict_transformations import camel_dict_to_snake_dict
 
 from ansible_collections.amazon.aws.plugins.module_utils.botocore import is_boto3_error_code
+from ansible_collections.amazon.aws.plugins.module_utils.retries import AWSRetry
 from ansible_collections.amazon.aws.plugins.module_utils.tagging import boto3_tag_list_to_ansible_dict
 from ansible_collections.amazon.aws.plugins.plugin_utils.inventory import AWSInventoryBase
 
@@ -121,6 +167,8 @@ broker_attr = [
 
 inventory_group = "aws_mq"
 
+DEFAULT_MAX_CONCURRENCY = 10
+
 
 def _find_hosts_matching_statuses(hosts, statuses):
     if not statuses:
@@ -139,6 +187,15 @@ def _get_mq_hostname(host):
         return host["BrokerName"]
 
 
+def _get_broker_fingerprint(host):
+    """The fields of a broker summary which tell us whether a cached describe_broker result is still valid"""
+    created = host.get("Created")
+    if isinstance(created, datetime.datetime):
+        # cache plugins may store datetimes as ISO 8601 strings
+        created = created.isoformat()
+    return [created, host.get("BrokerState")]
+
+
 def _get_broker_host_tags(detail):
     tags = []
     if "Tags" in detail:
@@ -147,23 +204,36 @@ def _get_broker_host_tags(detail):
     return tags
 
 
-def _add_details_to_hosts(connection, hosts, strict):
-    for host in hosts:
-        detail = None
-        resource_id = host["BrokerId"]
-        try:
-            detail = connection.describe_broker(BrokerId=resource_id)
-        except is_boto3_error_code("AccessDenied") as e:
-            if not strict:
-                pass
-            else:
-                raise AnsibleError(f"Failed to query MQ: {to_native(e)}")
-        except (
-            botocore.exceptions.BotoCoreError,
-            botocore.exceptions.ClientError,
-        ) as e:  # pylint: disable=duplicate-except
-            raise AnsibleError(f"Failed to query MQ: {to_native(e)}")
+@AWSRetry.jittered_backoff()
+def _describe_broker(connection, broker_id):
+    return connection.describe_broker(BrokerId=broker_id)
+
 
+def _get_broker_detail(connection, resource_id, strict):
+    try:
+        return _describe_broker(connection, resource_id)
+    except is_boto3_error_code("AccessDenied") as e:
+        if strict:
+            raise AnsibleError(f"Failed to query MQ: {to_native(e)}")
+    except (
+        botocore.exceptions.BotoCoreError,
+        botocore.exceptions.ClientError,
+    ) as e:  # pylint: disable=duplicate-except
+        raise AnsibleError(f"Failed to query MQ: {to_native(e)}")
+    return None
+
+
+def _add_details_to_hosts(connection, hosts, strict, executor=None):
+    """
+    :param executor: an optional concurrent.futures.Executor used to describe
+        the brokers concurrently, the results are merged in the order of hosts.
+    """
+    if executor is None:
+        details = [_get_broker_detail(connection, host["BrokerId"], strict) for host in hosts]
+    else:
+        details = executor.map(lambda host: _get_broker_detail(connection, host["BrokerId"], strict), hosts)
+
+    for host, detail in zip(hosts, details):
         if detail:
             # special handling of tags
             host["Tags"] = _get_broker_host_tags(detail)
@@ -181,13 +251,27 @@ class InventoryModule(AWSInventoryBase):
     def __init__(self):
         super(InventoryModule, self).__init__()
 
-    def _get_broker_hosts(self, connection, strict):
+    def _get_broker_hosts(self, connection, strict, executor=None, cached=None):
+        """
+        :param cached: an optional dict of broker IDs to cached entries (see _get_all_hosts()),
+            brokers whose Created time and state still match their entry are not described again.
+        """
+
         def _boto3_paginate_wrapper(func, *args, **kwargs):
             results = []
             try:
-                results = func(*args, **kwargs)
+                results = AWSRetry.jittered_backoff()(func)(*args, **kwargs)
                 results = results["BrokerSummaries"]
-                _add_details_to_hosts(connection, results, strict)
+                changed = results
+                if cached:
+                    changed = []
+                    for index, host in enumerate(results):
+                        entry = cached.get(host["BrokerId"])
+                        if entry and entry["fingerprint"] == _get_broker_fingerprint(host):
+                            results[index] = entry["host"]
+                        else:
+                            changed.append(host)
+                _add_details_to_hosts(connection, changed, strict, executor)
             except is_boto3_error_code("AccessDenied") as e:  # pylint: disable=duplicate-except
                 if not strict:
                     results = []
@@ -202,18 +286,74 @@ class InventoryModule(AWSInventoryBase):
 
         return _boto3_paginate_wrapper
 
-    def _get_all_hosts(self, regions, strict, statuses):
+    def _get_all_hosts(self, regions, strict, statuses, region_cache=None):
         """
         :param regions: a list of regions in which to describe hosts
         :param strict: a boolean determining whether to fail or ignore 403 error codes
         :param statuses: a list of statuses that the returned hosts should match
+        :param region_cache: an optional dict of cached results per region, updated in place
         :return A list of host dictionaries
         """
-        all_instances = []
+        max_concurrency = self.get_option("max_concurrency")
+        if max_concurrency is None:
+            max_concurrency = DEFAULT_MAX_CONCURRENCY
+        if max_concurrency < 1:
+            raise AnsibleError("max_concurrency must be at least 1")
+        # Clients are created up front, creating them isn't thread safe
+        clients = list(self.all_clients("mq"))
+
+        now = time.time()
+        if region_cache is not None:
+            region_ttl = self.get_option("region_cache_ttl") or 0
+            broker_ttl = self.get_option("broker_cache_ttl") or 0
+            previous = dict(region_cache)
+            region_cache.clear()
+
+        # Regions are listed by one pool while the brokers of every region are
+        # described by a second, shared, pool.  Using separate pools means a
+        # region waiting on its brokers can't starve the describe calls.
+        with ThreadPoolExecutor(max_workers=max_concurrency) as detail_executor:
+
+            def _list_region(client):
+                connection, region = client
+                if region_cache is None:
+                    paginator = connection.get_paginator("list_brokers")
+                    return self._get_broker_hosts(connection, strict, detail_executor)(
+                        paginator.paginate().build_full_result
+                    )
+
+                entry = previous.get(region)
+                if entry and now - entry["listed"] < region_ttl:
+                    region_cache[region] = entry
+                    return [broker["host"] for broker in entry["brokers"].values()]
+
+                cached = {}
+                if entry:
+                    cached = {
+                        broker_id: broker
+                        for broker_id, broker in entry["brokers"].items()
+                        if now - broker["described"] < broker_ttl
+                    }
+                paginator = connection.get_paginator("list_brokers")
+                hosts = self._get_broker_hosts(connection, strict, detail_executor, cached)(
+                    paginator.paginate().build_full_result
+                )
+                brokers = {}
+                for host in hosts:
+                    reused = cached.get(host["BrokerId"])
+                    brokers[host["BrokerId"]] = {
+                        "fingerprint": _get_broker_fingerprint(host),
+                        "described": reused["described"] if reused and reused["host"] is host else now,
+                        "host": host,
+                    }
+                region_cache[region] = {"listed": now, "brokers": brokers}
+                return hosts
+
+            with ThreadPoolExecutor(max_workers=min(max_concurrency, len(clients) or 1)) as region_executor:
+                # map() returns the results in the order of the regions, so
+                # that brokers sharing a name are always ordered the same way.
+                all_instances = [host for hosts in region_executor.map(_list_region, clients) for host in hosts]
 
-        for connection, _region in self.all_clients("mq"):
-            paginator = connection.get_paginator("list_brokers")
-            all_instances.extend(self._get_broker_hosts(connection, strict)(paginator.paginate().build_full_result))
         sorted_hosts = list(sorted(all_instances, key=lambda x: x["BrokerName"]))
         return _find_hosts_matching_statuses(sorted_hosts, statuses)
 
@@ -285,6 +425,10 @@ class InventoryModule(AWSInventoryBase):
         strict_permissions = self.get_option("strict_permissions")
         statuses = self.get_option("statuses")
 
+        if self.get_option("cache") and self.get_option("region_cache_ttl") is not None:
+            self._parse_with_region_cache(path, cache, regions, strict_permissions, statuses)
+            return
+
         result_was_cached, results = self.get_cached_result(path, cache)
         if result_was_cached:
             self._populate_from_cache(results)
@@ -295,3 +439,22 @@ class InventoryModule(AWSInventoryBase):
 
         formatted_inventory = self._format_inventory(results)
         self.update_cached_result(path, cache, formatted_inventory)
+
+    def _parse_with_region_cache(self, path, cache, regions, strict, statuses):
+        """
+        Refresh the inventory incrementally, the brokers are cached per region and
+        only the regions and brokers whose cache entries are stale are queried.
+        """
+        cache_key = f"{self.get_cache_key(path)}_regions"
+        region_cache = {}
+        # false when refresh_cache or --flush-cache is used
+        if cache:
+            try:
+                region_cache = self._cache[cache_key]
+            except KeyError:
+                # if cache expires or cache file doesn't exist
+                pass
+
+        results = self._get_all_hosts(regions, strict, statuses, region_cache)
+        self._populate(results)
+        self._cache[cache_key] = region_cache
@@ -9,6 +9,8 @@
 # sense for it to start life in community.aws.
 #
 
+import random
+import time
 from copy import deepcopy
 from functools import wraps
 
@@ -21,6 +23,17 @@ from ansible.module_utils.common.dict_transformations import camel_dict_to_snake
 
 from ansible_collections.amazon.aws.plugins.module_utils.tagging import boto3_tag_list_to_ansible_dict
 
+# Temporary AWS failures, the waiters retry on these rather than failing
+RATELIMIT_ERRORS = (
+    "RequestLimitExceeded",
+    "Unavailable",
+    "ServiceUnavailable",
+    "InternalFailure",
+    "InternalError",
+    "TooManyRequestsException",
+    "Throttling",
+)
+
 
 class BaseWaiterFactory:
     """
@@ -34,6 +47,11 @@ class BaseWaiterFactory:
     - override _BaseWaiterFactory._waiter_model_data to return the data defining
       the waiter
 
+    The waiter model is only compiled once per subclass and then shared by all
+    of its instances, _waiter_model_data must therefore not depend on the
+    instance.  The waiters are cached by the factory, and as such are only
+    created once for the factory's client.
+
     Usage:
     waiter_factory = BaseWaiterFactory(module, client)
     waiter = waiters.get_waiter('my_waiter_name')
@@ -42,17 +60,28 @@ class BaseWaiterFactory:
 
     module = None
     client = None
+    # Compiled waiter models, shared by all the instances of a subclass
+    _waiter_models = {}
 
     def __init__(self, module, client):
         self.module = module
         self.client = client
-        # While it would be nice to supliment this with the upstream data,
-        # unfortunately client doesn't have a public method for getting the
-        # waiter configs.
-        data = self._inject_ratelimit_retries(self._waiter_model_data)
-        self._model = botocore.waiter.WaiterModel(
-            waiter_config=dict(version=2, waiters=data),
-        )
+        self._waiters = {}
+        self._model = self._compiled_waiter_model()
+
+    def _compiled_waiter_model(self):
+        cls = type(self)
+        model = BaseWaiterFactory._waiter_models.get(cls)
+        if model is None:
+            # While it would be nice to supliment this with the upstream data,
+            # unfortunately client doesn't have a public method for getting the
+            # waiter configs.
+            data = self._inject_ratelimit_retries(self._waiter_model_data)
+            model = botocore.waiter.WaiterModel(
+                waiter_config=dict(version=2, waiters=data),
+            )
+            BaseWaiterFactory._waiter_models[cls] = model
+        return model
 
     @property
     def _waiter_model_data(self):
@@ -113,35 +142,154 @@ class BaseWaiterFactory:
         return dict()
 
     def _inject_ratelimit_retries(self, model):
-        extra_retries = [
-            "RequestLimitExceeded",
-            "Unavailable",
-            "ServiceUnavailable",
-            "InternalFailure",
-            "InternalError",
-            "TooManyRequestsException",
-            "Throttling",
-        ]
-
-        acceptors = []
-        for error in extra_retries:
-            acceptors.append(dict(state="retry", matcher="error", expected=error))
-
-        _model = deepcopy(model)
-        for waiter in _model:
-            _model[waiter]["acceptors"].extend(acceptors)
-
-        return _model
+        acceptors = [dict(state="retry", matcher="error", expected=error) for error in RATELIMIT_ERRORS]
+
+        # Only the list of acceptors is extended, there's no need to copy the
+        # rest of the definitions
+        return dict((name, dict(waiter, acceptors=waiter["acceptors"] + acceptors)) for name, waiter in model.items())
 
     def get_waiter(self, waiter_name):
+        waiter = self._waiters.get(waiter_name)
+        if waiter is not None:
+            return waiter
         waiters = self._model.waiter_names
         if waiter_name not in waiters:
             self.module.fail_json(f"Unable to find waiter {waiter_name}.  Available_waiters: {waiters}")
-        return botocore.waiter.create_waiter_with_client(
+        waiter = botocore.waiter.create_waiter_with_client(
             waiter_name,
             self._model,
             self.client,
         )
+        self._waiters[waiter_name] = waiter
+        return waiter
+
+
+class MultiResourceWaiter:
+    r"""
+    Waits for a set of resources to reach a desired state.
+
+    Rather than polling each resource with its own waiter, the resources which
+    haven't converged yet are described together in batches.  Polls start
+    quickly and the delay between them grows with each poll (up to max_delay),
+    a random jitter is applied so that parallel waits don't poll in lockstep.
+
+    Parameters:
+      describe (callable): Called with a list of at most batch_size ids,
+                           returns a dictionary mapping ids to the description
+                           of the resources.  Resources which don't exist
+                           should be left out.
+      status (callable): Called with the description of a resource (None if
+                         describe didn't return it), returns 'success', 'retry'
+                         or 'failure'.
+      name (string): The name used in the WaiterError raised when a resource
+                     fails or the wait times out.
+      timeout (int): The maximum number of seconds to wait.
+      delay (float): The delay in seconds before the second poll.
+      max_delay (float): The maximum delay in seconds between polls.
+      backoff (float): The factor by which the delay grows after each poll.
+      jitter (float): The fraction of each delay which is randomized.
+      batch_size (int): The maximum number of ids passed to describe, must be
+                        at least 1.
+
+    After a wait, metrics contains:
+      elapsed (float): The seconds spent waiting.
+      sleeping (float): The seconds spent sleeping between polls.
+      polls (int): The number of polls.
+      describe_calls (int): The number of calls to describe.
+      converged (dict): The seconds it took each resource to converge.
+
+    Usage:
+      waiter = MultiResourceWaiter(describe_attachments, attachment_status, timeout=600)
+      attachments = waiter.wait(attachment_ids)
+    """
+
+    def __init__(
+        self,
+        describe,
+        status,
+        name="resources",
+        timeout=600,
+        delay=1,
+        max_delay=15,
+        backoff=1.5,
+        jitter=0.25,
+        batch_size=100,
+    ):
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+        self.describe = describe
+        self.status = status
+        self.name = name
+        self.timeout = timeout
+        self.delay = delay
+        self.max_delay = max_delay
+        self.backoff = backoff
+        self.jitter = jitter
+        self.batch_size = batch_size
+        self.metrics = dict()
+
+    def _next_delay(self, poll):
+        delay = min(self.max_delay, self.delay * (self.backoff**poll))
+        return delay * (1 - self.jitter * random.random())
+
+    def _describe(self, ids):
+        resources = dict()
+        for start in range(0, len(ids), self.batch_size):
+            resources.update(self.describe(ids[start:start + self.batch_size]) or {})  # fmt:skip
+            self.metrics["describe_calls"] += 1
+        return resources
+
+    def wait(self, ids):
+        r"""
+        Waits for the resources with the given ids, returns a dictionary mapping
+        the ids to the last description of the resources.  Raises
+        botocore.exceptions.WaiterError if a resource fails or if the resources
+        haven't all converged before the timeout.
+        """
+        started = time.monotonic()
+        deadline = started + self.timeout
+        self.metrics = dict(elapsed=0.0, sleeping=0.0, polls=0, describe_calls=0, converged=dict())
+        results = dict()
+        pending = list(dict.fromkeys(ids))
+
+        while pending:
+            resources = self._describe(pending)
+            self.metrics["polls"] += 1
+            now = time.monotonic()
+            still_pending = []
+            for resource_id in pending:
+                resource = resources.get(resource_id)
+                results[resource_id] = resource
+                state = self.status(resource)
+                if state == "success":
+                    self.metrics["converged"][resource_id] = now - started
+                elif state == "failure":
+                    self.metrics["elapsed"] = now - started
+                    raise botocore.exceptions.WaiterError(
+                        name=self.name,
+                        reason=f"{resource_id} reached a terminal failure state",
+                        last_response=results,
+                    )
+                else:
+                    still_pending.append(resource_id)
+            pending = still_pending
+            if not pending:
+                break
+
+            remaining = deadline - now
+            if remaining <= 0:
+                self.metrics["elapsed"] = now - started
+                raise botocore.exceptions.WaiterError(
+                    name=self.name,
+                    reason=f"timed out after {self.timeout} seconds waiting for {', '.join(str(i) for i in pending)}",
+                    last_response=results,
+                )
+            delay = min(remaining, self._next_delay(self.metrics["polls"] - 1))
+            time.sleep(delay)
+            self.metrics["sleeping"] += delay
+
+        self.metrics["elapsed"] = time.monotonic() - started
+        return results
 
 
 class Boto3Mixin:
@@ -237,6 +385,7 @@ class BaseResourceManager(Boto3Mixin):
         self._preupdate_resource = dict()
         self._wait = True
         self._wait_timeout = None
+        self.wait_metrics = dict()
         super(BaseResourceManager, self).__init__()
 
     def _merge_resource_changes(self, filter_immutable=True, creation=False):
@@ -264,16 +413,35 @@ class BaseResourceManager(Boto3Mixin):
     def _do_update_wait(self, **params):
         pass
 
+    # The delay (in seconds) between polls of the botocore waiters
+    _wait_delay = 5
+
     @property
     def _waiter_config(self):
         params = dict()
         if self._wait_timeout:
-            delay = min(5, self._wait_timeout)
+            delay = min(self._wait_delay, self._wait_timeout)
             max_attempts = self._wait_timeout // delay
             config = dict(Delay=delay, MaxAttempts=max_attempts)
             params["WaiterConfig"] = config
         return params
 
+    def _wait_for_resources(self, ids, describe, status, **params):
+        r"""
+        Waits for several resources at once with a MultiResourceWaiter, see
+        MultiResourceWaiter for the parameters.  The timings of the wait are
+        stored in self.wait_metrics.
+        """
+        if not self._wait:
+            return None
+        if self._wait_timeout:
+            params.setdefault("timeout", self._wait_timeout)
+        waiter = MultiResourceWaiter(describe, status, **params)
+        try:
+            return waiter.wait(ids)
+        finally:
+            self.wait_metrics = waiter.metrics
+
     def _wait_for_deletion(self):
         if not self._wait:
             return
@@ -308,7 +476,6 @@ class BaseResourceManager(Boto3Mixin):
         if not self.module.check_mode:
             changed = self._do_create_resource()
             self._wait_for_creation()
-            self._do_creation_wait()
             self.updated_resource = self.get_resource()
         else:  # (CHECK MODE)
             self.updated_resource = self._normalize_resource(self._generate_updated_resource())
@@ -21,6 +21,11 @@
 # along with calculate_multipart_etag.  If not, see <http://www.gnu.org/licenses/>.
 
 import hashlib
+import mmap
+import os
+import re
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     from boto3.s3.transfer import TransferConfig
@@ -30,8 +35,94 @@ except ImportError:
     DEFAULT_CHUNK_SIZE = 5 * 1024 * 1024
     pass  # Handled by AnsibleAWSModule
 
+MIB = 1024 * 1024
+# hashlib releases the GIL while hashing, so parts can be hashed in parallel
+DEFAULT_MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+# The number of files mapped at once by calculate_multipart_etags()
+BATCH_WINDOW = 64
 
-def calculate_multipart_etag(source_path, chunk_size=DEFAULT_CHUNK_SIZE):
+# boto3 and the AWS CLI default to 8 MiB, 5 MiB is the smallest part S3 allows
+# and s3cmd uses 15 MiB
+COMMON_PART_SIZES = [size * MIB for size in (8, 16, 5, 15, 32, 64, 100, 128)]
+
+MULTIPART_ETAG = re.compile(r'^"?[0-9a-fA-F]{32}-(\d+)"?$')
+
+
+def _md5(data):
+    md5 = hashlib.new("md5", usedforsecurity=False)
+    md5.update(data)
+    return md5.digest()
+
+
+def _etag(digests):
+    if len(digests) == 1:
+        return f'"{digests[0].hex()}"'
+    return f'"{hashlib.new("md5", b"".join(digests), usedforsecurity=False).hexdigest()}-{len(digests)}"'
+
+
+def remote_part_count(etag):
+    """
+    Returns the number of parts encoded in an S3 ETag, 1 for single part uploads
+    or None if the ETag isn't an MD5 based ETag.
+    """
+    match = MULTIPART_ETAG.match(etag or "")
+    if match:
+        return int(match.group(1))
+    if re.match(r'^"?[0-9a-fA-F]{32}"?$', etag or ""):
+        return 1
+    return None
+
+
+def infer_chunk_size(size, etag=None, part_count=None, default=DEFAULT_CHUNK_SIZE):
+    """
+    Infers the part size used to upload an object of size bytes, from its ETag or
+    the number of parts.
+
+    Any part size between size / parts and size / (parts - 1) results in the same
+    number of parts, so the part sizes used by the common S3 clients are tried
+    first, then powers of two and whole numbers of MiB, falling back to
+    size / parts.
+    """
+    if part_count is None:
+        part_count = remote_part_count(etag)
+    if not part_count:
+        return default
+    if part_count == 1:
+        return max(size, 1)
+
+    lower = -(-size // part_count)
+    upper = size // (part_count - 1)
+    if size % (part_count - 1) == 0:
+        upper -= 1
+
+    for candidate in COMMON_PART_SIZES:
+        if lower <= candidate <= upper:
+            return candidate
+    candidate = 1 << (lower - 1).bit_length()
+    if candidate <= upper and candidate % MIB == 0:
+        return candidate
+    candidate = -(-lower // MIB) * MIB
+    if candidate <= upper:
+        return candidate
+    return lower
+
+
+def _hash_parts(executor, source_path, chunk_size):
+    """
+    Maps source_path and submits its parts to executor, returns the futures.
+
+    The parts are memoryview slices of the mapping rather than copies, the
+    mapping is unmapped once the last of them has been hashed and released.
+    """
+    with open(source_path, "rb") as fp:
+        size = os.fstat(fp.fileno()).st_size
+        if not size:
+            return [executor.submit(_md5, b"")]
+        view = memoryview(mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ))
+    return [executor.submit(_md5, view[offset:offset + chunk_size]) for offset in range(0, size, chunk_size)]  # fmt:skip
+
+
+def calculate_multipart_etag(source_path, chunk_size=DEFAULT_CHUNK_SIZE, remote_etag=None, max_workers=None):
     """
     calculates a multipart upload etag for amazon s3
 
@@ -39,26 +130,103 @@ def calculate_multipart_etag(source_path, chunk_size=DEFAULT_CHUNK_SIZE):
 
     source_path -- The file to calculate the etag for
     chunk_size -- The chunk size to calculate for.
+    remote_etag -- The ETag of the remote object, when set the chunk size is inferred
+                   from the number of parts it was uploaded in.
+    max_workers -- The maximum number of threads used to hash the parts.
     """
 
-    md5s = []
+    return calculate_multipart_etags([(source_path, chunk_size, remote_etag)], max_workers=max_workers)[0]
 
-    with open(source_path, "rb") as fp:
-        while True:
-            data = fp.read(chunk_size)
 
-            if not data:
-                break
-            md5 = hashlib.new("md5", usedforsecurity=False)
-            md5.update(data)
-            md5s.append(md5)
+def calculate_multipart_etags(sources, max_workers=None, cache=None):
+    """
+    calculates the multipart upload etags of many files, hashing the parts of
+    all the files in a single pool of threads.
+
+    Arguments:
+
+    sources -- An iterable of (source_path, chunk_size, remote_etag) tuples,
+               remote_etag may be None (see calculate_multipart_etag).
+    max_workers -- The maximum number of threads used to hash the parts.
+    cache -- An optional EtagCache, only files missing from the cache are read.
+
+    Returns the etags in the order of sources.
+    """
+
+    jobs = []
+    for source_path, chunk_size, remote_etag in sources:
+        fstat = os.stat(source_path)
+        if remote_etag:
+            chunk_size = infer_chunk_size(fstat.st_size, remote_etag, default=chunk_size)
+        etag = cache.get(source_path, fstat, chunk_size) if cache else None
+        jobs.append([source_path, chunk_size, fstat, etag])
+
+    pending = [job for job in jobs if job[3] is None]
+    with ThreadPoolExecutor(max_workers=max_workers or DEFAULT_MAX_WORKERS) as executor:
+        for start in range(0, len(pending), BATCH_WINDOW):
+            window = pending[start:start + BATCH_WINDOW]  # fmt:skip
+            futures = [_hash_parts(executor, job[0], job[1]) for job in window]
+            for job, parts in zip(window, futures):
+                job[3] = _etag([part.result() for part in parts])
+                if cache:
+                    cache.set(job[0], job[2], job[1], job[3])
 
-    if len(md5s) == 1:
-        new_etag = f'"{md5s[0].hexdigest()}"'
-    else:  # > 1
-        digests = b"".join(m.digest() for m in md5s)
+    return [job[3] for job in jobs]
+
+
+class EtagCache:
+    """
+    Persistent cache of calculated multipart etags.
 
-        new_md5 = hashlib.md5(digests)
-        new_etag = f'"{new_md5.hexdigest()}-{len(md5s)}"'
+    Entries are keyed by the path and the chunk size, and are only returned
+    while the file's inode, size and modification time (in nanoseconds) still
+    match those recorded when the etag was calculated.
+    """
+
+    def __init__(self, cache_path):
+        cache_dir = os.path.dirname(cache_path)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        self._db = sqlite3.connect(cache_path)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS etags ("
+            " path TEXT NOT NULL,"
+            " chunk_size INTEGER NOT NULL,"
+            " inode INTEGER NOT NULL,"
+            " mtime_ns INTEGER NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " etag TEXT NOT NULL,"
+            " PRIMARY KEY (path, chunk_size))"
+        )
+
+    def get(self, path, fstat, chunk_size):
+        row = self._db.execute(
+            "SELECT etag FROM etags WHERE path = ? AND chunk_size = ? AND inode = ? AND mtime_ns = ? AND size = ?",
+            (os.path.abspath(path), chunk_size, fstat.st_ino, fstat.st_mtime_ns, fstat.st_size),
+        ).fetchone()
+        return row[0] if row else None
+
+    def set(self, path, fstat, chunk_size, etag):
+        self._db.execute(
+            "INSERT OR REPLACE INTO etags (path, chunk_size, inode, mtime_ns, size, etag) VALUES (?, ?, ?, ?, ?, ?)",
+            (os.path.abspath(path), chunk_size, fstat.st_ino, fstat.st_mtime_ns, fstat.st_size, etag),
+        )
+
+    def close(self):
+        self._db.commit()
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def cached_multipart_etag(source_path, chunk_size=DEFAULT_CHUNK_SIZE, cache=None, remote_etag=None):
+    """
+    calculates a multipart upload etag for amazon s3, re-using the value
+    stored in cache (an EtagCache) if the file hasn't changed since.
+    """
 
-    return new_etag
+    return calculate_multipart_etags([(source_path, chunk_size, remote_etag)], cache=cache)[0]
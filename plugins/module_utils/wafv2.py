@@ -3,6 +3,9 @@
 # Copyright: Contributors to the Ansible project
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 
+import hashlib
+import json
+
 try:
     from botocore.exceptions import BotoCoreError
     from botocore.exceptions import ClientError
@@ -31,12 +34,12 @@ def describe_wafv2_tags(wafv2, arn, fail_json_aws):
     tag_list = []
     # there is currently no paginator for wafv2
     while True:
-        responce = _list_tags(wafv2, arn, fail_json_aws)
-        next_marker = responce.get("NextMarker", None)
+        responce = _list_tags(wafv2, arn, fail_json_aws, next_marker=next_marker)
         tag_info = responce.get("TagInfoForResource", {})
         tag_list.extend(tag_info.get("TagList", []))
-        if not next_marker:
+        if not responce.get("NextMarker") or responce.get("NextMarker") == next_marker:
             break
+        next_marker = responce.get("NextMarker")
     return boto3_tag_list_to_ansible_dict(tag_list)
 
 
@@ -67,40 +70,87 @@ def ensure_wafv2_tags(wafv2, arn, tags, purge_tags, fail_json_aws, check_mode):
     return True
 
 
-def wafv2_list_web_acls(wafv2, scope, fail_json_aws, nextmarker=None):
+# The list call, the key of the items in its result and the error message for each type of WAFv2 object
+WAFV2_LIST_OPERATIONS = {
+    "web_acl": ("list_web_acls", "WebACLs", "Failed to list wafv2 web acl"),
+    "rule_group": ("list_rule_groups", "RuleGroups", "Failed to list wafv2 rule group"),
+    "ip_set": ("list_ip_sets", "IPSets", "Failed to list wafv2 ip set"),
+}
+
+
+def wafv2_paginate(wafv2, kind, scope, fail_json_aws, next_marker=None):
+    """
+    Yields the WAFv2 objects of one kind (see WAFV2_LIST_OPERATIONS) in a scope, the pages are only fetched as needed.
+
+    Stop iterating to stop listing, for example once the object you're looking for has been found.
+    """
+    operation, result_key, error = WAFV2_LIST_OPERATIONS[kind]
+    list_method = getattr(wafv2, operation)
     # there is currently no paginator for wafv2
     req_obj = {"Scope": scope, "Limit": 100}
-    if nextmarker:
-        req_obj["NextMarker"] = nextmarker
+    if next_marker:
+        req_obj["NextMarker"] = next_marker
+    while True:
+        try:
+            response = list_method(**req_obj)
+        except (BotoCoreError, ClientError) as e:
+            fail_json_aws(e, msg=error)
+        items = response.get(result_key, [])
+        yield from items
+        # WAFv2 may return a marker along with the last (empty) page
+        next_marker = response.get("NextMarker")
+        if not next_marker or not items or next_marker == req_obj.get("NextMarker"):
+            return
+        req_obj["NextMarker"] = next_marker
 
-    try:
-        response = wafv2.list_web_acls(**req_obj)
-    except (BotoCoreError, ClientError) as e:
-        fail_json_aws(e, msg="Failed to list wafv2 web acl")
 
-    if response.get("NextMarker"):
-        response["WebACLs"] += wafv2_list_web_acls(
-            wafv2, scope, fail_json_aws, nextmarker=response.get("NextMarker")
-        ).get("WebACLs")
-    return response
+class Wafv2NameIndex:
+    """
+    Finds WAFv2 objects of one kind by name.
 
+    Each scope is listed at most once and only until the requested name is found, the objects
+    seen on the way are indexed so that later lookups don't need to list them again.  The index
+    lives as long as the object, call invalidate() after creating or deleting an object.
+    """
 
-def wafv2_list_rule_groups(wafv2, scope, fail_json_aws, nextmarker=None):
-    # there is currently no paginator for wafv2
-    req_obj = {"Scope": scope, "Limit": 100}
-    if nextmarker:
-        req_obj["NextMarker"] = nextmarker
+    def __init__(self, wafv2, kind, fail_json_aws):
+        self.wafv2 = wafv2
+        self.kind = kind
+        self.fail_json_aws = fail_json_aws
+        self._index = {}
+        self._listings = {}
+
+    def lookup(self, scope, name):
+        """Returns a (id, arn, locktoken) tuple, or (None, None, None) when there's no object with that name"""
+        index = self._index.setdefault(scope, {})
+        if name in index:
+            return index[name]
+
+        listing = self._listings.get(scope)
+        if listing is None:
+            listing = self._listings[scope] = wafv2_paginate(self.wafv2, self.kind, scope, self.fail_json_aws)
+        for item in listing:
+            index[item.get("Name")] = (item.get("Id"), item.get("ARN"), item.get("LockToken"))
+            if item.get("Name") == name:
+                return index[name]
+        # The scope has been completely listed, keep the exhausted generator around
+        return (None, None, None)
+
+    def invalidate(self, scope=None):
+        if scope is None:
+            self._index.clear()
+            self._listings.clear()
+        else:
+            self._index.pop(scope, None)
+            self._listings.pop(scope, None)
 
-    try:
-        response = wafv2.list_rule_groups(**req_obj)
-    except (BotoCoreError, ClientError) as e:
-        fail_json_aws(e, msg="Failed to list wafv2 rule group")
 
-    if response.get("NextMarker"):
-        response["RuleGroups"] += wafv2_list_rule_groups(
-            wafv2, scope, fail_json_aws, nextmarker=response.get("NextMarker")
-        ).get("RuleGroups")
-    return response
+def wafv2_list_web_acls(wafv2, scope, fail_json_aws, nextmarker=None):
+    return {"WebACLs": list(wafv2_paginate(wafv2, "web_acl", scope, fail_json_aws, nextmarker))}
+
+
+def wafv2_list_rule_groups(wafv2, scope, fail_json_aws, nextmarker=None):
+    return {"RuleGroups": list(wafv2_paginate(wafv2, "rule_group", scope, fail_json_aws, nextmarker))}
 
 
 def wafv2_snake_dict_to_camel_dict(a):
@@ -129,86 +179,72 @@ def wafv2_snake_dict_to_camel_dict(a):
     return retval
 
 
-def nested_byte_values_to_strings(rule, keyname):
+def byte_values_to_strings(value):
     """
-    currently valid nested byte values in statements array are
-        - OrStatement
-        - AndStatement
-        - NotStatement
+    Returns a copy of a rule (or of any part of it) with the byte values, such as the SearchString
+    of the ByteMatchStatements boto3 returns, decoded to strings, however deeply they're nested.
     """
-    if rule.get("Statement", {}).get(keyname):
-        for idx in range(len(rule.get("Statement", {}).get(keyname, {}).get("Statements"))):
-            if rule["Statement"][keyname]["Statements"][idx].get("ByteMatchStatement"):
-                rule["Statement"][keyname]["Statements"][idx]["ByteMatchStatement"]["SearchString"] = (
-                    rule.get("Statement")
-                    .get(keyname)
-                    .get("Statements")[idx]
-                    .get("ByteMatchStatement")
-                    .get("SearchString")
-                    .decode("utf-8")
-                )
-
-    return rule
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    if isinstance(value, dict):
+        return dict((k, byte_values_to_strings(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return [byte_values_to_strings(v) for v in value]
+    return value
 
 
 def byte_values_to_strings_before_compare(rules):
-    for idx in range(len(rules)):
-        if rules[idx].get("Statement", {}).get("ByteMatchStatement", {}).get("SearchString"):
-            rules[idx]["Statement"]["ByteMatchStatement"]["SearchString"] = (
-                rules[idx].get("Statement").get("ByteMatchStatement").get("SearchString").decode("utf-8")
-            )
+    return [byte_values_to_strings(rule) for rule in rules]
 
-        else:
-            for statement in ["AndStatement", "OrStatement", "NotStatement"]:
-                if rules[idx].get("Statement", {}).get(statement):
-                    rules[idx] = nested_byte_values_to_strings(rules[idx], statement)
 
-    return rules
+def _fingerprint_default(value):
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    return str(value)
+
+
+def rule_fingerprint(rule):
+    """
+    Returns a stable hash of a rule, two rules have the same fingerprint when they compare equal
+    once their byte values have been decoded.
+    """
+    normalized = json.dumps(rule, sort_keys=True, separators=(",", ":"), default=_fingerprint_default)
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
 
 
 def compare_priority_rules(existing_rules, requested_rules, purge_rules, state):
-    diff = False
-    existing_rules = sorted(existing_rules, key=lambda k: k["Priority"])
-    existing_rules = byte_values_to_strings_before_compare(existing_rules)
+    """
+    Merges the requested rules into the existing ones, rules are matched on their priority.
+
+    When state is present the requested rules replace the existing rules with the same priority
+    (or all the existing rules if purge_rules is set), when state is absent the existing rules
+    identical to a requested rule are removed.  Returns whether the rules changed and the merged
+    rules.
+    """
+    existing_rules = byte_values_to_strings_before_compare(sorted(existing_rules, key=lambda k: k["Priority"]))
     requested_rules = sorted(requested_rules, key=lambda k: k["Priority"])
 
-    if purge_rules and state == "present":
-        merged_rules = requested_rules
-        if len(existing_rules) == len(requested_rules):
-            for idx in range(len(existing_rules)):
-                if existing_rules[idx] != requested_rules[idx]:
-                    diff = True
-                    break
-        else:
-            diff = True
+    existing_fingerprints = [rule_fingerprint(rule) for rule in existing_rules]
+    requested_fingerprints = [rule_fingerprint(rule) for rule in requested_rules]
+    existing = dict((rule.get("Priority"), fp) for rule, fp in zip(existing_rules, existing_fingerprints))
+    requested = dict((rule.get("Priority"), fp) for rule, fp in zip(requested_rules, requested_fingerprints))
 
-    else:
-        # find same priority rules
-        #   * pop same priority rule from existing rule
-        #   * compare existing rule
-        merged_rules = []
-        ex_idx_pop = []
-        for existing_idx in range(len(existing_rules)):
-            for requested_idx in range(len(requested_rules)):
-                if existing_rules[existing_idx].get("Priority") == requested_rules[requested_idx].get("Priority"):
-                    if state == "present":
-                        ex_idx_pop.append(existing_idx)
-                        if existing_rules[existing_idx] != requested_rules[requested_idx]:
-                            diff = True
-                    elif existing_rules[existing_idx] == requested_rules[requested_idx]:
-                        ex_idx_pop.append(existing_idx)
-                        diff = True
-
-        prev_count = len(existing_rules)
-        for idx in ex_idx_pop:
-            existing_rules.pop(idx)
-
-        if state == "present":
-            merged_rules = existing_rules + requested_rules
-
-            if len(merged_rules) != prev_count:
-                diff = True
+    if state == "present":
+        if purge_rules:
+            merged_rules = requested_rules
+            diff = existing_fingerprints != requested_fingerprints
         else:
-            merged_rules = existing_rules
+            # the requested rules replace the existing rules with the same priority
+            kept_rules = [rule for rule in existing_rules if rule.get("Priority") not in requested]
+            merged_rules = kept_rules + requested_rules
+            diff = len(merged_rules) != len(existing_rules) or any(
+                existing.get(priority) != fp for priority, fp in requested.items()
+            )
+    else:
+        # only remove the existing rules which are identical to a requested rule
+        merged_rules = [
+            rule for rule, fp in zip(existing_rules, existing_fingerprints) if requested.get(rule.get("Priority")) != fp
+        ]
+        diff = len(merged_rules) != len(existing_rules)
 
     return diff, merged_rules
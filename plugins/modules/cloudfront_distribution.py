@@ -623,6 +623,25 @@ options:
       default: 1800
       type: int
 
+    lookup_cache_ttl:
+      description:
+        - Finding a distribution from its I(caller_reference) or I(alias) requires searching every distribution.
+        - When set to a positive number of seconds, the distribution found is remembered in a file on the host
+          running the module, and the following tasks for the same I(caller_reference) or I(alias) check that
+          distribution first.
+        - The remembered distribution is always checked, a stale entry only causes a new search.
+        - Set to C(0) to disable.
+      default: 0
+      type: int
+      version_added: 9.0.0
+
+    lookup_cache_path:
+      description:
+        - The file in which the distributions found are remembered when I(lookup_cache_ttl) is set.
+      default: ~/.ansible/tmp/community.aws.cloudfront_distribution.json
+      type: path
+      version_added: 9.0.0
+
 extends_documentation_fragment:
   - amazon.aws.common.modules
   - amazon.aws.region.modules
@@ -1450,8 +1469,14 @@ web_acl_id:
 """
 
 import datetime
+import json
+import os
 import re
+import tempfile
+import time
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 
 try:
     import botocore
@@ -1464,6 +1489,7 @@ from ansible.module_utils.common.dict_transformations import camel_dict_to_snake
 from ansible.module_utils.common.dict_transformations import recursive_diff
 from ansible.module_utils.common.dict_transformations import snake_dict_to_camel_dict
 
+from ansible_collections.amazon.aws.plugins.module_utils.botocore import is_boto3_error_code
 from ansible_collections.amazon.aws.plugins.module_utils.cloudfront_facts import CloudFrontFactsServiceManager
 from ansible_collections.amazon.aws.plugins.module_utils.retries import AWSRetry
 from ansible_collections.amazon.aws.plugins.module_utils.tagging import ansible_dict_to_boto3_tag_list
@@ -1574,6 +1600,62 @@ def update_tags(client, module, existing_tags, valid_tags, purge_tags, arn):
     return changed
 
 
+# The number of distributions described in parallel while searching for a caller reference
+DESCRIBE_WINDOW = 10
+
+
+class DistributionLookupCache(object):
+    """
+    Remembers which distribution was found for a caller reference or an alias, so that the
+    following tasks of a play don't need to search every distribution again.
+
+    The entries are only hints, callers must check that the distribution still matches.
+    The cache is best effort, any problem reading or writing the file is ignored.
+    """
+
+    def __init__(self, path, ttl):
+        self.path = os.path.expanduser(path) if path else None
+        self.ttl = ttl or 0
+
+    def _load(self):
+        try:
+            with open(self.path) as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def _save(self, entries):
+        # Replace the file atomically, other forks may be reading it
+        try:
+            directory = os.path.dirname(self.path)
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".cloudfront_distribution")
+            with os.fdopen(fd, "w") as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
+
+    def get(self, kind, key):
+        if self.ttl <= 0 or not self.path:
+            return None
+        entry = self._load().get(f"{kind}:{key}")
+        if not isinstance(entry, dict) or time.time() - entry.get("time", 0) > self.ttl:
+            return None
+        return entry.get("id")
+
+    def set(self, kind, key, distribution_id):
+        if self.ttl <= 0 or not self.path:
+            return
+        now = time.time()
+        entries = dict(
+            (k, v) for k, v in self._load().items() if isinstance(v, dict) and now - v.get("time", 0) <= self.ttl
+        )
+        entries[f"{kind}:{key}"] = dict(id=distribution_id, time=now)
+        self._save(entries)
+
+
 class CloudFrontValidationManager(object):
     """
     Manages CloudFront validations
@@ -1581,6 +1663,9 @@ class CloudFrontValidationManager(object):
 
     def __init__(self, module):
         self.__cloudfront_facts_mgr = CloudFrontFactsServiceManager(module)
+        self.__lookup_cache = DistributionLookupCache(
+            module.params.get("lookup_cache_path"), module.params.get("lookup_cache_ttl")
+        )
         self.module = module
         self.__default_distribution_enabled = True
         self.__default_http_port = 80
@@ -2325,32 +2410,79 @@ class CloudFrontValidationManager(object):
             attribute_list = " ".join(str(a) for a in allowed_list)
             self.module.fail_json(msg=f"The attribute {attribute_name} must be one of [{attribute_list}]")
 
+    def get_distribution_if_exists(self, distribution_id):
+        try:
+            return self.__cloudfront_facts_mgr.get_distribution(id=distribution_id, fail_if_error=False)
+        except is_boto3_error_code("NoSuchDistribution"):
+            # e.g: the distribution was deleted after we listed it
+            return None
+
+    def get_distribution_if_caller_reference(self, distribution_id, caller_reference):
+        distribution = self.get_distribution_if_exists(distribution_id)
+        if distribution is not None:
+            distribution_config = distribution["Distribution"].get("DistributionConfig")
+            if distribution_config is not None and distribution_config.get("CallerReference") == caller_reference:
+                return distribution
+        return None
+
+    def find_distribution_by_caller_reference(self, distribution_ids, caller_reference):
+        """Describes the distributions DESCRIBE_WINDOW at a time, stopping at the first match"""
+        distribution_ids = iter(distribution_ids)
+        with ThreadPoolExecutor(max_workers=DESCRIBE_WINDOW) as executor:
+            while True:
+                window = list(islice(distribution_ids, DESCRIBE_WINDOW))
+                if not window:
+                    return None
+                for distribution in executor.map(
+                    lambda distribution_id: self.get_distribution_if_caller_reference(
+                        distribution_id, caller_reference
+                    ),
+                    window,
+                ):
+                    if distribution is not None:
+                        return distribution
+
     def validate_distribution_from_caller_reference(self, caller_reference):
         try:
+            distribution_id = self.__lookup_cache.get("caller_reference", caller_reference)
+            if distribution_id:
+                distribution = self.get_distribution_if_caller_reference(distribution_id, caller_reference)
+                if distribution is not None:
+                    return distribution
+
             distributions = self.__cloudfront_facts_mgr.list_distributions(keyed=False)
-            distribution_name = "Distribution"
-            distribution_config_name = "DistributionConfig"
             distribution_ids = [dist.get("Id") for dist in distributions]
-            for distribution_id in distribution_ids:
-                distribution = self.__cloudfront_facts_mgr.get_distribution(id=distribution_id)
-                if distribution is not None:
-                    distribution_config = distribution[distribution_name].get(distribution_config_name)
-                    if (
-                        distribution_config is not None
-                        and distribution_config.get("CallerReference") == caller_reference
-                    ):
-                        distribution[distribution_name][distribution_config_name] = distribution_config
-                        return distribution
+            distribution = self.find_distribution_by_caller_reference(distribution_ids, caller_reference)
+            if distribution is not None:
+                self.__lookup_cache.set("caller_reference", caller_reference, distribution["Distribution"]["Id"])
+            return distribution
 
         except Exception as e:
             self.module.fail_json_aws(e, msg="Error validating distribution from caller reference")
 
+    def validate_distribution_from_cached_alias(self, aliases):
+        """Returns the remembered distribution for one of the aliases, if it still has that alias"""
+        for alias in aliases:
+            distribution_id = self.__lookup_cache.get("alias", alias)
+            if not distribution_id:
+                continue
+            distribution = self.get_distribution_if_exists(distribution_id)
+            if distribution is None:
+                continue
+            distribution_config = distribution["Distribution"].get("DistributionConfig") or {}
+            if alias in distribution_config.get("Aliases", {}).get("Items", []):
+                return distribution
+        return None
+
     def validate_distribution_from_aliases_caller_reference(self, distribution_id, aliases, caller_reference):
         try:
             if caller_reference is not None:
                 return self.validate_distribution_from_caller_reference(caller_reference)
             else:
                 if aliases and distribution_id is None:
+                    distribution = self.validate_distribution_from_cached_alias(aliases)
+                    if distribution is not None:
+                        return distribution
                     distribution_id = self.validate_distribution_id_from_alias(aliases)
                 if distribution_id:
                     return self.__cloudfront_facts_mgr.get_distribution(id=distribution_id)
@@ -2362,12 +2494,19 @@ class CloudFrontValidationManager(object):
 
     def validate_distribution_id_from_alias(self, aliases):
         distributions = self.__cloudfront_facts_mgr.list_distributions(keyed=False)
-        if distributions:
-            for distribution in distributions:
-                distribution_aliases = distribution.get("Aliases", {}).get("Items", [])
-                if set(aliases) & set(distribution_aliases):
-                    return distribution["Id"]
-        return None
+        # Index the aliases in a single pass, keeping the first distribution listed for each alias
+        alias_index = {}
+        for position, distribution in enumerate(distributions or []):
+            for distribution_alias in distribution.get("Aliases", {}).get("Items", []):
+                alias_index.setdefault(distribution_alias, (position, distribution["Id"]))
+
+        matches = [(alias_index[alias], alias) for alias in aliases if alias in alias_index]
+        if not matches:
+            return None
+        # The first distribution listed which has any of the aliases
+        (_position, distribution_id), alias = min(matches)
+        self.__lookup_cache.set("alias", alias, distribution_id)
+        return distribution_id
 
     def wait_until_processed(self, client, wait_timeout, distribution_id, caller_reference):
         if distribution_id is None:
@@ -2420,6 +2559,8 @@ def main():
         default_origin_path=dict(),
         wait=dict(default=False, type="bool"),
         wait_timeout=dict(default=1800, type="int"),
+        lookup_cache_ttl=dict(default=0, type="int"),
+        lookup_cache_path=dict(default="~/.ansible/tmp/community.aws.cloudfront_distribution.json", type="path"),
     )
 
     result = {}
@@ -30,8 +30,26 @@ options:
     cluster:
         description:
             - The cluster ARNS in which to list the services.
+            - Mutually exclusive with I(all_clusters).
         required: false
         type: str
+    all_clusters:
+        description:
+            - List the services of every cluster in the region.
+            - The clusters are listed in parallel.
+            - Mutually exclusive with I(cluster) and I(service).
+        required: false
+        default: false
+        type: bool
+        version_added: 9.0.0
+    max_concurrency:
+        description:
+            - The maximum number of API calls made in parallel.
+            - Services are described 10 at a time.
+        required: false
+        default: 10
+        type: int
+        version_added: 9.0.0
     service:
         description:
             - One or more services to get details for
@@ -59,6 +77,13 @@ EXAMPLES = r"""
 - community.aws.ecs_service_info:
     cluster: test-cluster
   register: output
+
+# Describe the services of every cluster in the region
+- community.aws.ecs_service_info:
+    all_clusters: true
+    details: true
+    events: false
+  register: output
 """
 
 RETURN = r"""
@@ -131,6 +156,9 @@ services:
             elements: dict
 """
 
+import datetime
+from concurrent.futures import ThreadPoolExecutor
+
 try:
     import botocore
 except ImportError:
@@ -141,6 +169,20 @@ from ansible_collections.amazon.aws.plugins.module_utils.retries import AWSRetry
 
 from ansible_collections.community.aws.plugins.module_utils.modules import AnsibleCommunityAWSModule as AnsibleAWSModule
 
+# DescribeServices accepts at most 10 services per call
+DESCRIBE_SERVICES_LIMIT = 10
+
+
+def dates_to_str(items, fields=("createdAt", "updatedAt")):
+    # some fields are datetime which is not JSON serializable, make them
+    # strings.  isoformat(" ") returns what str() does, without going
+    # through __str__ for every value.
+    for item in items:
+        for field in fields:
+            value = item.get(field)
+            if isinstance(value, datetime.datetime):
+                item[field] = value.isoformat(" ")
+
 
 class EcsServiceManager:
     """Handles ECS Services"""
@@ -148,59 +190,98 @@ class EcsServiceManager:
     def __init__(self, module):
         self.module = module
         self.ecs = module.client("ecs")
+        self.max_concurrency = module.params["max_concurrency"]
+
+    @AWSRetry.jittered_backoff(retries=5, delay=5, backoff=2.0)
+    def list_clusters_with_backoff(self):
+        paginator = self.ecs.get_paginator("list_clusters")
+        return paginator.paginate().build_full_result()
 
     @AWSRetry.jittered_backoff(retries=5, delay=5, backoff=2.0)
     def list_services_with_backoff(self, **kwargs):
         paginator = self.ecs.get_paginator("list_services")
-        try:
-            return paginator.paginate(**kwargs).build_full_result()
-        except is_boto3_error_code("ClusterNotFoundException") as e:
-            self.module.fail_json_aws(e, "Could not find cluster to list services")
+        return paginator.paginate(**kwargs).build_full_result()
 
     @AWSRetry.jittered_backoff(retries=5, delay=5, backoff=2.0)
     def describe_services_with_backoff(self, **kwargs):
         return self.ecs.describe_services(**kwargs)
 
+    def list_clusters(self):
+        try:
+            return self.list_clusters_with_backoff()["clusterArns"]
+        except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+            self.module.fail_json_aws(e, msg="Couldn't list ECS clusters")
+
     def list_services(self, cluster):
         fn_args = dict()
         if cluster and cluster is not None:
             fn_args["cluster"] = cluster
         try:
             response = self.list_services_with_backoff(**fn_args)
-        except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+        except is_boto3_error_code("ClusterNotFoundException") as e:
+            self.module.fail_json_aws(e, "Could not find cluster to list services")
+        except (
+            botocore.exceptions.ClientError,
+            botocore.exceptions.BotoCoreError,
+        ) as e:  # pylint: disable=duplicate-except
             self.module.fail_json_aws(e, msg="Couldn't list ECS services")
         relevant_response = dict(services=response["serviceArns"])
         return relevant_response
 
-    def describe_services(self, cluster, services):
+    def _list_cluster_services(self, cluster):
+        try:
+            return self.list_services_with_backoff(cluster=cluster)["serviceArns"]
+        except is_boto3_error_code("ClusterNotFoundException"):
+            # The cluster was deleted after we listed it
+            return []
+
+    def list_clusters_services(self, clusters):
+        """Lists the services of several clusters in parallel, returns a list of (cluster, service ARNs) tuples"""
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            try:
+                return list(zip(clusters, executor.map(self._list_cluster_services, clusters)))
+            except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+                self.module.fail_json_aws(e, msg="Couldn't list ECS services")
+
+    def _describe_services(self, cluster, services):
         fn_args = dict()
         if cluster and cluster is not None:
             fn_args["cluster"] = cluster
         fn_args["services"] = services
-        try:
-            response = self.describe_services_with_backoff(**fn_args)
-        except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
-            self.module.fail_json_aws(e, msg="Couldn't describe ECS services")
-        running_services = [self.extract_service_from(service) for service in response.get("services", [])]
-        services_not_running = response.get("failures", [])
+        return self.describe_services_with_backoff(**fn_args)
+
+    def describe_services(self, clusters_services):
+        """
+        Describes services, clusters_services is a list of (cluster, services) tuples.
+
+        The services are described DESCRIBE_SERVICES_LIMIT at a time, the calls are made in parallel.
+        """
+        calls = [
+            (cluster, chunk)
+            for cluster, services in clusters_services
+            for chunk in chunks(services, DESCRIBE_SERVICES_LIMIT)
+        ]
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            try:
+                responses = list(executor.map(lambda call: self._describe_services(*call), calls))
+            except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+                self.module.fail_json_aws(e, msg="Couldn't describe ECS services")
+
+        running_services = []
+        services_not_running = []
+        for response in responses:
+            running_services.extend(self.extract_service_from(service) for service in response.get("services", []))
+            services_not_running.extend(response.get("failures", []))
         return running_services, services_not_running
 
     def extract_service_from(self, service):
-        # some fields are datetime which is not JSON serializable
-        # make them strings
         if "deployments" in service:
-            for d in service["deployments"]:
-                if "createdAt" in d:
-                    d["createdAt"] = str(d["createdAt"])
-                if "updatedAt" in d:
-                    d["updatedAt"] = str(d["updatedAt"])
+            dates_to_str(service["deployments"])
         if "events" in service:
             if not self.module.params["events"]:
                 del service["events"]
             else:
-                for e in service["events"]:
-                    if "createdAt" in e:
-                        e["createdAt"] = str(e["createdAt"])
+                dates_to_str(service["events"], fields=("createdAt",))
         return service
 
 
@@ -216,26 +297,36 @@ def main():
         details=dict(type="bool", default=False),
         events=dict(type="bool", default=True),
         cluster=dict(),
+        all_clusters=dict(type="bool", default=False),
         service=dict(type="list", elements="str", aliases=["name"]),
+        max_concurrency=dict(type="int", default=10),
     )
 
-    module = AnsibleAWSModule(argument_spec=argument_spec, supports_check_mode=True)
+    module = AnsibleAWSModule(
+        argument_spec=argument_spec,
+        mutually_exclusive=[["cluster", "all_clusters"], ["service", "all_clusters"]],
+        supports_check_mode=True,
+    )
+
+    if module.params["max_concurrency"] < 1:
+        module.fail_json(msg="max_concurrency must be at least 1")
 
     show_details = module.params.get("details")
 
     task_mgr = EcsServiceManager(module)
+    if module.params["all_clusters"]:
+        clusters_services = task_mgr.list_clusters_services(task_mgr.list_clusters())
+    elif show_details and module.params["service"]:
+        clusters_services = [(module.params["cluster"], module.params["service"])]
+    else:
+        cluster = module.params["cluster"]
+        clusters_services = [(cluster, task_mgr.list_services(cluster)["services"])]
+
     if show_details:
-        if module.params["service"]:
-            services = module.params["service"]
-        else:
-            services = task_mgr.list_services(module.params["cluster"])["services"]
-        ecs_info = dict(services=[], services_not_running=[])
-        for chunk in chunks(services, 10):
-            running_services, services_not_running = task_mgr.describe_services(module.params["cluster"], chunk)
-            ecs_info["services"].extend(running_services)
-            ecs_info["services_not_running"].extend(services_not_running)
+        running_services, services_not_running = task_mgr.describe_services(clusters_services)
+        ecs_info = dict(services=running_services, services_not_running=services_not_running)
     else:
-        ecs_info = task_mgr.list_services(module.params["cluster"])
+        ecs_info = dict(services=[arn for _cluster, services in clusters_services for arn in services])
 
     module.exit_json(changed=False, **ecs_info)
 
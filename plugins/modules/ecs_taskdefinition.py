@@ -798,6 +798,9 @@ taskdefinition:
     returned: always
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
 try:
     import botocore
 except ImportError:
@@ -807,6 +810,15 @@ from ansible_collections.amazon.aws.plugins.module_utils.retries import AWSRetry
 
 from ansible_collections.community.aws.plugins.module_utils.modules import AnsibleCommunityAWSModule as AnsibleAWSModule
 
+# The number of task definition revisions described in parallel, and the most
+# we hold in memory at a time while looking for a matching revision
+DESCRIBE_WINDOW = 10
+
+
+def task_definition_revision(arn):
+    """Returns the revision number of a task definition ARN (arn:...:task-definition/family:revision)"""
+    return int(arn.rsplit(":", 1)[1])
+
 
 class EcsTaskManager:
     """Handles ECS Tasks"""
@@ -906,35 +918,36 @@ class EcsTaskManager:
 
         return response["taskDefinition"]
 
-    def describe_task_definitions(self, family):
-        data = {"taskDefinitionArns": [], "nextToken": None}
-
-        def fetch():
-            # Boto3 is weird about params passed, so only pass nextToken if we have a value
-            params = {"familyPrefix": family}
-
-            if data["nextToken"]:
-                params["nextToken"] = data["nextToken"]
-
+    def list_task_definition_arns(self, family):
+        """Yields the ARNs of the active revisions of a family, newest first, one page at a time"""
+        params = {"familyPrefix": family, "sort": "DESC"}
+        while True:
             result = self.ecs.list_task_definitions(aws_retry=True, **params)
-            data["taskDefinitionArns"] += result["taskDefinitionArns"]
-            data["nextToken"] = result.get("nextToken", None)
-            return data["nextToken"] is not None
-
-        # Fetch all the arns, possibly across multiple pages
-        while fetch():
-            pass
-
-        # Return the full descriptions of the task definitions, sorted ascending by revision
-        return list(
-            sorted(
-                [
-                    self.ecs.describe_task_definition(aws_retry=True, taskDefinition=arn)["taskDefinition"]
-                    for arn in data["taskDefinitionArns"]
-                ],
-                key=lambda td: td["revision"],
-            )
-        )
+            yield from result["taskDefinitionArns"]
+            # Boto3 is weird about params passed, so only pass nextToken if we have a value
+            if not result.get("nextToken"):
+                return
+            params["nextToken"] = result["nextToken"]
+
+    def describe_task_definition(self, arn):
+        return self.ecs.describe_task_definition(aws_retry=True, taskDefinition=arn)["taskDefinition"]
+
+    def find_task_definition(self, family, predicate):
+        """
+        Returns the newest active revision of a family for which predicate returns True, or None.
+
+        Revisions are described DESCRIBE_WINDOW at a time and we stop listing
+        as soon as a window contains a match.
+        """
+        arns = self.list_task_definition_arns(family)
+        with ThreadPoolExecutor(max_workers=DESCRIBE_WINDOW) as executor:
+            while True:
+                window = list(islice(arns, DESCRIBE_WINDOW))
+                if not window:
+                    return None
+                for task_definition in executor.map(self.describe_task_definition, window):
+                    if predicate(task_definition):
+                        return task_definition
 
     def deregister_task(self, taskArn):
         response = self.ecs.deregister_task_definition(aws_retry=True, taskDefinition=taskArn)
@@ -1049,15 +1062,26 @@ def main():
                 module.fail_json(msg="extraHosts parameter is not supported when the awsvpc network mode is used.")
 
         family = module.params["family"]
-        existing_definitions_in_family = task_mgr.describe_task_definitions(module.params["family"])
 
         if "revision" in module.params and module.params["revision"]:
             # The definition specifies revision. We must guarantee that an active revision of that number will result from this.
             revision = int(module.params["revision"])
 
-            # A revision has been explicitly specified. Attempt to locate a matching revision
-            tasks_defs_for_revision = [td for td in existing_definitions_in_family if td["revision"] == revision]
-            existing = tasks_defs_for_revision[0] if len(tasks_defs_for_revision) > 0 else None
+            # A revision has been explicitly specified. Attempt to locate a matching revision, the
+            # revisions are listed newest first so we can stop once we're past the requested one
+            latest_revision = None
+            existing = None
+            try:
+                for arn in task_mgr.list_task_definition_arns(family):
+                    arn_revision = task_definition_revision(arn)
+                    if latest_revision is None:
+                        latest_revision = arn_revision
+                    if arn_revision == revision:
+                        existing = task_mgr.describe_task_definition(arn)
+                    if arn_revision <= revision:
+                        break
+            except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+                module.fail_json_aws(e, msg=f"Failed to describe task definitions in family '{family}'")
 
             if existing and existing["status"] != "ACTIVE":
                 # We cannot reactivate an inactive revision
@@ -1065,15 +1089,15 @@ def main():
                     msg=f"A task in family '{family}' already exists for revision {int(revision)}, but it is inactive"
                 )
             elif not existing:
-                if not existing_definitions_in_family and revision != 1:
+                if latest_revision is None and revision != 1:
                     module.fail_json(
                         msg=f"You have specified a revision of {int(revision)} but a created revision would be 1"
                     )
-                elif existing_definitions_in_family and existing_definitions_in_family[-1]["revision"] + 1 != revision:
+                elif latest_revision is not None and latest_revision + 1 != revision:
                     module.fail_json(
                         msg=(
                             f"You have specified a revision of {int(revision)} but a created revision would be"
-                            f" {int(existing_definitions_in_family[-1]['revision'] + 1)}"
+                            f" {int(latest_revision + 1)}"
                         )
                     )
         else:
@@ -1121,18 +1145,18 @@ def main():
                 requested_launch_type,
                 existing_task_definition,
             ):
-                if td["status"] != "ACTIVE":
+                if existing_task_definition["status"] != "ACTIVE":
                     return None
 
-                if requested_task_role_arn != td.get("taskRoleArn", ""):
+                if requested_task_role_arn != existing_task_definition.get("taskRoleArn", ""):
                     return None
 
-                if requested_launch_type is not None and requested_launch_type not in td.get(
+                if requested_launch_type is not None and requested_launch_type not in existing_task_definition.get(
                     "requiresCompatibilities", []
                 ):
                     return None
 
-                existing_volumes = td.get("volumes", []) or []
+                existing_volumes = existing_task_definition.get("volumes", []) or []
 
                 if len(requested_volumes) != len(existing_volumes):
                     # Nope.
@@ -1150,7 +1174,7 @@ def main():
                         if not found:
                             return None
 
-                existing_containers = td.get("containerDefinitions", []) or []
+                existing_containers = existing_task_definition.get("containerDefinitions", []) or []
 
                 if len(requested_containers) != len(existing_containers):
                     # Nope.
@@ -1170,17 +1194,19 @@ def main():
                 return existing_task_definition
 
             # No revision explicitly specified. Attempt to find an active, matching revision that has all the properties requested
-            for td in existing_definitions_in_family:
-                requested_volumes = module.params["volumes"] or []
-                requested_containers = module.params["containers"] or []
-                requested_task_role_arn = module.params["task_role_arn"]
-                requested_launch_type = module.params["launch_type"]
-                existing = _task_definition_matches(
-                    requested_volumes, requested_containers, requested_task_role_arn, requested_launch_type, td
+            requested_volumes = module.params["volumes"] or []
+            requested_containers = module.params["containers"] or []
+            requested_task_role_arn = module.params["task_role_arn"]
+            requested_launch_type = module.params["launch_type"]
+            try:
+                existing = task_mgr.find_task_definition(
+                    family,
+                    lambda td: _task_definition_matches(
+                        requested_volumes, requested_containers, requested_task_role_arn, requested_launch_type, td
+                    ),
                 )
-
-                if existing:
-                    break
+            except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+                module.fail_json_aws(e, msg=f"Failed to describe task definitions in family '{family}'")
 
         if existing and not module.params.get("force_create"):
             # Awesome. Have an existing one. Nothing to do.
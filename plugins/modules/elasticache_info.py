@@ -15,6 +15,12 @@ options:
     description:
       - The name of an ElastiCache cluster.
     type: str
+  max_concurrency:
+    description:
+      - The maximum number of clusters whose tags are fetched in parallel.
+    type: int
+    default: 10
+    version_added: 9.0.0
 author:
   - Will Thames (@willthames)
 extends_documentation_fragment:
@@ -402,6 +408,8 @@ elasticache_clusters:
         Environment: test
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 try:
     import botocore
 except ImportError:
@@ -440,11 +448,42 @@ def describe_replication_group_with_backoff(client, replication_group_id):
     return response["ReplicationGroups"][0]
 
 
+@AWSRetry.exponential_backoff()
+def describe_replication_groups_with_backoff(client):
+    paginator = client.get_paginator("describe_replication_groups")
+    return paginator.paginate().build_full_result()["ReplicationGroups"]
+
+
 @AWSRetry.exponential_backoff()
 def get_elasticache_tags_with_backoff(client, cluster_id):
     return client.list_tags_for_resource(ResourceName=cluster_id)["TagList"]
 
 
+def get_elasticache_tags(client, arn):
+    try:
+        return get_elasticache_tags_with_backoff(client, arn)
+    except is_boto3_error_code("CacheClusterNotFound"):
+        # e.g: Cluster was listed but is in deleting state
+        return None
+
+
+def get_replication_groups(client, replication_group_ids):
+    """Describe each replication group once, no matter how many clusters are part of it"""
+    if len(replication_group_ids) > 1:
+        replication_groups = describe_replication_groups_with_backoff(client)
+        return dict(
+            (group["ReplicationGroupId"], group)
+            for group in replication_groups
+            if group["ReplicationGroupId"] in replication_group_ids
+        )
+    replication_groups = {}
+    for replication_group_id in replication_group_ids:
+        replication_group = describe_replication_group_with_backoff(client, replication_group_id)
+        if replication_group is not None:
+            replication_groups[replication_group_id] = replication_group
+    return replication_groups
+
+
 def get_elasticache_clusters(client, module):
     region = module.region
     try:
@@ -452,41 +491,52 @@ def get_elasticache_clusters(client, module):
     except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
         module.fail_json_aws(e, msg="Couldn't obtain cache cluster info")
 
+    if not clusters:
+        return []
+
     account_id, partition = get_aws_account_info(module)
-    results = []
-    for cluster in clusters:
-        cluster = camel_dict_to_snake_dict(cluster)
-        arn = f"arn:{partition}:elasticache:{region}:{account_id}:cluster:{cluster['cache_cluster_id']}"
-        try:
-            tags = get_elasticache_tags_with_backoff(client, arn)
-        except is_boto3_error_code("CacheClusterNotFound"):
-            # e.g: Cluster was listed but is in deleting state
-            continue
-        except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
-            module.fail_json_aws(e, msg=f"Couldn't get tags for cluster {cluster['cache_cluster_id']}")
-
-        cluster["tags"] = boto3_tag_list_to_ansible_dict(tags)
-
-        if cluster.get("replication_group_id", None):
+    clusters = [camel_dict_to_snake_dict(cluster) for cluster in clusters]
+    arns = [f"arn:{partition}:elasticache:{region}:{account_id}:cluster:{c['cache_cluster_id']}" for c in clusters]
+
+    with ThreadPoolExecutor(max_workers=module.params.get("max_concurrency")) as executor:
+        cluster_tags = executor.map(lambda arn: get_elasticache_tags(client, arn), arns)
+        for cluster in clusters:
             try:
-                replication_group = describe_replication_group_with_backoff(client, cluster["replication_group_id"])
+                tags = next(cluster_tags)
             except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
-                module.fail_json_aws(e, msg="Couldn't obtain replication group info")
+                module.fail_json_aws(e, msg=f"Couldn't get tags for cluster {cluster['cache_cluster_id']}")
+            cluster["tags"] = tags
 
-            if replication_group is not None:
-                replication_group = camel_dict_to_snake_dict(replication_group)
-                cluster["replication_group"] = replication_group
+    # Drop the clusters which went away while we were looking at them
+    clusters = [cluster for cluster in clusters if cluster["tags"] is not None]
+    for cluster in clusters:
+        cluster["tags"] = boto3_tag_list_to_ansible_dict(cluster["tags"])
 
-        results.append(cluster)
-    return results
+    replication_group_ids = set(c["replication_group_id"] for c in clusters if c.get("replication_group_id", None))
+    try:
+        replication_groups = get_replication_groups(client, replication_group_ids)
+    except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+        module.fail_json_aws(e, msg="Couldn't obtain replication group info")
+
+    replication_groups = dict((k, camel_dict_to_snake_dict(v)) for k, v in replication_groups.items())
+    for cluster in clusters:
+        replication_group = replication_groups.get(cluster.get("replication_group_id", None))
+        if replication_group is not None:
+            cluster["replication_group"] = replication_group
+
+    return clusters
 
 
 def main():
     argument_spec = dict(
         name=dict(required=False),
+        max_concurrency=dict(type="int", default=10),
     )
     module = AnsibleAWSModule(argument_spec=argument_spec, supports_check_mode=True)
 
+    if module.params["max_concurrency"] < 1:
+        module.fail_json(msg="max_concurrency must be at least 1")
+
     client = module.client("elasticache")
 
     module.exit_json(elasticache_clusters=get_elasticache_clusters(client, module))
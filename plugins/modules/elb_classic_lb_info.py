@@ -21,6 +21,12 @@ options:
     type: list
     elements: str
     default: []
+  max_concurrency:
+    description:
+      - The maximum number of ELBs whose attributes and instance health are described in parallel.
+    type: int
+    default: 10
+    version_added: 9.0.0
 extends_documentation_fragment:
   - amazon.aws.common.modules
   - amazon.aws.region.modules
@@ -331,6 +337,7 @@ elbs:
       sample: "vpc-0cc28c9e20d111111"
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 from typing import Dict
 from typing import List
@@ -349,57 +356,79 @@ from ansible_collections.amazon.aws.plugins.module_utils.modules import AnsibleA
 from ansible_collections.amazon.aws.plugins.module_utils.retries import AWSRetry
 from ansible_collections.amazon.aws.plugins.module_utils.tagging import boto3_tag_list_to_ansible_dict
 
+# DescribeTags accepts at most 20 load balancer names per call
+DESCRIBE_TAGS_LIMIT = 20
+
 
-def list_elbs(connection: Any, load_balancer_names: List[str]) -> List[Dict]:
+def list_elbs(connection: Any, load_balancer_names: List[str], max_concurrency: int = 10) -> List[Dict]:
     """
     List Elastic Load Balancers (ELBs) and their detailed information.
 
     Parameters:
       connection (boto3.client): The Boto3 ELB client object.
       load_balancer_names (List[str]): List of ELB names to gather information about.
+      max_concurrency (int): The maximum number of ELBs described in parallel.
 
     Returns:
       A list of dictionaries where each dictionary contains informtion about one ELB.
     """
-    results = []
-
     if not load_balancer_names:
-        for lb in get_all_lb(connection):
-            results.append(describe_elb(connection, lb))
-
-    for load_balancer_name in load_balancer_names:
-        lb = get_lb(connection, load_balancer_name)
-        if not lb:
-            continue
-        results.append(describe_elb(connection, lb))
-    return results
+        lbs = get_all_lb(connection)
+    else:
+        lbs = get_lbs(connection, load_balancer_names)
 
+    if not lbs:
+        return []
 
-def describe_elb(connection: Any, lb: Dict[str, Any]) -> Dict[str, Any]:
+    names = [lb["LoadBalancerName"] for lb in lbs]
+    batches = [names[i:i + DESCRIBE_TAGS_LIMIT] for i in range(0, len(names), DESCRIBE_TAGS_LIMIT)]  # fmt:skip
+    tags = {}
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        attributes = executor.map(lambda name: get_lb_attributes(connection, name), names)
+        instance_states = executor.map(
+            lambda lb: get_instance_states(connection, lb["LoadBalancerName"], lb.get("Instances", [])), lbs
+        )
+        for batch_tags in executor.map(lambda batch: get_tags_batch(connection, batch), batches):
+            tags.update(batch_tags)
+        attributes = list(attributes)
+        instance_states = list(instance_states)
+
+    return [
+        describe_elb(lb, tags.get(lb["LoadBalancerName"], {}), lb_attributes, states)
+        for lb, lb_attributes, states in zip(lbs, attributes, instance_states)
+    ]
+
+
+def describe_elb(
+    lb: Dict[str, Any],
+    tags: Dict[str, Any],
+    attributes: Dict[str, Any],
+    instance_states: List[Dict[str, Any]],
+) -> Dict[str, Any]:
     """
     Describes an Elastic Load Balancer (ELB).
 
     Parameters:
-      connection (boto3.client): The Boto3 ELB client object.
       lb (Dict): Dictionary containing ELB .
+      tags (Dict): The tags of the ELB.
+      attributes (Dict): The attributes of the ELB.
+      instance_states (List[Dict]): The health of the ELB's instances.
 
     Returns:
       A dictionary with detailed information of the ELB.
     """
     description = camel_dict_to_snake_dict(lb)
-    name = lb["LoadBalancerName"]
-    instances = lb.get("Instances", [])
-    description["tags"] = get_tags(connection, name)
-    description["instances_inservice"], description["instances_inservice_count"] = lb_instance_health(
-        connection, name, instances, "InService"
+    description["tags"] = tags
+    description["instances_inservice"], description["instances_inservice_count"] = filter_instance_states(
+        instance_states, "InService"
     )
-    description["instances_outofservice"], description["instances_outofservice_count"] = lb_instance_health(
-        connection, name, instances, "OutOfService"
+    description["instances_outofservice"], description["instances_outofservice_count"] = filter_instance_states(
+        instance_states, "OutOfService"
     )
-    description["instances_unknownservice"], description["instances_unknownservice_count"] = lb_instance_health(
-        connection, name, instances, "Unknown"
+    description["instances_unknownservice"], description["instances_unknownservice_count"] = filter_instance_states(
+        instance_states, "Unknown"
     )
-    description["attributes"] = get_lb_attributes(connection, name)
+    description["attributes"] = attributes
     return description
 
 
@@ -437,6 +466,31 @@ def get_lb(connection: Any, load_balancer_name: str) -> Union[Dict[str, Any], Li
         return []
 
 
+@AWSRetry.jittered_backoff()
+def get_lbs(connection: Any, load_balancer_names: List[str]) -> List[Dict[str, Any]]:
+    """
+    Describes a set of Elastic Load Balancers (ELBs) by name with a single paginated call.
+
+    Parameters:
+      connection (boto3.client): The Boto3 ELB client object.
+      load_balancer_names (List[str]): Names of the ELBs to gather information about.
+
+    Returns:
+      A list of dictionaries with detailed information of the ELBs which exist, in the order of load_balancer_names.
+    """
+    # preserve the order of the names while dropping duplicates
+    load_balancer_names = list(dict.fromkeys(load_balancer_names))
+    try:
+        paginator = connection.get_paginator("describe_load_balancers")
+        lbs = paginator.paginate(LoadBalancerNames=load_balancer_names).build_full_result()["LoadBalancerDescriptions"]
+    except is_boto3_error_code("LoadBalancerNotFound"):
+        # The whole call fails when any of the ELBs doesn't exist, find out which ones do
+        lbs = [get_lb(connection, name) for name in load_balancer_names]
+        return [lb for lb in lbs if lb]
+    lbs = dict((lb["LoadBalancerName"], lb) for lb in lbs)
+    return [lbs[name] for name in load_balancer_names if name in lbs]
+
+
 def get_lb_attributes(connection: Any, load_balancer_name: str) -> Dict[str, Any]:
     """
     Retrieves attributes of specific Elastic Load Balancer (ELB) by name.
@@ -454,26 +508,24 @@ def get_lb_attributes(connection: Any, load_balancer_name: str) -> Dict[str, Any
     return camel_dict_to_snake_dict(attributes)
 
 
-def get_tags(connection: Any, load_balancer_name: str) -> Dict[str, Any]:
+def get_tags_batch(connection: Any, load_balancer_names: List[str]) -> Dict[str, Dict[str, Any]]:
     """
-    Retrieves tags of specific Elastic Load Balancer (ELB) by name.
+    Retrieves the tags of up to 20 Elastic Load Balancers (ELBs) with a single call.
 
     Parameters:
       connection (boto3.client): The Boto3 ELB client object.
-      load_balancer_name (str): Name of the ELB to gather information about.
+      load_balancer_names (List[str]): Names of the ELBs to gather information about.
 
     Returns:
-      A dictionary of tags associated with the specified ELB.
+      A dictionary mapping the name of each ELB to a dictionary of its tags.
     """
-    tags = connection.describe_tags(aws_retry=True, LoadBalancerNames=[load_balancer_name])["TagDescriptions"]
-    if not tags:
-        return {}
-    return boto3_tag_list_to_ansible_dict(tags[0]["Tags"])
+    tags = connection.describe_tags(aws_retry=True, LoadBalancerNames=load_balancer_names)["TagDescriptions"]
+    return dict((tag["LoadBalancerName"], boto3_tag_list_to_ansible_dict(tag["Tags"])) for tag in tags)
 
 
-def lb_instance_health(
-    connection: Any, load_balancer_name: str, instances: List[Dict[str, Any]], state: str
-) -> Tuple[List[str], int]:
+def get_instance_states(
+    connection: Any, load_balancer_name: str, instances: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
     """
     Describes the health status of instances associated with a specific Elastic Load Balancer (ELB).
 
@@ -481,14 +533,26 @@ def lb_instance_health(
         connection (Any): The Boto3 client object for ELB.
         load_balancer_name (str): The name of the ELB.
         instances (List[Dict]): List of dictionaries containing instances associated with the ELB.
+
+    Returns:
+        List[Dict]: The state of each instance.
+    """
+    return connection.describe_instance_health(
+        aws_retry=True, LoadBalancerName=load_balancer_name, Instances=instances
+    ).get("InstanceStates", [])
+
+
+def filter_instance_states(instance_states: List[Dict[str, Any]], state: str) -> Tuple[List[str], int]:
+    """
+    Filters the health status of instances by state.
+
+    Parameters:
+        instance_states (List[Dict]): The health status of the instances, as returned by get_instance_states().
         state (str): The health state to filter by (e.g., "InService", "OutOfService", "Unknown").
 
     Returns:
         Tuple[List, int]: A tuple containing a list of instance IDs matching state and the count of matching instances.
     """
-    instance_states = connection.describe_instance_health(LoadBalancerName=load_balancer_name, Instances=instances).get(
-        "InstanceStates", []
-    )
     instate = [instance["InstanceId"] for instance in instance_states if instance["State"] == state]
     return instate, len(instate)
 
@@ -496,16 +560,20 @@ def lb_instance_health(
 def main():
     argument_spec = dict(
         names=dict(default=[], type="list", elements="str"),
+        max_concurrency=dict(default=10, type="int"),
     )
     module = AnsibleAWSModule(
         argument_spec=argument_spec,
         supports_check_mode=True,
     )
 
+    if module.params["max_concurrency"] < 1:
+        module.fail_json(msg="max_concurrency must be at least 1")
+
     connection = module.client("elb", retry_decorator=AWSRetry.jittered_backoff(retries=5, delay=5))
 
     try:
-        elbs = list_elbs(connection, module.params.get("names"))
+        elbs = list_elbs(connection, module.params.get("names"), module.params.get("max_concurrency"))
     except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
         module.fail_json_aws(e, msg="Failed to get load balancer information.")
 
@@ -37,6 +37,22 @@ options:
     required: false
     default: false
     type: bool
+  include_attributes:
+    description:
+      - When set to C(False), the attributes of the target groups are not collected.
+      - This saves one API call per target group.
+    required: false
+    default: true
+    type: bool
+    version_added: 9.0.0
+  max_concurrency:
+    description:
+      - The maximum number of target groups whose attributes and target health are described in parallel.
+      - Throttled requests are retried with a jittered backoff.
+    required: false
+    default: 10
+    type: int
+    version_added: 9.0.0
 
 extends_documentation_fragment:
 - amazon.aws.common.modules
@@ -59,6 +75,10 @@ EXAMPLES = r"""
     names:
       - tg1
       - tg2
+
+- name: Gather information about all target groups without their attributes
+  community.aws.elb_target_group_info:
+    include_attributes: false
 """
 
 RETURN = r"""
@@ -69,7 +89,7 @@ target_groups:
     contains:
         deregistration_delay_timeout_seconds:
             description: The amount time for Elastic Load Balancing to wait before changing the state of a deregistering target from draining to unused.
-            returned: always
+            returned: when include_attributes is true
             type: int
             sample: 300
         health_check_interval_seconds:
@@ -126,17 +146,17 @@ target_groups:
             sample: HTTP
         stickiness_enabled:
             description: Indicates whether sticky sessions are enabled.
-            returned: always
+            returned: when include_attributes is true
             type: bool
             sample: true
         stickiness_lb_cookie_duration_seconds:
             description: Indicates whether sticky sessions are enabled.
-            returned: always
+            returned: when include_attributes is true
             type: int
             sample: 86400
         stickiness_type:
             description: The type of sticky sessions.
-            returned: always
+            returned: when include_attributes is true
             type: str
             sample: lb_cookie
         tags:
@@ -203,6 +223,8 @@ target_groups:
             sample: vpc-0123456
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 try:
     import botocore
 except ImportError:
@@ -216,6 +238,9 @@ from ansible_collections.amazon.aws.plugins.module_utils.tagging import boto3_ta
 
 from ansible_collections.community.aws.plugins.module_utils.modules import AnsibleCommunityAWSModule as AnsibleAWSModule
 
+# DescribeTags accepts at most 20 resource ARNs per call
+DESCRIBE_TAGS_LIMIT = 20
+
 
 @AWSRetry.jittered_backoff(retries=10)
 def get_paginator(**kwargs):
@@ -224,31 +249,31 @@ def get_paginator(**kwargs):
 
 
 def get_target_group_attributes(target_group_arn):
-    try:
-        target_group_attributes = boto3_tag_list_to_ansible_dict(
-            client.describe_target_group_attributes(TargetGroupArn=target_group_arn)["Attributes"]
-        )
-    except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
-        module.fail_json_aws(e, msg="Failed to describe target group attributes")
+    target_group_attributes = boto3_tag_list_to_ansible_dict(
+        client.describe_target_group_attributes(TargetGroupArn=target_group_arn, aws_retry=True)["Attributes"]
+    )
 
     # Replace '.' with '_' in attribute key names to make it more Ansibley
     return dict((k.replace(".", "_"), v) for (k, v) in target_group_attributes.items())
 
 
-def get_target_group_tags(target_group_arn):
-    try:
-        return boto3_tag_list_to_ansible_dict(
-            client.describe_tags(ResourceArns=[target_group_arn])["TagDescriptions"][0]["Tags"]
-        )
-    except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
-        module.fail_json_aws(e, msg="Failed to describe group tags")
+def get_target_groups_tags(target_group_arns):
+    tag_descriptions = client.describe_tags(ResourceArns=target_group_arns, aws_retry=True)["TagDescriptions"]
+    return dict(
+        (description["ResourceArn"], boto3_tag_list_to_ansible_dict(description["Tags"]))
+        for description in tag_descriptions
+    )
 
 
 def get_target_group_targets_health(target_group_arn):
+    return client.describe_target_health(TargetGroupArn=target_group_arn, aws_retry=True)["TargetHealthDescriptions"]
+
+
+def collect_results(results, msg):
     try:
-        return client.describe_target_health(TargetGroupArn=target_group_arn)["TargetHealthDescriptions"]
+        return list(results)
     except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
-        module.fail_json_aws(e, msg="Failed to get target health")
+        module.fail_json_aws(e, msg=msg)
 
 
 def list_target_groups():
@@ -256,6 +281,8 @@ def list_target_groups():
     target_group_arns = module.params.get("target_group_arns")
     names = module.params.get("names")
     collect_targets_health = module.params.get("collect_targets_health")
+    include_attributes = module.params.get("include_attributes")
+    max_concurrency = module.params.get("max_concurrency")
 
     try:
         if not load_balancer_arn and not target_group_arns and not names:
@@ -274,20 +301,44 @@ def list_target_groups():
     ) as e:  # pylint: disable=duplicate-except
         module.fail_json_aws(e, msg="Failed to list target groups")
 
-    # Get the attributes and tags for each target group
-    for target_group in target_groups["TargetGroups"]:
-        target_group.update(get_target_group_attributes(target_group["TargetGroupArn"]))
+    arns = [target_group["TargetGroupArn"] for target_group in target_groups["TargetGroups"]]
+    tags = {}
+    attributes = []
+    targets_health = []
+
+    if arns:
+        # The calls are made from the worker threads, failures are reported from
+        # here so that only one thread ever exits the module.
+        batches = [arns[i:i + DESCRIBE_TAGS_LIMIT] for i in range(0, len(arns), DESCRIBE_TAGS_LIMIT)]  # fmt:skip
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            tags_results = executor.map(get_target_groups_tags, batches)
+            if include_attributes:
+                attributes_results = executor.map(get_target_group_attributes, arns)
+            if collect_targets_health:
+                health_results = executor.map(get_target_group_targets_health, arns)
+
+            for batch_tags in collect_results(tags_results, "Failed to describe group tags"):
+                tags.update(batch_tags)
+            if include_attributes:
+                attributes = collect_results(attributes_results, "Failed to describe target group attributes")
+            if collect_targets_health:
+                targets_health = collect_results(health_results, "Failed to get target health")
+
+    # Get the attributes for each target group
+    if include_attributes:
+        for target_group, target_group_attributes in zip(target_groups["TargetGroups"], attributes):
+            target_group.update(target_group_attributes)
 
     # Turn the boto3 result in to ansible_friendly_snaked_names
     snaked_target_groups = [camel_dict_to_snake_dict(target_group) for target_group in target_groups["TargetGroups"]]
 
-    # Get tags for each target group
     for snaked_target_group in snaked_target_groups:
-        snaked_target_group["tags"] = get_target_group_tags(snaked_target_group["target_group_arn"])
-        if collect_targets_health:
+        snaked_target_group["tags"] = tags.get(snaked_target_group["target_group_arn"], {})
+
+    if collect_targets_health:
+        for snaked_target_group, target_health in zip(snaked_target_groups, targets_health):
             snaked_target_group["targets_health_description"] = [
-                camel_dict_to_snake_dict(target)
-                for target in get_target_group_targets_health(snaked_target_group["target_group_arn"])
+                camel_dict_to_snake_dict(target) for target in target_health
             ]
 
     module.exit_json(target_groups=snaked_target_groups)
@@ -302,6 +353,8 @@ def main():
         target_group_arns=dict(type="list", elements="str"),
         names=dict(type="list", elements="str"),
         collect_targets_health=dict(default=False, type="bool", required=False),
+        include_attributes=dict(default=True, type="bool", required=False),
+        max_concurrency=dict(default=10, type="int", required=False),
     )
 
     module = AnsibleAWSModule(
@@ -310,6 +363,9 @@ def main():
         supports_check_mode=True,
     )
 
+    if module.params["max_concurrency"] < 1:
+        module.fail_json(msg="max_concurrency must be at least 1")
+
     try:
         client = module.client("elbv2", retry_decorator=AWSRetry.jittered_backoff(retries=10))
     except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
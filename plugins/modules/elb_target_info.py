@@ -12,14 +12,24 @@ short_description: Gathers which target groups a target is associated with.
 description:
   - This module will search through every target group in a region to find
     which ones have registered a given instance ID or IP.
+  - When I(instance_ids) is used the target groups are only searched once, no
+    matter how many instances are looked up.
 author:
   - "Yaakov Kuperman (@yaakov-github)"
 options:
   instance_id:
     description:
       - What instance ID to get information for.
+      - Mutually exclusive with I(instance_ids), one of them is required.
     type: str
-    required: true
+  instance_ids:
+    description:
+      - A list of instance IDs to get information for.
+      - The target groups of every instance are returned in I(target_groups_by_instance).
+      - Mutually exclusive with I(instance_id), one of them is required.
+    type: list
+    elements: str
+    version_added: 9.0.0
   get_unused_target_groups:
     description:
       - Whether or not to get target groups not used by any load balancers.
@@ -124,12 +134,25 @@ EXAMPLES = r"""
            {%endif%}
            {%endfor%}
   loop: "{{target_info.instance_target_groups}}"
+
+# look up every host of a play with a single search of the target groups
+- name: Get the target groups of all hosts
+  community.aws.elb_target_info:
+    instance_ids: "{{ ansible_play_hosts | map('extract', hostvars, 'ansible_ec2_instance_id') | list }}"
+    region: "{{ ansible_ec2_placement_region }}"
+  delegate_to: localhost
+  run_once: true
+  register: all_target_info
+
+- name: show the target groups of this host
+  ansible.builtin.debug:
+    msg: "{{ all_target_info.target_groups_by_instance[ansible_ec2_instance_id] }}"
 """
 
 RETURN = r"""
 instance_target_groups:
     description: a list of target groups to which the instance is registered to
-    returned: always
+    returned: when I(instance_id) is set
     type: complex
     contains:
         target_group_arn:
@@ -201,6 +224,23 @@ instance_target_groups:
                                 - "unused"
                                 - "unavailable"
                             type: str
+target_groups_by_instance:
+    description:
+      - A dictionary keyed by instance ID.
+      - Each value is a list of the target groups to which the instance is registered,
+        in the same format as I(instance_target_groups).
+    returned: when I(instance_ids) is set
+    type: dict
+    sample:
+        i-0123456789abcdef0:
+            - target_group_arn: "arn:aws:elasticloadbalancing:eu-west-1:123456789012:targetgroup/target-group/deadbeefdeadbeef"
+              target_group_type: instance
+              targets:
+                  - target_id: i-0123456789abcdef0
+                    target_port: 80
+                    target_az: null
+                    target_health:
+                        state: healthy
 """
 
 try:
@@ -252,7 +292,7 @@ class TargetGroup(object):
 
 
 class TargetInfoGatherer(object):
-    def __init__(self, module, instance_id, get_unused_target_groups):
+    def __init__(self, module, instance_ids, get_unused_target_groups):
         self.module = module
         try:
             self.ec2 = self.module.client("ec2", retry_decorator=AWSRetry.jittered_backoff(retries=10))
@@ -264,42 +304,57 @@ class TargetInfoGatherer(object):
         except (BotoCoreError, ClientError) as e:
             self.module.fail_json_aws(e, msg="Could not connect to elbv2")
 
-        self.instance_id = instance_id
+        if isinstance(instance_ids, str):
+            instance_ids = [instance_ids]
+        # preserve the order of the instances while dropping duplicates
+        self.instance_ids = list(dict.fromkeys(instance_ids))
         self.get_unused_target_groups = get_unused_target_groups
-        self.tgs = self._get_target_groups()
+        self.tgs_by_instance = self._get_target_groups()
+
+    @property
+    def tgs(self):
+        """The target groups of the first (or only) instance"""
+        return self.tgs_by_instance[self.instance_ids[0]]
 
-    def _get_instance_ips(self):
-        """Fetch all IPs associated with this instance so that we can determine
-        whether or not an instance is in an IP-based target group"""
+    @AWSRetry.jittered_backoff(retries=10)
+    def _paginated_describe_instances(self, **params):
+        paginator = self.ec2.get_paginator("describe_instances")
+        return paginator.paginate(**params).build_full_result()
+
+    def _get_instances(self):
+        """Fetch the VPC and all IPs associated with each instance so that we can
+        determine whether or not an instance is in an IP-based target group"""
         try:
-            # get ahold of the instance in the API
-            reservations = self.ec2.describe_instances(InstanceIds=[self.instance_id], aws_retry=True)["Reservations"]
+            # get ahold of the instances in the API
+            reservations = self._paginated_describe_instances(InstanceIds=self.instance_ids)["Reservations"]
         except (BotoCoreError, ClientError) as e:
-            # typically this will happen if the instance doesn't exist
+            # typically this will happen if an instance doesn't exist
             self.module.fail_json_aws(
                 e,
-                msg=f"Could not get instance info for instance '{self.instance_id}'",
+                msg=f"Could not get instance info for instances {', '.join(self.instance_ids)}",
             )
 
-        if len(reservations) < 1:
-            self.module.fail_json(msg=f"Instance ID {self.instance_id} could not be found")
-
-        instance = reservations[0]["Instances"][0]
-
-        # IPs are represented in a few places in the API, this should
-        # account for all of them
-        ips = set()
-        ips.add(instance["PrivateIpAddress"])
-        for nic in instance["NetworkInterfaces"]:
-            ips.add(nic["PrivateIpAddress"])
-            for ip in nic["PrivateIpAddresses"]:
-                ips.add(ip["PrivateIpAddress"])
-
-        return list(ips)
+        instances = {}
+        for reservation in reservations:
+            for instance in reservation["Instances"]:
+                # IPs are represented in a few places in the API, this should
+                # account for all of them
+                ips = set()
+                ips.add(instance["PrivateIpAddress"])
+                for nic in instance["NetworkInterfaces"]:
+                    ips.add(nic["PrivateIpAddress"])
+                    for ip in nic["PrivateIpAddresses"]:
+                        ips.add(ip["PrivateIpAddress"])
+                instances[instance["InstanceId"]] = {"vpc_id": instance.get("VpcId"), "ips": list(ips)}
+
+        missing = [instance_id for instance_id in self.instance_ids if instance_id not in instances]
+        if missing:
+            self.module.fail_json(msg=f"Instance ID {', '.join(missing)} could not be found")
+
+        return instances
 
     def _get_target_group_objects(self):
-        """helper function to build a list of TargetGroup objects based on
-        the AWS API"""
+        """helper function to list the target groups from the AWS API"""
         try:
             paginator = self.elbv2.get_paginator("describe_target_groups")
             tg_response = paginator.paginate().build_full_result()
@@ -309,85 +364,114 @@ class TargetInfoGatherer(object):
                 msg="Could not describe target groups",
             )
 
-        # build list of TargetGroup objects representing every target group in
-        # the system
+        # build list of every target group in the system
         target_groups = []
         for each_tg in tg_response["TargetGroups"]:
             if not self.get_unused_target_groups and len(each_tg["LoadBalancerArns"]) < 1:
                 # only collect target groups that actually are connected
                 # to LBs
                 continue
-
-            target_groups.append(
-                TargetGroup(
-                    target_group_arn=each_tg["TargetGroupArn"],
-                    target_group_type=each_tg["TargetType"],
-                )
-            )
+            target_groups.append(each_tg)
         return target_groups
 
-    def _get_target_descriptions(self, target_groups):
-        """Helper function to build a list of all the target descriptions
-        for this target in a target group"""
-        # Build a list of all the target groups pointing to this instance
-        # based on the previous list
-        tgs = set()
-        # Loop through all the target groups
+    def _may_contain_instances(self, target_group, vpc_ids):
+        """Whether or not the targets of a target group can point to one of our
+        instances, so that we only describe the health of those target groups"""
+        if target_group["TargetType"] == "instance":
+            # instances can only be registered to target groups in their VPC
+            return target_group.get("VpcId") in vpc_ids
+        # IP targets may be outside of the target group's VPC (peering), lambda
+        # and alb target groups never point to an instance
+        return target_group["TargetType"] == "ip"
+
+    def _get_target_index(self, target_groups, vpc_ids):
+        """Helper function to index the target descriptions of the target groups
+        by target ID, each target group's health is only described once"""
+        index = {}
         for tg in target_groups:
+            if not self._may_contain_instances(tg, vpc_ids):
+                continue
             try:
                 # Get the list of targets for that target group
-                response = self.elbv2.describe_target_health(TargetGroupArn=tg.target_group_arn, aws_retry=True)
+                response = self.elbv2.describe_target_health(TargetGroupArn=tg["TargetGroupArn"], aws_retry=True)
             except (BotoCoreError, ClientError) as e:
                 self.module.fail_json_aws(
-                    e, msg="Could not describe target " + f"health for target group {tg.target_group_arn}"
+                    e, msg="Could not describe target " + f"health for target group {tg['TargetGroupArn']}"
                 )
 
             for t in response["TargetHealthDescriptions"]:
-                # If the target group has this instance as a target, add to
-                # list. This logic also accounts for the possibility of a
-                # target being in the target group multiple times with
-                # overridden ports
-                if t["Target"]["Id"] == self.instance_id or t["Target"]["Id"] in self.instance_ips:
-                    # The 'AvailabilityZone' parameter is a weird one, see the
-                    # API docs for more.  Basically it's only supposed to be
-                    # there under very specific circumstances, so we need
-                    # to account for that
-                    az = t["Target"]["AvailabilityZone"] if "AvailabilityZone" in t["Target"] else None
-
-                    tg.add_target(t["Target"]["Id"], t["Target"]["Port"], az, t["TargetHealth"])
-                    # since tgs is a set, each target group will be added only
-                    # once, even though we call add on each successful match
-                    tgs.add(tg)
-        return list(tgs)
+                index.setdefault(t["Target"]["Id"], []).append((tg, t))
+        return index
+
+    def _get_target_descriptions(self, target_index, instance_id, instance_ips):
+        """Helper function to build a list of the target groups pointing to
+        this instance, along with the target descriptions for this instance"""
+        tgs = {}
+        # A target may be in the target group multiple times with overridden
+        # ports, or the instance may be registered by ID and by IP
+        for target_id in [instance_id] + instance_ips:
+            for each_tg, t in target_index.get(target_id, []):
+                tg = tgs.get(each_tg["TargetGroupArn"])
+                if tg is None:
+                    tg = tgs[each_tg["TargetGroupArn"]] = TargetGroup(
+                        target_group_arn=each_tg["TargetGroupArn"],
+                        target_group_type=each_tg["TargetType"],
+                    )
+                # The 'AvailabilityZone' parameter is a weird one, see the
+                # API docs for more.  Basically it's only supposed to be
+                # there under very specific circumstances, so we need
+                # to account for that
+                az = t["Target"]["AvailabilityZone"] if "AvailabilityZone" in t["Target"] else None
+
+                tg.add_target(t["Target"]["Id"], t["Target"]["Port"], az, t["TargetHealth"])
+        return list(tgs.values())
 
     def _get_target_groups(self):
-        # do this first since we need the IPs later on in this function
-        self.instance_ips = self._get_instance_ips()
+        # do this first since we need the VPCs and IPs later on in this function
+        instances = self._get_instances()
 
-        # build list of target groups
+        # index the targets of every target group which may point to one of
+        # the instances, then look up each of the instances in the index
         target_groups = self._get_target_group_objects()
-        return self._get_target_descriptions(target_groups)
+        vpc_ids = set(instance["vpc_id"] for instance in instances.values())
+        target_index = self._get_target_index(target_groups, vpc_ids)
+        return dict(
+            (instance_id, self._get_target_descriptions(target_index, instance_id, instances[instance_id]["ips"]))
+            for instance_id in self.instance_ids
+        )
 
 
 def main():
     argument_spec = dict(
-        instance_id={"required": True, "type": "str"},
+        instance_id={"required": False, "type": "str"},
+        instance_ids={"required": False, "type": "list", "elements": "str"},
         get_unused_target_groups={"required": False, "default": True, "type": "bool"},
     )
 
     module = AnsibleAWSModule(
         argument_spec=argument_spec,
+        mutually_exclusive=[["instance_id", "instance_ids"]],
+        required_one_of=[["instance_id", "instance_ids"]],
         supports_check_mode=True,
     )
 
     instance_id = module.params["instance_id"]
+    instance_ids = module.params["instance_ids"]
     get_unused_target_groups = module.params["get_unused_target_groups"]
 
-    tg_gatherer = TargetInfoGatherer(module, instance_id, get_unused_target_groups)
+    if instance_id:
+        tg_gatherer = TargetInfoGatherer(module, instance_id, get_unused_target_groups)
+        instance_target_groups = [each.to_dict() for each in tg_gatherer.tgs]
+        module.exit_json(instance_target_groups=instance_target_groups)
 
-    instance_target_groups = [each.to_dict() for each in tg_gatherer.tgs]
+    if not instance_ids:
+        module.exit_json(target_groups_by_instance={})
 
-    module.exit_json(instance_target_groups=instance_target_groups)
+    tg_gatherer = TargetInfoGatherer(module, instance_ids, get_unused_target_groups)
+    target_groups_by_instance = dict(
+        (each_id, [each.to_dict() for each in tgs]) for each_id, tgs in tg_gatherer.tgs_by_instance.items()
+    )
+    module.exit_json(target_groups_by_instance=target_groups_by_instance)
 
 
 if __name__ == "__main__":
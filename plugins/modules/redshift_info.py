@@ -18,6 +18,7 @@ options:
     description:
       - The prefix of cluster identifier of the Redshift cluster you are searching for.
       - "This is a regular expression match with implicit '^'. Append '$' for a complete match."
+      - When the identifier only contains letters, digits and hyphens followed by '$' the cluster is looked up directly.
     required: false
     aliases: ['name', 'identifier']
     type: str
@@ -25,6 +26,7 @@ options:
     description:
       - "A dictionary/hash of tags in the format { tag1_name: 'tag1_value', tag2_name: 'tag2_value' }
        to match against the security group(s) you are searching for."
+      - A cluster matches when it has at least one of the tags.
     required: false
     type: dict
 extends_documentation_fragment:
@@ -282,41 +284,66 @@ except ImportError:
 
 from ansible.module_utils.common.dict_transformations import camel_dict_to_snake_dict
 
+from ansible_collections.amazon.aws.plugins.module_utils.botocore import is_boto3_error_code
+
 from ansible_collections.community.aws.plugins.module_utils.modules import AnsibleCommunityAWSModule as AnsibleAWSModule
 
+# Redshift cluster identifiers only contain letters, digits and hyphens, an
+# identifier written like this with a trailing '$' names exactly one cluster
+EXACT_IDENTIFIER = re.compile(r"^([a-zA-Z0-9-]+)\$$")
+
 
 def match_tags(tags_to_match, cluster):
+    cluster_tags = dict((tag["Key"], tag["Value"]) for tag in cluster.get("Tags", []))
     for key, value in tags_to_match.items():
-        for tag in cluster["Tags"]:
-            if key == tag["Key"] and value == tag["Value"]:
-                return True
+        if key in cluster_tags and cluster_tags[key] == value:
+            return True
 
     return False
 
 
-def find_clusters(conn, module, identifier=None, tags=None):
-    try:
-        cluster_paginator = conn.get_paginator("describe_clusters")
-        clusters = cluster_paginator.paginate().build_full_result()
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg="Failed to fetch clusters.")
+def compile_matcher(identifier=None, tags=None):
+    """Returns a function which tests whether a cluster matches both the identifier prefix and the tags"""
+    identifier_prog = re.compile("^" + identifier) if identifier else None
 
-    matched_clusters = []
+    def matcher(cluster):
+        if identifier_prog and not identifier_prog.search(cluster["ClusterIdentifier"]):
+            return False
+        if tags and not match_tags(tags, cluster):
+            return False
+        return True
 
-    if identifier is not None:
-        identifier_prog = re.compile("^" + identifier)
+    return matcher
 
-    for cluster in clusters["Clusters"]:
-        matched_identifier = True
-        if identifier:
-            matched_identifier = identifier_prog.search(cluster["ClusterIdentifier"])
 
-        matched_tags = True
-        if tags:
-            matched_tags = match_tags(tags, cluster)
+def describe_clusters_params(identifier=None, tags=None):
+    """Pushes as much of the filtering as possible to the API, the results still need to be matched locally"""
+    if identifier:
+        exact = EXACT_IDENTIFIER.match(identifier)
+        if exact:
+            return dict(ClusterIdentifier=exact.group(1))
+    if tags:
+        # The API returns the clusters with any combination of these keys and
+        # values, which includes every cluster with at least one of the tags
+        return dict(TagKeys=list(tags.keys()), TagValues=[str(value) for value in tags.values()])
+    return dict()
 
-        if matched_identifier and matched_tags:
-            matched_clusters.append(camel_dict_to_snake_dict(cluster))
+
+def find_clusters(conn, module, identifier=None, tags=None):
+    matcher = compile_matcher(identifier, tags)
+    params = describe_clusters_params(identifier, tags)
+
+    matched_clusters = []
+    try:
+        cluster_paginator = conn.get_paginator("describe_clusters")
+        for page in cluster_paginator.paginate(**params):
+            for cluster in page["Clusters"]:
+                if matcher(cluster):
+                    matched_clusters.append(camel_dict_to_snake_dict(cluster))
+    except is_boto3_error_code("ClusterNotFound"):
+        return []
+    except (BotoCoreError, ClientError) as e:  # pylint: disable=duplicate-except
+        module.fail_json_aws(e, msg="Failed to fetch clusters.")
 
     return matched_clusters
 
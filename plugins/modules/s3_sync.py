@@ -24,6 +24,8 @@ options:
     - Difference determination method to allow changes-only syncing. Unlike rsync, files are not patched- they are fully skipped or fully uploaded.
     - date_size will upload if file sizes don't match or if local file modified date is newer than s3's version
     - checksum will compare etag values based on s3's implementation of chunked md5s.
+      Local etags are only calculated for files with a remote object of the same size, see also O(checksum_cache).
+      The part size used for the calculation is inferred from the number of parts in the remote etag.
     - force will always upload all files.
     required: false
     default: 'date_size'
@@ -109,9 +111,65 @@ options:
   delete:
     description:
     - Remove remote files that exist in bucket but are not present in the file root.
+    - Deletions are issued in batches of 1000 keys, up to O(max_concurrency) batches at a time.
     required: false
     default: false
     type: bool
+  delete_sample_size:
+    description:
+    - The maximum number of deleted keys returned in RV(removed) when O(delete=true).
+    - The number of objects deleted is always returned in RV(removed_count).
+    - By default all the deleted keys are returned.
+    required: false
+    type: int
+    version_added: 9.0.0
+  checksum_cache:
+    description:
+    - Path to a file used to cache the local etags calculated for O(file_change_strategy=checksum).
+    - Cached etags are re-used while the file's inode, size and modification time are unchanged,
+      so repeated syncs of a mostly unchanged tree don't need to read the files again.
+    - The cache is a SQLite database, it will be created if it doesn't exist.
+    - By default no cache is used.
+    required: false
+    type: path
+    version_added: 9.0.0
+  return_file_lists:
+    description:
+    - Whether to return the per-file lists RV(filelist_initial), RV(filelist_typed), RV(filelist_s3),
+      RV(filelist_local_etag), RV(filelist_actionable) and RV(uploads).
+    - Set to V(false) when syncing large trees to reduce the memory used by the module and the size of its output.
+      RV(upload_stats) is always returned.
+    required: false
+    default: true
+    type: bool
+    version_added: 9.0.0
+  max_concurrency:
+    description:
+    - The maximum number of files uploaded, or remote objects inspected, in parallel.
+    - Also used as the maximum number of parts of a single file uploaded in parallel.
+    - The S3 client's connection pool is sized so that O(max_concurrency) files can each upload O(max_concurrency)
+      parts at the same time, up to a pool of 100 connections.  Above that the number of parts of a single file
+      uploaded in parallel is reduced to keep within the pool.
+    required: false
+    default: 10
+    type: int
+    version_added: 9.0.0
+  multipart_threshold:
+    description:
+    - Files of this size in bytes or larger are uploaded in multiple parts.
+    - Must be at least 5 MiB (5242880).
+    required: false
+    default: 8388608
+    type: int
+    version_added: 9.0.0
+  multipart_chunksize:
+    description:
+    - The size in bytes of each part of a multipart upload.
+    - S3 requires parts to be between 5 MiB (5242880) and 5 GiB (5368709120).
+    required: false
+    default: 8388608
+    type: int
+    version_added: 9.0.0
 
 author:
 - Ted Timmons (@tedder)
@@ -147,17 +205,26 @@ EXAMPLES = r"""
       .json: application/text
     key_prefix: config_files/web
     file_change_strategy: force
+    max_concurrency: 20
+    multipart_threshold: 67108864
+    multipart_chunksize: 16777216
     permission: public-read
     cache_control: "public, max-age=31536000"
     storage_class: "GLACIER"
     include: "*"
     exclude: "*.txt,.*"
+
+- name: sync a large tree, only returning the aggregate upload statistics
+  community.aws.s3_sync:
+    bucket: tedder
+    file_root: /srv/www/static
+    return_file_lists: false
 """
 
 RETURN = r"""
 filelist_initial:
   description: file listing (dicts) from initial globbing
-  returned: always
+  returned: when O(return_file_lists=true)
   type: list
   sample: [{
                 "bytes": 151,
@@ -166,8 +233,11 @@ filelist_initial:
                 "modified_epoch": 1477416706
            }]
 filelist_local_etag:
-  description: file listing (dicts) including calculated local etag
-  returned: always
+  description:
+  - file listing (dicts) of local files with their S3 paths.
+  - Since version 9.0.0 local etags are calculated while filtering, and only when needed, they are
+    no longer included in this list.
+  returned: when O(return_file_lists=true)
   type: list
   sample: [{
                 "bytes": 151,
@@ -179,7 +249,7 @@ filelist_local_etag:
            }]
 filelist_s3:
   description: file listing (dicts) including information about previously-uploaded versions
-  returned: always
+  returned: when O(return_file_lists=true)
   type: list
   sample: [{
                 "bytes": 151,
@@ -191,7 +261,7 @@ filelist_s3:
            }]
 filelist_typed:
   description: file listing (dicts) with calculated or overridden mime types
-  returned: always
+  returned: when O(return_file_lists=true)
   type: list
   sample: [{
                 "bytes": 151,
@@ -202,7 +272,7 @@ filelist_typed:
            }]
 filelist_actionable:
   description: file listing (dicts) of files that will be uploaded after the strategy decision
-  returned: always
+  returned: when O(return_file_lists=true)
   type: list
   sample: [{
                 "bytes": 151,
@@ -216,24 +286,93 @@ filelist_actionable:
            }]
 uploads:
   description: file listing (dicts) of files that were actually uploaded
-  returned: always
+  returned: when O(return_file_lists=true)
   type: list
   sample: [{
                 "bytes": 151,
                 "chopped_path": "policy.json",
                 "fullpath": "roles/cf/files/policy.json",
                 "s3_path": "s3sync/policy.json",
+                "upload_seconds": 0.052,
                 "whysize": "151 / 151",
                 "whytime": "1477931637 / 1477931489"
            }]
+removed:
+  description:
+  - Keys of the objects deleted when O(delete=true), sorted.
+  - When O(delete_sample_size) is set, at most O(delete_sample_size) keys are returned, the first keys in sort order.
+  returned: when O(delete=true)
+  type: list
+  elements: str
+  sample: ["s3sync/old-policy.json"]
+delete_failures:
+  description: The objects S3 failed to delete when O(delete=true).
+  returned: when O(delete=true)
+  type: list
+  elements: dict
+  version_added: 9.0.0
+  contains:
+    key:
+      description: The key of the object.
+      type: str
+      sample: "s3sync/old-policy.json"
+    code:
+      description: The error code returned by S3.
+      type: str
+      sample: "AccessDenied"
+    message:
+      description: The error message returned by S3.
+      type: str
+      sample: "Access Denied"
+removed_count:
+  description: The number of objects deleted when O(delete=true).
+  returned: when O(delete=true)
+  type: int
+  sample: 1
+  version_added: 9.0.0
+upload_stats:
+  description: Aggregate statistics for the uploaded files.
+  returned: always
+  type: dict
+  version_added: 9.0.0
+  contains:
+    files:
+      description: The number of files uploaded.
+      type: int
+      sample: 12
+    bytes:
+      description: The total size in bytes of the files uploaded.
+      type: int
+      sample: 1812
+    seconds:
+      description: The wall clock time in seconds taken to upload the files.
+      type: float
+      sample: 0.31
+    files_per_second:
+      description: The number of files uploaded per second.
+      type: float
+      sample: 38.71
+    bytes_per_second:
+      description: The number of bytes uploaded per second.
+      type: float
+      sample: 5845.16
 
 """
 
 import datetime
 import fnmatch
+import heapq
+import itertools
 import mimetypes
 import os
+import re
 import stat as osstat  # os.stat constants
+import time
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import FIRST_EXCEPTION
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from contextlib import contextmanager
 
 try:
     from dateutil import tz
@@ -244,222 +383,427 @@ except ImportError:
 
 try:
     import botocore
+    import botocore.config
+    from boto3.s3.transfer import TransferConfig
 except ImportError:
     pass  # Handled by AnsibleAWSModule
 
+from ansible.module_utils._text import to_bytes
 from ansible.module_utils._text import to_text
 
 from ansible_collections.amazon.aws.plugins.module_utils.botocore import is_boto3_error_code
 
-from ansible_collections.community.aws.plugins.module_utils.etag import calculate_multipart_etag
+from ansible_collections.community.aws.plugins.module_utils.etag import DEFAULT_CHUNK_SIZE
+from ansible_collections.community.aws.plugins.module_utils.etag import EtagCache
+from ansible_collections.community.aws.plugins.module_utils.etag import calculate_multipart_etags
 from ansible_collections.community.aws.plugins.module_utils.modules import AnsibleCommunityAWSModule as AnsibleAWSModule
 
+DEFAULT_CONCURRENCY = 10
+DEFAULT_MULTIPART_SIZE = 8 * 1024 * 1024
+MIN_MULTIPART_SIZE = 5 * 1024 * 1024
+MAX_MULTIPART_SIZE = 5 * 1024 * 1024 * 1024
+MAX_POOL_CONNECTIONS = 100
+
+
+class ChecksumError(Exception):
+    """Raised when the local etags can't be calculated, hashlib refuses MD5 in FIPS mode"""
+
+
+class FileEntry:
+    """
+    A local file, and what we learn about it as it moves through the pipeline.
+
+    Unset fields are left out of to_dict(), so the returned file lists only
+    contain the keys filled in by the stages the file has been through.
+    """
+
+    __slots__ = (
+        "fullpath",
+        "chopped_path",
+        "modified_epoch",
+        "bytes",
+        "mime_type",
+        "encoding",
+        "s3_path",
+        "s3_head",
+        "local_etag",
+        "whytime",
+        "whysize",
+        "why",
+        "upload_seconds",
+    )
+
+    def __init__(self, fullpath, chopped_path, modified_epoch, size):
+        self.fullpath = fullpath
+        self.chopped_path = chopped_path
+        self.modified_epoch = modified_epoch
+        self.bytes = size
 
-def gather_files(fileroot, include=None, exclude=None):
-    ret = []
+    def get(self, name, default=None):
+        return getattr(self, name, default)
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__ if hasattr(self, name)}
+
+
+@contextmanager
+def open_etag_cache(cache_path):
+    if not cache_path:
+        yield None
+        return
+    with EtagCache(cache_path) as cache:
+        yield cache
 
+
+def compile_patterns(patterns):
+    """Compile comma-separated shell patterns into a single regular expression, or None"""
+    if not patterns:
+        return None
+    return re.compile("|".join(fnmatch.translate(os.path.normcase(x)) for x in patterns.split(",")))
+
+
+def _scan_tree(path, relpath, include, exclude):
+    subdirs = []
+    try:
+        entries = os.scandir(path)
+    except OSError:
+        # os.walk() silently skips the directories it can't list
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir():
+                subdirs.append(entry)
+                continue
+            fn = os.path.normcase(entry.name)
+            # include/exclude
+            if include and not include.match(fn):
+                # not on the include list, so we don't want it.
+                continue
+            if exclude and exclude.match(fn):
+                # skip it, even if previously included.
+                continue
+            fstat = entry.stat()
+            yield FileEntry(entry.path, os.path.join(relpath, entry.name), int(fstat.st_mtime), fstat.st_size)
+    # like os.walk(), descend after the directory's files and don't follow symlinks to directories
+    for entry in subdirs:
+        if not entry.is_symlink():
+            yield from _scan_tree(entry.path, os.path.join(relpath, entry.name), include, exclude)
+
+
+def gather_files(fileroot, include=None, exclude=None):
+    """Lazily yields a FileEntry for each file under fileroot"""
     if os.path.isfile(fileroot):
-        fullpath = fileroot
-        fstat = os.stat(fullpath)
-        path_array = fileroot.split("/")
-        chopped_path = path_array[-1]
-        f_size = fstat[osstat.ST_SIZE]
-        f_modified_epoch = fstat[osstat.ST_MTIME]
-        ret.append(
-            {
-                "fullpath": fullpath,
-                "chopped_path": chopped_path,
-                "modified_epoch": f_modified_epoch,
-                "bytes": f_size,
-            }
-        )
+        fstat = os.stat(fileroot)
+        chopped_path = fileroot.split("/")[-1]
+        yield FileEntry(fileroot, chopped_path, fstat[osstat.ST_MTIME], fstat[osstat.ST_SIZE])
+    elif os.path.isdir(fileroot):
+        yield from _scan_tree(fileroot, "", compile_patterns(include), compile_patterns(exclude))
 
-    else:
-        for dirpath, dirnames, filenames in os.walk(fileroot):
-            for fn in filenames:
-                fullpath = os.path.join(dirpath, fn)
-                # include/exclude
-                if include:
-                    found = False
-                    for x in include.split(","):
-                        if fnmatch.fnmatch(fn, x):
-                            found = True
-                    if not found:
-                        # not on the include list, so we don't want it.
-                        continue
-
-                if exclude:
-                    found = False
-                    for x in exclude.split(","):
-                        if fnmatch.fnmatch(fn, x):
-                            found = True
-                    if found:
-                        # skip it, even if previously included.
-                        continue
-
-                chopped_path = os.path.relpath(fullpath, start=fileroot)
-                fstat = os.stat(fullpath)
-                f_size = fstat[osstat.ST_SIZE]
-                f_modified_epoch = fstat[osstat.ST_MTIME]
-                ret.append(
-                    {
-                        "fullpath": fullpath,
-                        "chopped_path": chopped_path,
-                        "modified_epoch": f_modified_epoch,
-                        "bytes": f_size,
-                    }
-                )
-            # dirpath = path *to* the directory
-            # dirnames = subdirs *in* our directory
-            # filenames
-    return ret
+
+def snapshot_files(filelist, snapshot):
+    """Pass the entries through, recording their current state in snapshot unless it's None"""
+    for fileentry in filelist:
+        if snapshot is not None:
+            snapshot.append(fileentry.to_dict())
+        yield fileentry
 
 
 def calculate_s3_path(filelist, key_prefix=""):
-    ret = []
     for fileentry in filelist:
-        # don't modify the input dict
-        retentry = fileentry.copy()
-        retentry["s3_path"] = os.path.join(key_prefix, fileentry["chopped_path"])
-        ret.append(retentry)
-    return ret
+        fileentry.s3_path = os.path.join(key_prefix, fileentry.chopped_path)
+        yield fileentry
 
 
-def calculate_local_etag(filelist, key_prefix=""):
+def calculate_local_etag(filelist, chunk_size=DEFAULT_CHUNK_SIZE, cache=None, max_workers=None):
     """Really, "calculate md5", but since AWS uses their own format, we'll just call
-    it a "local etag". TODO optimization: only calculate if remote key exists."""
-    ret = []
-    for fileentry in filelist:
-        # don't modify the input dict
-        retentry = fileentry.copy()
-        retentry["local_etag"] = calculate_multipart_etag(fileentry["fullpath"])
-        ret.append(retentry)
-    return ret
+    it a "local etag".  Only calculated for files which have a remote object of the
+    same size, anything else needs to be uploaded whatever its checksum.  The
+    chunk size is inferred from the remote etag when it was uploaded in parts."""
+    needed = [entry for entry in filelist if entry.get("s3_head") and entry.s3_head["ContentLength"] == entry.bytes]
+    try:
+        etags = calculate_multipart_etags(
+            [(entry.fullpath, chunk_size, entry.s3_head["ETag"]) for entry in needed],
+            max_workers=max_workers,
+            cache=cache,
+        )
+    except ValueError as e:
+        raise ChecksumError(str(e)) from e
+    for entry, etag in zip(needed, etags):
+        entry.local_etag = etag
+    return filelist
 
 
 def determine_mimetypes(filelist, override_map):
-    ret = []
     for fileentry in filelist:
-        retentry = fileentry.copy()
-        localfile = fileentry["fullpath"]
+        localfile = fileentry.fullpath
 
         # reminder: file extension is '.txt', not 'txt'.
         file_extension = os.path.splitext(localfile)[1]
         if override_map and override_map.get(file_extension):
             # override? use it.
-            retentry["mime_type"] = override_map[file_extension]
+            fileentry.mime_type = override_map[file_extension]
         else:
             # else sniff it
-            retentry["mime_type"], retentry["encoding"] = mimetypes.guess_type(localfile, strict=False)
+            fileentry.mime_type, fileentry.encoding = mimetypes.guess_type(localfile, strict=False)
 
         # might be None or '' from one of the above. Not a great type but better than nothing.
-        if not retentry["mime_type"]:
-            retentry["mime_type"] = "application/octet-stream"
-
-        ret.append(retentry)
+        if not fileentry.mime_type:
+            fileentry.mime_type = "application/octet-stream"
 
-    return ret
+        yield fileentry
 
 
-def head_s3(s3, bucket, s3keys):
-    retkeys = []
-    for entry in s3keys:
-        retentry = entry.copy()
-        try:
-            retentry["s3_head"] = s3.head_object(Bucket=bucket, Key=entry["s3_path"])
-        # 404 (Missing) - File doesn't exist, we'll need to upload
-        # 403 (Denied) - Sometimes we can write but not read, assume we'll need to upload
-        except is_boto3_error_code(["404", "403"]):
-            pass
-        retkeys.append(retentry)
-    return retkeys
+def list_s3(s3, bucket, key_prefix, s3keys):
+    """
+    Index the remote objects we have local counterparts for.
 
+    A single list_objects_v2 page returns the ETag, size and modification
+    time of up to 1000 objects, which is everything the change strategies
+    compare, so listing the prefix once replaces a head_object call per file.
+    """
+    wanted = set(to_text(entry.s3_path) for entry in s3keys)
+    index = {}
+    paginator = s3.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=bucket, Prefix=key_prefix):
+        for obj in page.get("Contents", []):
+            if obj["Key"] in wanted:
+                index[obj["Key"]] = {
+                    "ETag": obj["ETag"],
+                    "ContentLength": obj["Size"],
+                    "LastModified": obj["LastModified"],
+                }
+    return index
+
+
+def _head_object(s3, bucket, key):
+    try:
+        return s3.head_object(Bucket=bucket, Key=key)
+    # 404 (Missing) - File doesn't exist, we'll need to upload
+    # 403 (Denied) - Sometimes we can write but not read, assume we'll need to upload
+    except is_boto3_error_code(["404", "403"]):
+        return None
 
-def filter_list(s3, bucket, s3filelist, strategy):
-    keeplist = list(s3filelist)
 
-    for e in keeplist:
-        e["_strategy"] = strategy
+def head_s3(s3, bucket, s3keys, key_prefix="", max_workers=DEFAULT_CONCURRENCY):
+    try:
+        index = list_s3(s3, bucket, key_prefix, s3keys)
+        heads = [index.get(to_text(entry.s3_path)) for entry in s3keys]
+    except is_boto3_error_code("AccessDenied"):
+        # We may be allowed to read the objects without being allowed to list
+        # the bucket, fall back to (concurrent) per-object requests.
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            heads = list(executor.map(lambda entry: _head_object(s3, bucket, entry.s3_path), s3keys))
+
+    for entry, head in zip(s3keys, heads):
+        if head is not None:
+            entry.s3_head = head
+    return s3keys
+
+
+def filter_list(
+    s3,
+    bucket,
+    s3filelist,
+    strategy,
+    key_prefix="",
+    max_concurrency=DEFAULT_CONCURRENCY,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    etag_cache=None,
+):
+    keeplist = s3filelist
 
     # init/fetch info from S3 if we're going to use it for comparisons
     if not strategy == "force":
-        keeplist = head_s3(s3, bucket, s3filelist)
+        keeplist = head_s3(s3, bucket, keeplist, key_prefix, max_concurrency)
 
     # now actually run the strategies
     if strategy == "checksum":
+        keeplist = calculate_local_etag(keeplist, chunk_size, etag_cache, max_concurrency)
+        # keep the entries whose etags don't match, or which we don't have an etag for.
+        return [
+            entry for entry in keeplist if entry.get("local_etag") is None or entry.s3_head["ETag"] != entry.local_etag
+        ]
+
+    if strategy == "date_size":
+        ret = []
+        epoch = datetime.datetime(1970, 1, 1, tzinfo=tz.tzutc())
         for entry in keeplist:
             if entry.get("s3_head"):
-                # since we have a remote s3 object, compare the values.
-                if entry["s3_head"]["ETag"] == entry["local_etag"]:
-                    # files match, so remove the entry
-                    entry["skip_flag"] = True
-                else:
-                    # file etags don't match, keep the entry.
-                    pass
-            else:  # we don't have an etag, so we'll keep it.
-                pass
-    elif strategy == "date_size":
-        for entry in keeplist:
-            if entry.get("s3_head"):
-                # fstat = entry['stat']
-                local_modified_epoch = entry["modified_epoch"]
-                local_size = entry["bytes"]
-
-                # py2's datetime doesn't have a timestamp() field, so we have to revert to something more awkward.
-                # remote_modified_epoch = entry['s3_head']['LastModified'].timestamp()
-                remote_modified_datetime = entry["s3_head"]["LastModified"]
-                delta = remote_modified_datetime - datetime.datetime(1970, 1, 1, tzinfo=tz.tzutc())
+                local_modified_epoch = entry.modified_epoch
+                local_size = entry.bytes
+
+                delta = entry.s3_head["LastModified"] - epoch
                 remote_modified_epoch = delta.seconds + (delta.days * 86400)
 
-                remote_size = entry["s3_head"]["ContentLength"]
+                remote_size = entry.s3_head["ContentLength"]
 
-                entry["whytime"] = f"{local_modified_epoch} / {remote_modified_epoch}"
-                entry["whysize"] = f"{local_size} / {remote_size}"
+                entry.whytime = f"{local_modified_epoch} / {remote_modified_epoch}"
+                entry.whysize = f"{local_size} / {remote_size}"
 
                 if local_modified_epoch <= remote_modified_epoch and local_size == remote_size:
-                    entry["skip_flag"] = True
+                    continue
             else:
-                entry["why"] = "no s3_head"
+                entry.why = "no s3_head"
+            ret.append(entry)
+        return ret
+
     # else: probably 'force'. Basically we don't skip with any with other strategies.
-    else:
-        pass
+    return list(keeplist)
+
+
+def _upload_file(s3, bucket, entry, params, config):
+    args = {"ContentType": entry.mime_type}
+    if params.get("permission"):
+        args["ACL"] = params["permission"]
+    if params.get("cache_control"):
+        args["CacheControl"] = params["cache_control"]
+    if params.get("storage_class"):
+        args["StorageClass"] = params["storage_class"]
+    start = time.monotonic()
+    s3.upload_file(entry.fullpath, bucket, entry.s3_path, ExtraArgs=args, Callback=None, Config=config)
+    entry.upload_seconds = round(time.monotonic() - start, 3)
+    return entry
+
+
+def part_concurrency(max_concurrency):
+    """
+    The number of parts of a single file uploaded in parallel.
 
-    # prune 'please skip' entries, if any.
-    return [x for x in keeplist if not x.get("skip_flag")]
+    Each of the max_concurrency files uploaded in parallel may itself upload
+    this many parts in parallel, all through the same client, so keep the
+    total within MAX_POOL_CONNECTIONS.
+    """
+    return max(1, min(max_concurrency, MAX_POOL_CONNECTIONS // max_concurrency))
 
 
 def upload_files(s3, bucket, filelist, params):
-    ret = []
-    for entry in filelist:
-        args = {"ContentType": entry["mime_type"]}
-        if params.get("permission"):
-            args["ACL"] = params["permission"]
-        if params.get("cache_control"):
-            args["CacheControl"] = params["cache_control"]
-        if params.get("storage_class"):
-            args["StorageClass"] = params["storage_class"]
-        # if this fails exception is caught in main()
-        s3.upload_file(entry["fullpath"], bucket, entry["s3_path"], ExtraArgs=args, Callback=None, Config=None)
-        ret.append(entry)
-    return ret
+    """
+    Upload the files using a pool of max_concurrency workers.
+
+    Returns a tuple of the uploaded entries, in the order of filelist, and
+    the aggregate statistics for the upload.
+    """
+    max_concurrency = params.get("max_concurrency", DEFAULT_CONCURRENCY)
+    config = TransferConfig(
+        max_concurrency=part_concurrency(max_concurrency),
+        multipart_threshold=params.get("multipart_threshold", DEFAULT_MULTIPART_SIZE),
+        multipart_chunksize=params.get("multipart_chunksize", DEFAULT_MULTIPART_SIZE),
+    )
+
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        futures = [executor.submit(_upload_file, s3, bucket, entry, params, config) for entry in filelist]
+        done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+        # Once an upload has failed the queued uploads aren't started, only
+        # the uploads already in flight finish
+        for future in not_done:
+            future.cancel()
+    elapsed = time.monotonic() - start
+
+    # if this fails exception is caught in main()
+    for future in done:
+        if future.exception() is not None:
+            raise future.exception()
+    ret = [future.result() for future in futures]
+
+    total_bytes = sum(entry.bytes for entry in ret)
+    stats = {
+        "files": len(ret),
+        "bytes": total_bytes,
+        "seconds": round(elapsed, 3),
+        "files_per_second": round(len(ret) / elapsed, 2) if elapsed else 0.0,
+        "bytes_per_second": round(total_bytes / elapsed, 2) if elapsed else 0.0,
+    }
+    return ret, stats
+
+
+def _keys_to_delete(pages, keep_keys):
+    """
+    Yields the keys listed in pages which aren't in keep_keys.
+
+    list_objects_v2 returns keys in UTF-8 binary order, so the listing is
+    merged against the sorted local keys a page at a time.  Should an S3
+    compatible endpoint return keys out of order, the remaining keys are
+    checked against a set instead.
+    """
+    keep = sorted(to_bytes(key, errors="surrogate_or_strict") for key in keep_keys)
+    keep_set = None
+    index = 0
+    previous = b""
+    for page in pages:
+        for obj in page.get("Contents", []):
+            key = to_bytes(obj["Key"], errors="surrogate_or_strict")
+            if keep_set is None and key < previous:
+                keep_set = set(keep)
+            previous = key
+            if keep_set is not None:
+                if key not in keep_set:
+                    yield obj["Key"]
+                continue
+            while index < len(keep) and keep[index] < key:
+                index += 1
+            if index == len(keep) or keep[index] != key:
+                yield obj["Key"]
+
+
+def _delete_batch(s3, bucket, keys):
+    """Returns a tuple of the keys deleted and the errors for the keys which couldn't be deleted"""
+    response = s3.delete_objects(Bucket=bucket, Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True})
+    errors = [
+        {"key": error["Key"], "code": error.get("Code"), "message": error.get("Message")}
+        for error in response.get("Errors", [])
+    ]
+    failed = set(error["key"] for error in errors)
+    return [key for key in keys if key not in failed], errors
 
 
 def remove_files(s3, sourcelist, params):
+    """
+    Delete the remote objects under key_prefix which don't have a local counterpart.
+
+    Returns a tuple of the number of objects deleted, their sorted keys (at
+    most delete_sample_size of them when it's set) and the errors for the
+    objects which couldn't be deleted.
+    """
     bucket = params.get("bucket")
     key_prefix = params.get("key_prefix")
+    max_concurrency = params.get("max_concurrency", DEFAULT_CONCURRENCY)
+    sample_size = params.get("delete_sample_size")
     paginator = s3.get_paginator("list_objects_v2")
-    current_keys = set(
-        x["Key"] for x in paginator.paginate(Bucket=bucket, Prefix=key_prefix).build_full_result().get("Contents", [])
-    )
-    keep_keys = set(to_text(source_file["s3_path"]) for source_file in sourcelist)
-    delete_keys = list(current_keys - keep_keys)
+    pages = paginator.paginate(Bucket=bucket, Prefix=key_prefix)
+    delete_keys = _keys_to_delete(pages, (source_file.s3_path for source_file in sourcelist))
+
+    count = 0
+    sample = []
+    failures = []
+
+    def collect(futures):
+        nonlocal count
+        for future in futures:
+            # if this fails exception is caught in main()
+            deleted, errors = future.result()
+            count += len(deleted)
+            failures.extend(errors)
+            if sample_size is None:
+                sample.extend(deleted)
+            else:
+                # keep the first keys, so that the sample doesn't depend on the order the batches complete in
+                sample[:] = heapq.nsmallest(sample_size, itertools.chain(sample, deleted))
 
-    # can delete 1000 objects at a time
-    groups_of_keys = [delete_keys[i:i + 1000] for i in range(0, len(delete_keys), 1000)]  # fmt:skip
-    for keys in groups_of_keys:
-        s3.delete_objects(Bucket=bucket, Delete={"Objects": [{"Key": key} for key in keys]})
+    # can delete 1000 objects at a time, the batches are deleted while the
+    # listing continues with at most max_concurrency batches in flight.
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        pending = set()
+        for keys in iter(lambda: list(itertools.islice(delete_keys, 1000)), []):
+            if len(pending) >= max_concurrency:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+            pending.add(executor.submit(_delete_batch, s3, bucket, keys))
+        collect(pending)
 
-    return delete_keys
+    sample.sort()
+    failures.sort(key=lambda error: error["key"])
+    return count, sample, failures
 
 
 def main():
@@ -486,6 +830,7 @@ def main():
         include=dict(required=False, default="*"),
         cache_control=dict(required=False, default=""),
         delete=dict(required=False, type="bool", default=False),
+        delete_sample_size=dict(required=False, type="int"),
         storage_class=dict(
             required=False,
             default="STANDARD",
@@ -500,6 +845,11 @@ def main():
                 "OUTPOSTS",
             ],
         ),
+        checksum_cache=dict(required=False, type="path"),
+        return_file_lists=dict(required=False, type="bool", default=True),
+        max_concurrency=dict(required=False, type="int", default=DEFAULT_CONCURRENCY),
+        multipart_threshold=dict(required=False, type="int", default=DEFAULT_MULTIPART_SIZE),
+        multipart_chunksize=dict(required=False, type="int", default=DEFAULT_MULTIPART_SIZE),
         # future options: encoding, metadata, retries
     )
 
@@ -510,40 +860,81 @@ def main():
     if not HAS_DATEUTIL:
         module.fail_json(msg="dateutil required for this module")
 
+    if module.params["max_concurrency"] < 1:
+        module.fail_json(msg="max_concurrency must be at least 1")
+    for name in ("multipart_threshold", "multipart_chunksize"):
+        if module.params[name] < MIN_MULTIPART_SIZE:
+            module.fail_json(msg=f"{name} must be at least {MIN_MULTIPART_SIZE} bytes (5 MiB)")
+    if module.params["multipart_chunksize"] > MAX_MULTIPART_SIZE:
+        module.fail_json(msg=f"multipart_chunksize must be at most {MAX_MULTIPART_SIZE} bytes (5 GiB)")
+    if module.params["delete_sample_size"] is not None and module.params["delete_sample_size"] < 0:
+        module.fail_json(msg="delete_sample_size must not be negative")
+
     result = {}
     mode = module.params["mode"]
 
+    max_concurrency = module.params["max_concurrency"]
+    max_pool_connections = min(max_concurrency * part_concurrency(max_concurrency), MAX_POOL_CONNECTIONS)
     try:
-        s3 = module.client("s3")
+        s3 = module.client("s3", config=botocore.config.Config(max_pool_connections=max_pool_connections))
     except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
         module.fail_json_aws(e, msg="Failed to connect to AWS")
 
     if mode == "push":
         try:
-            result["filelist_initial"] = gather_files(
+            snapshots = {}
+            if module.params["return_file_lists"]:
+                snapshots = {name: [] for name in ("filelist_initial", "filelist_typed", "filelist_s3")}
+
+            # The local files are streamed through the first stages, and only
+            # materialized once their S3 paths are known.
+            filelist = gather_files(
                 module.params["file_root"], exclude=module.params["exclude"], include=module.params["include"]
             )
-            result["filelist_typed"] = determine_mimetypes(result["filelist_initial"], module.params.get("mime_map"))
-            result["filelist_s3"] = calculate_s3_path(result["filelist_typed"], module.params["key_prefix"])
+            filelist = snapshot_files(filelist, snapshots.get("filelist_initial"))
+            filelist = determine_mimetypes(filelist, module.params.get("mime_map"))
+            filelist = snapshot_files(filelist, snapshots.get("filelist_typed"))
+            filelist = calculate_s3_path(filelist, module.params["key_prefix"])
+            filelist = list(snapshot_files(filelist, snapshots.get("filelist_s3")))
             try:
-                result["filelist_local_etag"] = calculate_local_etag(result["filelist_s3"])
-            except ValueError as e:
-                if module.params["file_change_strategy"] == "checksum":
-                    module.fail_json_aws(
-                        e,
-                        "Unable to calculate checksum.  If running in FIPS mode, you may need to use another file_change_strategy",
+                with open_etag_cache(module.params["checksum_cache"]) as cache:
+                    actionable = filter_list(
+                        s3,
+                        module.params["bucket"],
+                        filelist,
+                        module.params["file_change_strategy"],
+                        module.params["key_prefix"],
+                        module.params["max_concurrency"],
+                        module.params["multipart_chunksize"],
+                        cache,
                     )
-                result["filelist_local_etag"] = result["filelist_s3"].copy()
-            result["filelist_actionable"] = filter_list(
-                s3, module.params["bucket"], result["filelist_local_etag"], module.params["file_change_strategy"]
-            )
-            result["uploads"] = upload_files(s3, module.params["bucket"], result["filelist_actionable"], module.params)
+            except ChecksumError as e:
+                module.fail_json_aws(
+                    e,
+                    "Unable to calculate checksum.  If running in FIPS mode, you may need to use another file_change_strategy",
+                )
+            if module.params["return_file_lists"]:
+                result.update(snapshots)
+                # local etags are calculated lazily by filter_list()
+                result["filelist_local_etag"] = snapshots["filelist_s3"]
+                result["filelist_actionable"] = [entry.to_dict() for entry in actionable]
+
+            uploads, result["upload_stats"] = upload_files(s3, module.params["bucket"], actionable, module.params)
+            if module.params["return_file_lists"]:
+                result["uploads"] = [entry.to_dict() for entry in uploads]
 
             if module.params["delete"]:
-                result["removed"] = remove_files(s3, result["filelist_local_etag"], module.params)
+                result["removed_count"], result["removed"], result["delete_failures"] = remove_files(
+                    s3, filelist, module.params
+                )
+                if result["delete_failures"]:
+                    module.warn(
+                        f"Failed to delete {len(result['delete_failures'])} objects from {module.params['bucket']},"
+                        " see delete_failures for the errors"
+                    )
 
-            # mark changed if we actually upload something.
-            if result.get("uploads") or result.get("removed"):
+            # mark changed if we actually upload or remove something.
+            if uploads or result.get("removed_count"):
                 result["changed"] = True
             # result.update(filelist=actionable_filelist)
         except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
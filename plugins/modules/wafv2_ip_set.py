@@ -57,8 +57,20 @@ options:
         - When set to C(no), keep the existing addresses in place. Will modify and add, but will not delete.
       default: true
       type: bool
+    aggregate_addresses:
+      description:
+        - When set to C(true), adjacent and overlapping networks are collapsed into the smallest list
+          of CIDR blocks covering them before being uploaded, for example C(10.0.0.0/25) and C(10.0.0.128/25)
+          become C(10.0.0.0/24).
+        - This helps large lists of addresses fit within the quota of addresses per IP set.
+        - Only used when I(state=present).
+      default: false
+      type: bool
+      version_added: 9.0.0
 
 notes:
+  - Addresses are compared in their canonical CIDR form, C(10.0.0.1), C(10.0.0.1/32) and C( 10.0.0.1/32)
+    are the same address.
   - Support for I(purge_tags) was added in release 4.0.0.
 
 extends_documentation_fragment:
@@ -114,6 +126,8 @@ name:
   type: str
 """
 
+import ipaddress
+
 try:
     from botocore.exceptions import BotoCoreError
     from botocore.exceptions import ClientError
@@ -125,6 +139,7 @@ from ansible.module_utils.common.dict_transformations import camel_dict_to_snake
 from ansible_collections.amazon.aws.plugins.module_utils.tagging import ansible_dict_to_boto3_tag_list
 
 from ansible_collections.community.aws.plugins.module_utils.modules import AnsibleCommunityAWSModule as AnsibleAWSModule
+from ansible_collections.community.aws.plugins.module_utils.wafv2 import Wafv2NameIndex
 from ansible_collections.community.aws.plugins.module_utils.wafv2 import describe_wafv2_tags
 from ansible_collections.community.aws.plugins.module_utils.wafv2 import ensure_wafv2_tags
 
@@ -135,6 +150,7 @@ class IpSet:
         self.name = name
         self.scope = scope
         self.fail_json_aws = fail_json_aws
+        self.index = Wafv2NameIndex(wafv2, "ip_set", fail_json_aws)
         self.existing_set, self.id, self.locktoken, self.arn = self.get_set()
 
     def description(self):
@@ -174,6 +190,7 @@ class IpSet:
         except (BotoCoreError, ClientError) as e:
             self.fail_json_aws(e, msg="Failed to create wafv2 ip set.")
 
+        self.index.invalidate(self.scope)
         self.existing_set, self.id, self.locktoken, self.arn = self.get_set()
         return self._format_set(self.existing_set)
 
@@ -194,20 +211,13 @@ class IpSet:
         except (BotoCoreError, ClientError) as e:
             self.fail_json_aws(e, msg="Failed to update wafv2 ip set.")
 
+        self.index.invalidate(self.scope)
         self.existing_set, self.id, self.locktoken, self.arn = self.get_set()
         return self._format_set(self.existing_set)
 
     def get_set(self):
-        response = self.list()
         existing_set = None
-        id = None
-        arn = None
-        locktoken = None
-        for item in response.get("IPSets"):
-            if item.get("Name") == self.name:
-                id = item.get("Id")
-                locktoken = item.get("LockToken")
-                arn = item.get("ARN")
+        id, arn, locktoken = self.index.lookup(self.scope, self.name)
         if id:
             try:
                 existing_set = self.wafv2.get_ip_set(Name=self.name, Scope=self.scope, Id=id).get("IPSet")
@@ -218,46 +228,61 @@ class IpSet:
 
         return existing_set, id, locktoken, arn
 
-    def list(self, Nextmarker=None):
-        # there is currently no paginator for wafv2
-        req_obj = {"Scope": self.scope, "Limit": 100}
-        if Nextmarker:
-            req_obj["NextMarker"] = Nextmarker
 
-        try:
-            response = self.wafv2.list_ip_sets(**req_obj)
-            if response.get("NextMarker"):
-                response["IPSets"] += self.list(Nextmarker=response.get("NextMarker")).get("IPSets")
-        except (BotoCoreError, ClientError) as e:
-            self.fail_json_aws(e, msg="Failed to list wafv2 ip set.")
+def normalize_address(address):
+    """Returns the canonical CIDR form of an address, or the stripped address if it isn't valid"""
+    address = address.strip()
+    try:
+        return str(ipaddress.ip_network(address, strict=False))
+    except ValueError:
+        # Let the API complain about it
+        return address
+
 
-        return response
+def normalize_addresses(addresses):
+    """Returns the canonical CIDR form of the addresses, without duplicates and in their original order"""
+    return list(dict.fromkeys(normalize_address(address) for address in addresses or []))
 
 
-def compare(existing_set, addresses, purge_addresses, state):
+def aggregate_addresses(addresses):
+    """Collapses adjacent and overlapping networks into the smallest list of networks covering them"""
+    networks = {4: [], 6: []}
+    invalid = []
+    for address in addresses:
+        try:
+            network = ipaddress.ip_network(address, strict=False)
+        except ValueError:
+            invalid.append(address)
+            continue
+        networks[network.version].append(network)
+    collapsed = [str(n) for version in (4, 6) for n in ipaddress.collapse_addresses(networks[version])]
+    return collapsed + invalid
+
+
+def compare(existing_set, addresses, purge_addresses, state, aggregate=False):
     diff = False
     new_rules = []
-    existing_rules = existing_set.get("addresses")
+    existing_rules = existing_set.get("addresses") or []
+    # existing addresses by their canonical form
+    existing = dict((normalize_address(rule), rule) for rule in existing_rules)
+    requested = normalize_addresses(addresses)
     if state == "present":
         if purge_addresses:
-            new_rules = addresses
-            if sorted(addresses) != sorted(existing_set.get("addresses")):
-                diff = True
-
+            new_rules = requested
         else:
-            for requested_rule in addresses:
-                if requested_rule not in existing_rules:
-                    diff = True
-                    new_rules.append(requested_rule)
+            new_rules = [rule for rule in requested if rule not in existing] + list(existing)
 
-            new_rules += existing_rules
+        if aggregate:
+            new_rules = aggregate_addresses(new_rules)
+        diff = set(new_rules) != set(existing)
+        if not diff:
+            # Nothing to upload, keep the addresses the way AWS returned them
+            new_rules = existing_rules
     else:
         if purge_addresses and addresses:
-            for requested_rule in addresses:
-                if requested_rule in existing_rules:
-                    diff = True
-                    existing_rules.pop(existing_rules.index(requested_rule))
-            new_rules = existing_rules
+            requested = set(requested)
+            new_rules = [rule for normalized, rule in existing.items() if normalized not in requested]
+            diff = len(new_rules) != len(existing)
 
     return diff, new_rules
 
@@ -273,6 +298,7 @@ def main():
         tags=dict(type="dict", aliases=["resource_tags"]),
         purge_tags=dict(type="bool", default=True),
         purge_addresses=dict(type="bool", default=True),
+        aggregate_addresses=dict(type="bool", default=False),
     )
 
     module = AnsibleAWSModule(
@@ -290,6 +316,7 @@ def main():
     tags = module.params.get("tags")
     purge_tags = module.params.get("purge_tags")
     purge_addresses = module.params.get("purge_addresses")
+    aggregate = module.params.get("aggregate_addresses")
     check_mode = module.check_mode
 
     wafv2 = module.client("wafv2")
@@ -304,7 +331,7 @@ def main():
             tags_updated = ensure_wafv2_tags(
                 wafv2, ip_set.arn, tags, purge_tags, module.fail_json_aws, module.check_mode
             )
-            ips_updated, addresses = compare(ip_set.get(), addresses, purge_addresses, state)
+            ips_updated, addresses = compare(ip_set.get(), addresses, purge_addresses, state, aggregate)
             description_updated = bool(description) and ip_set.description() != description
             change = ips_updated or description_updated or tags_updated
             retval = ip_set.get()
@@ -315,6 +342,9 @@ def main():
             elif tags_updated:
                 retval, id, locktoken, arn = ip_set.get_set()
         else:
+            addresses = normalize_addresses(addresses)
+            if aggregate:
+                addresses = aggregate_addresses(addresses)
             if not check_mode:
                 retval = ip_set.create(
                     description=description, ip_address_version=ip_address_version, addresses=addresses, tags=tags
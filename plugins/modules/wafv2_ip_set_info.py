@@ -78,26 +78,10 @@ except ImportError:
 from ansible.module_utils.common.dict_transformations import camel_dict_to_snake_dict
 
 from ansible_collections.community.aws.plugins.module_utils.modules import AnsibleCommunityAWSModule as AnsibleAWSModule
+from ansible_collections.community.aws.plugins.module_utils.wafv2 import Wafv2NameIndex
 from ansible_collections.community.aws.plugins.module_utils.wafv2 import describe_wafv2_tags
 
 
-def list_ip_sets(wafv2, scope, fail_json_aws, Nextmarker=None):
-    # there is currently no paginator for wafv2
-    req_obj = {"Scope": scope, "Limit": 100}
-    if Nextmarker:
-        req_obj["NextMarker"] = Nextmarker
-
-    try:
-        response = wafv2.list_ip_sets(**req_obj)
-        if response.get("NextMarker"):
-            response["IPSets"] += list_ip_sets(wafv2, scope, fail_json_aws, Nextmarker=response.get("NextMarker")).get(
-                "IPSets"
-            )
-    except (BotoCoreError, ClientError) as e:
-        fail_json_aws(e, msg="Failed to list wafv2 ip set")
-    return response
-
-
 def get_ip_set(wafv2, name, scope, id, fail_json_aws):
     try:
         response = wafv2.get_ip_set(Name=name, Scope=scope, Id=id)
@@ -122,14 +106,7 @@ def main():
     wafv2 = module.client("wafv2")
 
     # check if ip set exist
-    response = list_ip_sets(wafv2, scope, module.fail_json_aws)
-
-    id = None
-
-    for item in response.get("IPSets"):
-        if item.get("Name") == name:
-            id = item.get("Id")
-            arn = item.get("ARN")
+    id, arn, _locktoken = Wafv2NameIndex(wafv2, "ip_set", module.fail_json_aws).lookup(scope, name)
 
     retval = {}
     existing_set = None
@@ -68,7 +68,7 @@ except ImportError:
 from ansible.module_utils.common.dict_transformations import camel_dict_to_snake_dict
 
 from ansible_collections.community.aws.plugins.module_utils.modules import AnsibleCommunityAWSModule as AnsibleAWSModule
-from ansible_collections.community.aws.plugins.module_utils.wafv2 import wafv2_list_web_acls
+from ansible_collections.community.aws.plugins.module_utils.wafv2 import Wafv2NameIndex
 
 
 def get_web_acl(wafv2, name, scope, id, fail_json_aws):
@@ -127,16 +127,10 @@ def main():
 
     # check if web acl exists
 
-    response = wafv2_list_web_acls(wafv2, scope, module.fail_json_aws)
-
-    id = None
+    id, _arn, _locktoken = Wafv2NameIndex(wafv2, "web_acl", module.fail_json_aws).lookup(scope, name)
     retval = {}
     change = False
 
-    for item in response.get("WebACLs"):
-        if item.get("Name") == name:
-            id = item.get("Id")
-
     if id:
         existing_acl = get_web_acl(wafv2, name, scope, id, module.fail_json_aws)
         waf_arn = existing_acl.get("WebACL").get("ARN")
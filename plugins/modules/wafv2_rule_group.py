@@ -209,10 +209,10 @@ from ansible.module_utils.common.dict_transformations import snake_dict_to_camel
 from ansible_collections.amazon.aws.plugins.module_utils.tagging import ansible_dict_to_boto3_tag_list
 
 from ansible_collections.community.aws.plugins.module_utils.modules import AnsibleCommunityAWSModule as AnsibleAWSModule
+from ansible_collections.community.aws.plugins.module_utils.wafv2 import Wafv2NameIndex
 from ansible_collections.community.aws.plugins.module_utils.wafv2 import compare_priority_rules
 from ansible_collections.community.aws.plugins.module_utils.wafv2 import describe_wafv2_tags
 from ansible_collections.community.aws.plugins.module_utils.wafv2 import ensure_wafv2_tags
-from ansible_collections.community.aws.plugins.module_utils.wafv2 import wafv2_list_rule_groups
 from ansible_collections.community.aws.plugins.module_utils.wafv2 import wafv2_snake_dict_to_camel_dict
 
 
@@ -223,6 +223,7 @@ class RuleGroup:
         self.name = name
         self.scope = scope
         self.fail_json_aws = fail_json_aws
+        self.index = Wafv2NameIndex(wafv2, "rule_group", fail_json_aws)
         self.existing_group = self.get_group()
 
     def update(self, description, rules, sampled_requests, cloudwatch_metrics, metric_name):
@@ -250,13 +251,7 @@ class RuleGroup:
 
     def get_group(self):
         if self.id is None:
-            response = self.list()
-
-            for item in response.get("RuleGroups"):
-                if item.get("Name") == self.name:
-                    self.id = item.get("Id")
-                    self.locktoken = item.get("LockToken")
-                    self.arn = item.get("ARN")
+            self.id, self.arn, self.locktoken = self.index.lookup(self.scope, self.name)
 
         return self.refresh_group()
 
@@ -275,9 +270,6 @@ class RuleGroup:
 
         return existing_group
 
-    def list(self):
-        return wafv2_list_rule_groups(self.wafv2, self.scope, self.fail_json_aws)
-
     def get(self):
         if self.existing_group:
             return self.existing_group
@@ -316,6 +308,7 @@ class RuleGroup:
         except (BotoCoreError, ClientError) as e:
             self.fail_json_aws(e, msg="Failed to create wafv2 rule group.")
 
+        self.index.invalidate(self.scope)
         self.existing_group = self.get_group()
 
         return self.existing_group
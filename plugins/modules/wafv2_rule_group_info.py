@@ -95,8 +95,8 @@ except ImportError:
 from ansible.module_utils.common.dict_transformations import camel_dict_to_snake_dict
 
 from ansible_collections.community.aws.plugins.module_utils.modules import AnsibleCommunityAWSModule as AnsibleAWSModule
+from ansible_collections.community.aws.plugins.module_utils.wafv2 import Wafv2NameIndex
 from ansible_collections.community.aws.plugins.module_utils.wafv2 import describe_wafv2_tags
-from ansible_collections.community.aws.plugins.module_utils.wafv2 import wafv2_list_rule_groups
 
 
 def get_rule_group(wafv2, name, scope, id, fail_json_aws):
@@ -124,15 +124,9 @@ def main():
     wafv2 = module.client("wafv2")
 
     # check if rule group exists
-    response = wafv2_list_rule_groups(wafv2, scope, module.fail_json_aws)
-    id = None
+    id, arn, _locktoken = Wafv2NameIndex(wafv2, "rule_group", module.fail_json_aws).lookup(scope, name)
     retval = {}
 
-    for item in response.get("RuleGroups"):
-        if item.get("Name") == name:
-            id = item.get("Id")
-            arn = item.get("ARN")
-
     existing_group = None
     if id:
         existing_group = get_rule_group(wafv2, name, scope, id, module.fail_json_aws)
@@ -322,10 +322,10 @@ from ansible.module_utils.common.dict_transformations import snake_dict_to_camel
 from ansible_collections.amazon.aws.plugins.module_utils.tagging import ansible_dict_to_boto3_tag_list
 
 from ansible_collections.community.aws.plugins.module_utils.modules import AnsibleCommunityAWSModule as AnsibleAWSModule
+from ansible_collections.community.aws.plugins.module_utils.wafv2 import Wafv2NameIndex
 from ansible_collections.community.aws.plugins.module_utils.wafv2 import compare_priority_rules
 from ansible_collections.community.aws.plugins.module_utils.wafv2 import describe_wafv2_tags
 from ansible_collections.community.aws.plugins.module_utils.wafv2 import ensure_wafv2_tags
-from ansible_collections.community.aws.plugins.module_utils.wafv2 import wafv2_list_web_acls
 from ansible_collections.community.aws.plugins.module_utils.wafv2 import wafv2_snake_dict_to_camel_dict
 
 
@@ -335,6 +335,7 @@ class WebACL:
         self.name = name
         self.scope = scope
         self.fail_json_aws = fail_json_aws
+        self.index = Wafv2NameIndex(wafv2, "web_acl", fail_json_aws)
         self.existing_acl, self.id, self.locktoken = self.get_web_acl()
 
     def update(
@@ -372,6 +373,7 @@ class WebACL:
         except (BotoCoreError, ClientError) as e:
             self.fail_json_aws(e, msg="Failed to update wafv2 web acl.")
 
+        self.index.invalidate(self.scope)
         self.existing_acl, self.id, self.locktoken = self.get_web_acl()
         return self.existing_acl
 
@@ -388,17 +390,8 @@ class WebACL:
         return None
 
     def get_web_acl(self):
-        id = None
-        locktoken = None
-        arn = None
         existing_acl = None
-        response = self.list()
-
-        for item in response.get("WebACLs"):
-            if item.get("Name") == self.name:
-                id = item.get("Id")
-                locktoken = item.get("LockToken")
-                arn = item.get("ARN")
+        id, arn, locktoken = self.index.lookup(self.scope, self.name)
 
         if id:
             try:
@@ -409,9 +402,6 @@ class WebACL:
             existing_acl["tags"] = tags
         return existing_acl, id, locktoken
 
-    def list(self):
-        return wafv2_list_web_acls(self.wafv2, self.scope, self.fail_json_aws)
-
     def create(
         self,
         default_action,
@@ -447,6 +437,7 @@ class WebACL:
         except (BotoCoreError, ClientError) as e:
             self.fail_json_aws(e, msg="Failed to create wafv2 web acl.")
 
+        self.index.invalidate(self.scope)
         self.existing_acl, self.id, self.locktoken = self.get_web_acl()
         return self.existing_acl
 
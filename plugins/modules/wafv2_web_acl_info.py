@@ -97,8 +97,8 @@ except ImportError:
 from ansible.module_utils.common.dict_transformations import camel_dict_to_snake_dict
 
 from ansible_collections.community.aws.plugins.module_utils.modules import AnsibleCommunityAWSModule as AnsibleAWSModule
+from ansible_collections.community.aws.plugins.module_utils.wafv2 import Wafv2NameIndex
 from ansible_collections.community.aws.plugins.module_utils.wafv2 import describe_wafv2_tags
-from ansible_collections.community.aws.plugins.module_utils.wafv2 import wafv2_list_web_acls
 
 
 def get_web_acl(wafv2, name, scope, id, fail_json_aws):
@@ -126,17 +126,9 @@ def main():
 
     wafv2 = module.client("wafv2")
     # check if web acl exists
-    response = wafv2_list_web_acls(wafv2, scope, module.fail_json_aws)
-
-    id = None
-    arn = None
+    id, arn, _locktoken = Wafv2NameIndex(wafv2, "web_acl", module.fail_json_aws).lookup(scope, name)
     retval = {}
 
-    for item in response.get("WebACLs"):
-        if item.get("Name") == name:
-            id = item.get("Id")
-            arn = item.get("ARN")
-
     if id:
         existing_acl = get_web_acl(wafv2, name, scope, id, module.fail_json_aws)
         retval = camel_dict_to_snake_dict(existing_acl.get("WebACL"))
@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the Ansible project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Persistent SSM sessions shared across tasks and forks.
+
+A pooled session is owned by a small detached process, in the same spirit as
+OpenSSH's ControlPersist.  The process starts the session-manager-plugin,
+prepares the terminal once and then relays the terminal over a local UNIX
+socket.  Clients attach to the socket one at a time, so later tasks skip both
+the StartSession API call and the terminal handshake.  When nobody has attached
+for ``idle_timeout`` seconds the process terminates the SSM session and exits.
+"""
+
+import fcntl
+import hashlib
+import os
+import select
+import signal
+import socket
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any
+from typing import Callable
+from typing import Iterator
+from typing import Optional
+from typing import Tuple
+
+from ansible.module_utils._text import to_bytes
+from ansible.module_utils._text import to_text
+
+BUFFER_SIZE = 65536
+
+
+def session_pool_key(instance_id: str, region: str, profile: str, document: str) -> str:
+    """Return a stable identifier for the (instance_id, region, profile, document) tuple"""
+    raw = "\0".join([instance_id or "", region or "", profile or "", document or ""])
+    return hashlib.sha1(to_bytes(raw, errors="surrogate_or_strict")).hexdigest()[:20]
+
+
+def session_pool_path(pool_dir: str, key: str) -> str:
+    """Return the control socket path used for a pooled session, creating its directory if needed"""
+    pool_dir = os.path.expanduser(pool_dir)
+    os.makedirs(pool_dir, mode=0o700, exist_ok=True)
+    return os.path.join(pool_dir, f"ssm-{key}")
+
+
+@contextmanager
+def session_pool_lock(socket_path: str) -> Iterator[None]:
+    """Serialize the check-then-spawn sequence between forks targeting the same session"""
+    with open(f"{socket_path}.lock", "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+class _SocketWriter:
+    """Minimal file-like writer, mirrors the unbuffered stdin pipe of a Popen object"""
+
+    def __init__(self, sock: socket.socket) -> None:
+        self._sock = sock
+
+    def write(self, data: bytes) -> int:
+        self._sock.sendall(data)
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+
+class PooledSession:
+    """
+    Client side of a pooled session.
+
+    Exposes the subset of the subprocess.Popen interface used by the aws_ssm
+    connection plugin (stdin, stdout, stderr, poll() and terminate()) so that the
+    rest of the plugin doesn't need to know whether the terminal is pooled.
+    """
+
+    def __init__(self, sock: socket.socket) -> None:
+        self._sock = sock
+        self.stdin = _SocketWriter(sock)
+        self.stdout = sock.makefile("rb", buffering=0)
+        self.stderr = None
+        self.returncode = None
+        self.session_id = None
+        self.server_pid = None
+
+    def handshake(self, timeout: Optional[float]) -> bool:
+        """Wait for the pool process to accept us and read the session ID"""
+        self._sock.settimeout(timeout)
+        line = b""
+        try:
+            while not line.endswith(b"\n"):
+                data = self._sock.recv(1)
+                if not data:
+                    return False
+                line += data
+        except OSError:
+            return False
+        finally:
+            self._sock.settimeout(None)
+
+        try:
+            session_id, server_pid = to_text(line).split()
+            self.server_pid = int(server_pid)
+        except ValueError:
+            return False
+        self.session_id = session_id
+        return True
+
+    def poll(self) -> Optional[int]:
+        """Return None while the pool process is still attached to us"""
+        if self.returncode is None:
+            try:
+                readable, _, _ = select.select([self._sock], [], [], 0)
+                if readable and not self._sock.recv(1, socket.MSG_PEEK):
+                    self.returncode = 0
+            except OSError:
+                self.returncode = -1
+        return self.returncode
+
+    def terminate(self) -> None:
+        """Evict the pooled session, the pool process will terminate the SSM session"""
+        if self.server_pid:
+            try:
+                os.kill(self.server_pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        self.close()
+
+    def close(self) -> None:
+        """Detach from the pooled session, leaving it available for the next client"""
+        if self.returncode is None:
+            self.returncode = 0
+        self.stdout.close()
+        self._sock.close()
+
+
+def connect_session_pool(socket_path: str) -> Optional[PooledSession]:
+    """Connect to a pool process, returns None if nothing is listening on socket_path"""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+    except (FileNotFoundError, ConnectionRefusedError):
+        sock.close()
+        return None
+    return PooledSession(sock)
+
+
+class SessionPoolServer:
+    """Relay a single SSM terminal between the session-manager-plugin and a UNIX socket"""
+
+    def __init__(self, socket_path: str, session: Any, stdout: Any, session_id: str, idle_timeout: int) -> None:
+        self.socket_path = socket_path
+        self.session_id = session_id
+        self.idle_timeout = idle_timeout
+        self._session = session
+        self._stdout = stdout
+        self._listener = None
+
+    def bind(self) -> None:
+        try:
+            os.unlink(self.socket_path)
+        except FileNotFoundError:
+            pass
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        old_umask = os.umask(0o177)
+        try:
+            listener.bind(self.socket_path)
+        finally:
+            os.umask(old_umask)
+        listener.listen(16)
+        self._listener = listener
+
+    def serve(self) -> None:
+        try:
+            self._relay()
+        finally:
+            self._listener.close()
+            try:
+                os.unlink(self.socket_path)
+            except FileNotFoundError:
+                pass
+
+    def _relay(self) -> None:
+        handshake = to_bytes(f"{self.session_id} {os.getpid()}\n")
+        stdout_fd = self._stdout.fileno()
+        stderr_fd = self._session.stderr.fileno()
+        client = None
+        idle_since = time.monotonic()
+
+        while self._session.poll() is None:
+            # While a client is attached the listener is left out of the select,
+            # other clients queue up in the listen backlog until we're free.
+            readers = [stdout_fd, stderr_fd, client or self._listener]
+            readable, _, _ = select.select(readers, [], [], 1)
+
+            if stdout_fd in readable:
+                try:
+                    data = os.read(stdout_fd, BUFFER_SIZE)
+                except OSError:
+                    data = b""
+                if not data:
+                    return
+                # Output produced while nobody is attached is discarded, the
+                # markers used by exec_command make sure we never miss anything
+                if client is not None:
+                    try:
+                        client.sendall(data)
+                    except OSError:
+                        client.close()
+                        client = None
+                        idle_since = time.monotonic()
+
+            if stderr_fd in readable and not os.read(stderr_fd, BUFFER_SIZE):
+                return
+
+            if client is not None and client in readable:
+                try:
+                    data = client.recv(BUFFER_SIZE)
+                except OSError:
+                    data = b""
+                if data:
+                    self._session.stdin.write(data)
+                else:
+                    client.close()
+                    client = None
+                    idle_since = time.monotonic()
+            elif client is None and self._listener in readable:
+                client, _addr = self._listener.accept()
+                try:
+                    client.sendall(handshake)
+                except OSError:
+                    client.close()
+                    client = None
+
+            if client is None and time.monotonic() - idle_since > self.idle_timeout:
+                return
+
+
+def _raise_system_exit(signum: int, frame: Any) -> None:
+    sys.exit(0)
+
+
+def spawn_session_pool(
+    socket_path: str,
+    start_session: Callable[[], Tuple[Any, Any, str]],
+    close_session: Callable[[], None],
+    idle_timeout: int,
+) -> Optional[str]:
+    """
+    Fork a detached process which owns a new SSM session and serves it on socket_path.
+
+    start_session is called in the detached process and must return a tuple of
+    (session process, stdout file object, session ID).  close_session is called in the
+    detached process once the pooled session is evicted.
+
+    Returns None once the socket is ready for connections, or an error message.
+    """
+    ready_r, ready_w = os.pipe()
+    pid = os.fork()
+    if pid:
+        os.close(ready_w)
+        os.waitpid(pid, 0)
+        with os.fdopen(ready_r, "rb") as ready:
+            status = to_text(ready.readline()).strip()
+        if status == "OK":
+            return None
+        return status or "session pool process exited before it was ready"
+
+    # Intermediate child, detach from the worker's session and fork again so
+    # the pool process is reparented to init.
+    try:
+        os.close(ready_r)
+        os.setsid()
+        if os.fork():
+            os._exit(0)
+
+        devnull = os.open(os.devnull, os.O_RDWR)
+        for fd in (0, 1, 2):
+            os.dup2(devnull, fd)
+        os.close(devnull)
+        signal.signal(signal.SIGTERM, _raise_system_exit)
+        signal.signal(signal.SIGHUP, signal.SIG_IGN)
+
+        try:
+            session, stdout, session_id = start_session()
+            server = SessionPoolServer(socket_path, session, stdout, session_id, idle_timeout)
+            server.bind()
+        except BaseException as e:  # pylint: disable=broad-except
+            os.write(ready_w, to_bytes(f"{type(e).__name__}: {e}\n", errors="surrogate_or_strict"))
+            raise
+
+        os.write(ready_w, b"OK\n")
+        os.close(ready_w)
+        try:
+            server.serve()
+        finally:
+            close_session()
+    finally:
+        os._exit(0)
@@ -1,11 +1,15 @@
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 
+import os
+import shutil
+import subprocess
 from io import StringIO
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
 import pytest
 
+from ansible.errors import AnsibleError
 from ansible.playbook.play_context import PlayContext
 from ansible.plugins.loader import connection_loader
 
@@ -120,24 +124,87 @@ class TestConnectionBaseClass:
     #     boto3.generate_presigned_url.return_value = MagicMock()
     #     return (boto3.generate_presigned_url.return_value)
 
+    @patch("os.path.getsize")
     @patch("os.path.exists")
-    def test_plugins_connection_aws_ssm_put_file(self, mock_ospe):
+    def test_plugins_connection_aws_ssm_put_file(self, mock_ospe, mock_getsize):
         pc = PlayContext()
         new_stdin = StringIO()
         conn = connection_loader.get("community.aws.aws_ssm", pc, new_stdin)
         conn._connect = MagicMock()
+        conn.get_option = MagicMock(return_value=0)
+        mock_getsize.return_value = 1024
         conn._file_transport_command = MagicMock()
         conn._file_transport_command.return_value = (0, "stdout", "stderr")
         conn.put_file("/in/file", "/out/file")
+        conn._file_transport_command.assert_called_once_with("/in/file", "/out/file", "put")
 
-    def test_plugins_connection_aws_ssm_fetch_file(self):
+    @patch("os.path.getsize")
+    def test_plugins_connection_aws_ssm_fetch_file(self, mock_getsize):
         pc = PlayContext()
         new_stdin = StringIO()
         conn = connection_loader.get("community.aws.aws_ssm", pc, new_stdin)
         conn._connect = MagicMock()
+        conn.get_option = MagicMock(return_value=0)
         conn._file_transport_command = MagicMock()
         conn._file_transport_command.return_value = (0, "stdout", "stderr")
         conn.fetch_file("/in/file", "/out/file")
+        conn._file_transport_command.assert_called_once_with("/in/file", "/out/file", "get")
+
+    @pytest.mark.parametrize("content", [b"", b"hello", os.urandom(5000)])
+    def test_plugins_connection_aws_ssm_inline_put_commands(self, tmp_path, content):
+        pc = PlayContext()
+        new_stdin = StringIO()
+        conn = connection_loader.get("community.aws.aws_ssm", pc, new_stdin)
+        in_path = tmp_path / "in"
+        in_path.write_bytes(content)
+        out_path = tmp_path / "out"
+
+        commands = conn._inline_put_commands(str(in_path), str(out_path))
+        assert len(commands) == 1
+        assert max(len(line) for line in commands[0].splitlines()) <= 1024
+
+        # Run the command the same way _wrap_command does
+        result = subprocess.run(["sh", "-c", f"echo | {commands[0]};"], check=False)
+        assert result.returncode == 0
+        assert out_path.read_bytes() == content
+
+    @patch("os.path.getsize")
+    @patch("os.path.exists")
+    def test_plugins_connection_aws_ssm_put_file_inline(self, mock_ospe, mock_getsize):
+        pc = PlayContext()
+        new_stdin = StringIO()
+        conn = connection_loader.get("community.aws.aws_ssm", pc, new_stdin)
+        conn._connect = MagicMock()
+        conn.get_option = MagicMock(return_value=131072)
+        mock_getsize.return_value = 10000
+        conn._file_transport_command = MagicMock()
+        conn._inline_put_file = MagicMock(return_value=(0, "", ""))
+        conn.put_file("/in/file", "/out/file")
+        conn._inline_put_file.assert_called_once_with("/in/file", "/out/file")
+        conn._file_transport_command.assert_not_called()
+
+        # Windows hosts only receive files which fit in a single command
+        conn.is_windows = True
+        conn.put_file("/in/file", "/out/file")
+        conn._file_transport_command.assert_called_once_with("/in/file", "/out/file", "put")
+
+    def test_plugins_connection_aws_ssm_fetch_file_inline(self, tmp_path):
+        pc = PlayContext()
+        new_stdin = StringIO()
+        conn = connection_loader.get("community.aws.aws_ssm", pc, new_stdin)
+        conn._connect = MagicMock()
+        conn.get_option = MagicMock(return_value=131072)
+        conn._file_transport_command = MagicMock()
+        conn.exec_command = MagicMock(return_value=(0, "11\r\r\naGVsbG8g\r\r\nd29ybGQ=\r\r", ""))
+        out_path = tmp_path / "out"
+        assert conn.fetch_file("/in/file", str(out_path)) == (0, "", "")
+        assert out_path.read_bytes() == b"hello world"
+        conn._file_transport_command.assert_not_called()
+
+        # Too large to be sent over the session
+        conn.exec_command.return_value = (1, "", "")
+        conn.fetch_file("/in/file", str(out_path))
+        conn._file_transport_command.assert_called_once_with("/in/file", str(out_path), "get")
 
     @patch("subprocess.check_output")
     @patch("boto3.client")
@@ -178,3 +245,152 @@ class TestConnectionBaseClass:
         conn._session_id.return_value = "a"
         conn._client = MagicMock()
         conn.close()
+
+    def test_plugins_connection_aws_ssm_close_pooled(self):
+        pc = PlayContext()
+        new_stdin = StringIO()
+        conn = connection_loader.get("community.aws.aws_ssm", pc, new_stdin)
+        conn.instance_id = "i-12345"
+        conn._session_id = "s1"
+        conn._session_pooled = True
+        conn._session = MagicMock()
+        conn._client = MagicMock()
+        conn.close()
+        conn._session.close.assert_called_once_with()
+        conn._session.terminate.assert_not_called()
+        conn._client.terminate_session.assert_not_called()
+        assert conn._session_id == ""
+        assert not conn._session_pooled
+
+    def test_plugins_connection_aws_ssm_check_pooled_terminal(self):
+        pc = PlayContext()
+        new_stdin = StringIO()
+        conn = connection_loader.get("community.aws.aws_ssm", pc, new_stdin)
+        conn.MARK_LENGTH = 4
+        conn.get_option = MagicMock(return_value=5)
+        conn._session = MagicMock()
+        conn._session.poll.return_value = None
+        conn._poll_stdout = MagicMock()
+        conn._poll_stdout.poll.return_value = True
+        conn._stdout = MagicMock()
+        with patch("random.choice", side_effect=["a", "b", "c", "d"]):
+            conn._stdout.read.side_effect = [b"leftover\r\n", b"ab", b"cd\r\n"]
+            assert conn._check_pooled_terminal()
+        conn._session.stdin.write.assert_called_once_with(b"printf '%s%s\\n' 'ab' 'cd'\n")
+
+    @pytest.mark.parametrize("read_size", [1, 7, 65536])
+    def test_plugins_connection_aws_ssm_read_command_output(self, read_size):
+        pc = PlayContext()
+        new_stdin = StringIO()
+        conn = connection_loader.get("community.aws.aws_ssm", pc, new_stdin)
+        conn.get_option = MagicMock(return_value=5)
+        conn.READ_SIZE = read_size
+        conn._poll_stdout = MagicMock()
+        conn._poll_stdout.poll.return_value = True
+        session = MagicMock()
+        session.poll.return_value = None
+
+        output = b"leftover\r\r\nSTART\r\r\nline 1\r\r\nline 2\r\r\n\r\r\n0\r\r\nEND\r\r\nignored"
+        stdout_r, stdout_w = os.pipe()
+        os.write(stdout_w, output)
+        os.close(stdout_w)
+        with os.fdopen(stdout_r, "rb", 0) as stdout:
+            conn._stdout = stdout
+            stdout = conn._read_command_output(session, "START", "END")
+
+        assert stdout == "line 1\r\r\nline 2\r\r\n\r\r\n0\r\r\n"
+        assert conn._post_process(stdout, "START") == (0, "line 1\r\r\nline 2\r\r")
+
+    @pytest.mark.parametrize(
+        "chunksize, size, expected",
+        [
+            (16 * 1024 * 1024, 100 * 1024 * 1024, 16 * 1024 * 1024),
+            (1024, 100 * 1024 * 1024, 5 * 1024 * 1024),
+            (6 * 1024 * 1024 + 1, 100 * 1024 * 1024, 7 * 1024 * 1024),
+            (16 * 1024 * 1024, 500 * 1024 * 1024 * 1024, 52 * 1024 * 1024),
+        ],
+    )
+    def test_plugins_connection_aws_ssm_multipart_part_size(self, chunksize, size, expected):
+        pc = PlayContext()
+        new_stdin = StringIO()
+        conn = connection_loader.get("community.aws.aws_ssm", pc, new_stdin)
+        conn.get_option = MagicMock(return_value=chunksize)
+        assert conn._multipart_part_size(size) == expected
+
+    @pytest.mark.skipif(not shutil.which("curl"), reason="requires curl")
+    def test_plugins_connection_aws_ssm_multipart_commands(self, tmp_path):
+        pc = PlayContext()
+        new_stdin = StringIO()
+        conn = connection_loader.get("community.aws.aws_ssm", pc, new_stdin)
+        conn.get_option = MagicMock(return_value=2)
+        part_size = 5 * 1024 * 1024
+        size = 2 * part_size + 1234
+        content = os.urandom(size)
+        src = tmp_path / "src"
+        src.write_bytes(content)
+
+        # curl supports ranged reads from, and uploads to, file:// URLs
+        conn._get_url = MagicMock(return_value=f"file://{src}")
+        commands = conn._generate_multipart_get_commands("bucket", "key", str(tmp_path / "out"), size, part_size)
+        for command in commands:
+            assert subprocess.run(["sh", "-c", f"echo | {command};"], check=False).returncode == 0
+        assert (tmp_path / "out").read_bytes() == content
+
+        conn._get_url = MagicMock(
+            side_effect=lambda *args, extra_args: f"file://{tmp_path}/part-{extra_args['PartNumber']}"
+        )
+        commands = conn._generate_multipart_put_commands("bucket", "key", "upload", str(src), size, part_size)
+        assert len(commands) == 2
+        for command in commands:
+            assert subprocess.run(["sh", "-c", f"echo | {command};"], check=False).returncode == 0
+        assert b"".join((tmp_path / f"part-{number}").read_bytes() for number in (1, 2, 3)) == content
+
+        conn._get_url = MagicMock(return_value=f"file://{tmp_path}/missing")
+        commands = conn._generate_multipart_get_commands("bucket", "key", str(tmp_path / "out"), size, part_size)
+        assert subprocess.run(["sh", "-c", f"echo | {commands[0]};"], check=False).returncode != 0
+
+    def test_plugins_connection_aws_ssm_multipart_fetch(self, tmp_path):
+        pc = PlayContext()
+        new_stdin = StringIO()
+        conn = connection_loader.get("community.aws.aws_ssm", pc, new_stdin)
+        conn.instance_id = "i-12345"
+        options = {
+            "bucket_name": "bucket",
+            "bucket_sse_mode": None,
+            "reconnection_retries": 0,
+            "s3_max_concurrency": 10,
+            "s3_multipart_chunksize": 5 * 1024 * 1024,
+            "s3_multipart_threshold": 5 * 1024 * 1024,
+        }
+        conn.get_option = MagicMock(side_effect=options.get)
+        conn._s3_client = MagicMock()
+        conn._s3_client.create_multipart_upload.return_value = {"UploadId": "upload"}
+        conn._s3_client.get_paginator.return_value.paginate.return_value = [
+            {"Parts": [{"PartNumber": 1, "ETag": '"a"', "Size": 1}, {"PartNumber": 2, "ETag": '"b"', "Size": 1}]},
+        ]
+        conn._get_url = MagicMock(return_value="https://url")
+        conn._exec_transport_commands = MagicMock(return_value=(0, "", ""))
+        out_path = str(tmp_path / "out")
+
+        conn._multipart_file_transport_command("/in/file", out_path, "get", 6 * 1024 * 1024)
+
+        conn._s3_client.create_multipart_upload.assert_called_once_with(Bucket="bucket", Key=f"i-12345/{out_path}")
+        conn._s3_client.complete_multipart_upload.assert_called_once_with(
+            Bucket="bucket",
+            Key=f"i-12345/{out_path}",
+            UploadId="upload",
+            MultipartUpload={"Parts": [{"ETag": '"a"', "PartNumber": 1}, {"ETag": '"b"', "PartNumber": 2}]},
+        )
+        conn._s3_client.abort_multipart_upload.assert_not_called()
+        conn._s3_client.download_fileobj.assert_called_once()
+        conn._s3_client.delete_object.assert_called_once_with(Bucket="bucket", Key=f"i-12345/{out_path}")
+
+        # Parts missing, the upload is abandoned
+        conn._s3_client.get_paginator.return_value.paginate.return_value = [
+            {"Parts": [{"PartNumber": 1, "ETag": '"a"'}]}
+        ]
+        with pytest.raises(AnsibleError, match="only 1 of 2 parts were uploaded"):
+            conn._multipart_file_transport_command("/in/file", out_path, "get", 6 * 1024 * 1024)
+        conn._s3_client.abort_multipart_upload.assert_called_once_with(
+            Bucket="bucket", Key=f"i-12345/{out_path}", UploadId="upload"
+        )
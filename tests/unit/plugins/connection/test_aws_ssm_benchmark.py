@@ -0,0 +1,89 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Benchmarks for the aws_ssm connection plugin, these push large amounts of
+# data through a fake session-manager-plugin process and are skipped unless
+# the COMMUNITY_AWS_BENCHMARK environment variable is set.
+
+import os
+import pty
+import select
+import subprocess
+import sys
+import time
+import tty
+from io import StringIO
+from unittest.mock import MagicMock
+
+import pytest
+
+from ansible.playbook.play_context import PlayContext
+from ansible.plugins.loader import connection_loader
+
+from ansible_collections.amazon.aws.plugins.module_utils.botocore import HAS_BOTO3
+
+if not HAS_BOTO3:
+    pytestmark = pytest.mark.skip("test_aws_ssm_benchmark.py requires the python modules 'boto3' and 'botocore'")
+elif not os.environ.get("COMMUNITY_AWS_BENCHMARK"):
+    pytestmark = pytest.mark.skip("set COMMUNITY_AWS_BENCHMARK to run the benchmarks")
+
+# Stands in for session-manager-plugin, answers each wrapped command with
+# `size` bytes of output framed the same way a real SSM terminal frames it.
+FAKE_SESSION = r"""
+import re
+import sys
+
+size = int(sys.argv[1])
+line = b"x" * 1021 + b"\r\r\n"
+block = line * 1024
+out = sys.stdout.buffer
+command = b""
+for data in iter(lambda: sys.stdin.buffer.readline(), b""):
+    command += data
+    marks = re.findall(rb"'([A-Za-z]{26})'", command)
+    if len(marks) < 2:
+        continue
+    command = b""
+    out.write(marks[0] + b"\r\r\n")
+    for _x in range(size // len(block)):
+        out.write(block)
+    out.write(b"\r\r\n0\r\r\n" + marks[1] + b"\r\r\n")
+    out.flush()
+"""
+
+
+@pytest.mark.parametrize("size", [100 * 1024 * 1024])
+def test_benchmark_exec_command_output(size):
+    pc = PlayContext()
+    conn = connection_loader.get("community.aws.aws_ssm", pc, StringIO())
+    conn.get_option = MagicMock(side_effect=lambda option: {"reconnection_retries": 0, "ssm_timeout": 300}[option])
+    conn._connect = MagicMock()
+    conn.instance_id = "i-benchmark"
+
+    stdout_r, stdout_w = pty.openpty()
+    tty.setraw(stdout_w)
+    session = subprocess.Popen(
+        [sys.executable, "-c", FAKE_SESSION, str(size)],
+        stdin=subprocess.PIPE,
+        stdout=stdout_w,
+        stderr=subprocess.PIPE,
+        close_fds=True,
+        bufsize=0,
+    )
+    os.close(stdout_w)
+    conn._session = session
+    conn._stdout = os.fdopen(stdout_r, "rb", 0)
+    conn._poll_stdout = select.poll()
+    conn._poll_stdout.register(conn._stdout, select.POLLIN)
+
+    try:
+        start = time.perf_counter()
+        returncode, stdout, stderr = conn.exec_command("cat large_file")
+        elapsed = time.perf_counter() - start
+    finally:
+        session.kill()
+        session.wait()
+        conn._stdout.close()
+
+    assert returncode == 0
+    assert len(stdout) == size - 1
+    print(f"\nexec_command: {size / elapsed / 1024 / 1024:.1f} MiB/s ({size} bytes in {elapsed:.2f}s)")
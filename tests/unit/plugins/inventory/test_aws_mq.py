@@ -18,8 +18,11 @@
 # along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
 
 import copy
+import datetime
 import random
 import string
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import ANY
 from unittest.mock import MagicMock
 from unittest.mock import call
 from unittest.mock import patch
@@ -333,6 +336,65 @@ def test_add_details_to_hosts_with_hosts(connection):
     ]
 
 
+def test_add_details_to_hosts_concurrently(connection):
+    hosts = [{"BrokerId": str(i)} for i in range(50)]
+    connection.describe_broker.side_effect = lambda BrokerId: {"Tags": {"id": BrokerId}, "BrokerState": "RUNNING"}
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        _add_details_to_hosts(connection, hosts, False, executor)
+
+    assert connection.describe_broker.call_count == 50
+    assert hosts == [
+        {"BrokerId": str(i), "Tags": [{"Key": "id", "Value": str(i)}], "BrokerState": "RUNNING"} for i in range(50)
+    ]
+
+
+def test_add_details_to_hosts_throttled(connection, mocker):
+    mocker.patch("time.sleep")
+    hosts = [{"BrokerId": "1"}]
+    connection.describe_broker.side_effect = [
+        make_clienterror_exception(code="TooManyRequestsException"),
+        {"Tags": {"tag": "value"}},
+    ]
+
+    _add_details_to_hosts(connection, hosts, strict=True)
+
+    assert connection.describe_broker.call_count == 2
+    assert hosts == [{"BrokerId": "1", "Tags": [{"Key": "tag", "Value": "value"}]}]
+
+
+def test_inventory_get_all_hosts_concurrently(inventory):
+    # Brokers with the same name in several regions keep the order of the regions
+    connections = []
+    for region in range(6):
+        connection = MagicMock()
+        summaries = [
+            {"BrokerId": f"{region}-{name}", "BrokerName": name, "BrokerState": "RUNNING"} for name in ("b", "a")
+        ]
+        connection.get_paginator.return_value.paginate.return_value.build_full_result.return_value = {
+            "BrokerSummaries": summaries
+        }
+        connection.describe_broker.side_effect = lambda BrokerId: {"BrokerArn": f"arn:{BrokerId}"}
+        connections.append((connection, f"region-{region}"))
+    inventory.all_clients.return_value = connections
+    inventory.get_option.side_effect = lambda option: {"max_concurrency": 3}.get(option)
+
+    result = inventory._get_all_hosts(["region-0"], True, ["RUNNING"])
+
+    assert [host["BrokerId"] for host in result] == [f"{r}-a" for r in range(6)] + [f"{r}-b" for r in range(6)]
+    assert all(host["BrokerArn"] == f"arn:{host['BrokerId']}" for host in result)
+
+
+@pytest.mark.parametrize("max_concurrency", [0, -1])
+def test_get_all_hosts_invalid_max_concurrency(inventory, max_concurrency):
+    inventory.get_option.side_effect = lambda option: {"max_concurrency": max_concurrency}.get(option)
+
+    with pytest.raises(AnsibleError) as e:
+        inventory._get_all_hosts(["region-0"], True, ["RUNNING"])
+    assert "max_concurrency must be at least 1" in str(e.value)
+    inventory.all_clients.assert_not_called()
+
+
 ADD_DETAILS_TO_HOSTS = "ansible_collections.community.aws.plugins.inventory.aws_mq._add_details_to_hosts"
 
 
@@ -364,7 +426,7 @@ def test_get_broker_hosts(m_add_details_to_hosts, inventory, connection):
 
     assert result == [broker]
 
-    m_add_details_to_hosts.assert_called_with(connection, result, strict)
+    m_add_details_to_hosts.assert_called_with(connection, result, strict, None)
 
 
 @pytest.mark.parametrize("strict", [True, False])
@@ -430,6 +492,7 @@ def test_inventory_get_all_hosts(m_find_hosts, inventory, regions):
 
     connections = [MagicMock() for i in range(regions)]
 
+    inventory.get_option.side_effect = lambda option: {"max_concurrency": 2}.get(option)
     inventory.all_clients.return_value = [(connections[i], f"us-east-{int(i)}") for i in range(regions)]
 
     ids = list(reversed(range(regions)))
@@ -447,7 +510,7 @@ def test_inventory_get_all_hosts(m_find_hosts, inventory, regions):
     assert result == inventory._get_all_hosts(**params)
     inventory.all_clients.assert_called_with("mq")
     inventory._get_broker_hosts.assert_has_calls(
-        [call(connections[i], params["strict"]) for i in range(regions)], any_order=True
+        [call(connections[i], params["strict"], ANY) for i in range(regions)], any_order=True
     )
 
     m_find_hosts.assert_called_with(result, params["statuses"])
@@ -636,3 +699,92 @@ def test_inventory_parse(m_parse, inventory, user_cache_directive, cache, cache_
     if cache and user_cache_directive and not cache_hit or (not cache and user_cache_directive):
         # validate that cache was populated
         assert inventory._cache[cache_key] == format_cache_key_value
+
+
+def _mq_connection(summaries):
+    connection = MagicMock()
+    connection.get_paginator.return_value.paginate.return_value.build_full_result.side_effect = lambda: {
+        "BrokerSummaries": copy.deepcopy(summaries)
+    }
+    connection.describe_broker.side_effect = lambda BrokerId: {"Tags": {"id": BrokerId}}
+    return connection
+
+
+def _broker(broker_id, state="RUNNING"):
+    return {
+        "BrokerId": broker_id,
+        "BrokerName": f"name-{broker_id}",
+        "BrokerState": state,
+        "Created": datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+    }
+
+
+def test_inventory_get_all_hosts_region_cache(inventory, mocker):
+    options = {"max_concurrency": 2, "region_cache_ttl": 0, "broker_cache_ttl": 600}
+    inventory.get_option.side_effect = options.get
+    m_time = mocker.patch("ansible_collections.community.aws.plugins.inventory.aws_mq.time.time", return_value=1000)
+    summaries = {"region-a": [_broker("a1"), _broker("a2")], "region-b": [_broker("b1")]}
+    connections = {region: _mq_connection(summaries[region]) for region in summaries}
+    inventory.all_clients.side_effect = lambda service: list((c, r) for r, c in connections.items())
+    region_cache = {}
+
+    # Nothing cached, every broker is described
+    result = inventory._get_all_hosts(list(summaries), True, ["all"], region_cache)
+    assert [h["BrokerId"] for h in result] == ["a1", "a2", "b1"]
+    assert connections["region-a"].describe_broker.call_count == 2
+    assert connections["region-b"].describe_broker.call_count == 1
+    assert sorted(region_cache) == ["region-a", "region-b"]
+
+    # Simulate a cache plugin storing datetimes as strings
+    for entry in region_cache.values():
+        for broker in entry["brokers"].values():
+            broker["host"]["Created"] = broker["host"]["Created"].isoformat()
+
+    # One new broker and one changed broker, only those are described
+    m_time.return_value = 1100
+    summaries["region-a"][1]["BrokerState"] = "REBOOT_IN_PROGRESS"
+    summaries["region-b"].append(_broker("b2"))
+    for connection in connections.values():
+        connection.describe_broker.reset_mock()
+    result = inventory._get_all_hosts(list(summaries), True, ["all"], region_cache)
+    assert [h["BrokerId"] for h in result] == ["a1", "a2", "b1", "b2"]
+    assert [c.kwargs for c in connections["region-a"].describe_broker.call_args_list] == [{"BrokerId": "a2"}]
+    assert [c.kwargs for c in connections["region-b"].describe_broker.call_args_list] == [{"BrokerId": "b2"}]
+    assert all(h["Tags"] == [{"Key": "id", "Value": h["BrokerId"]}] for h in result)
+    assert region_cache["region-a"]["brokers"]["a1"]["described"] == 1000
+    assert region_cache["region-a"]["brokers"]["a2"]["described"] == 1100
+
+    # The region listings are re-used while fresh
+    options["region_cache_ttl"] = 300
+    for connection in connections.values():
+        connection.get_paginator.reset_mock()
+        connection.describe_broker.reset_mock()
+    assert len(inventory._get_all_hosts(list(summaries), True, ["all"], region_cache)) == 4
+    assert all(not c.get_paginator.called and not c.describe_broker.called for c in connections.values())
+
+    # Brokers described more than broker_cache_ttl seconds ago are described again
+    options["region_cache_ttl"] = 0
+    m_time.return_value = 1650
+    inventory._get_all_hosts(list(summaries), True, ["all"], region_cache)
+    assert [c.kwargs for c in connections["region-a"].describe_broker.call_args_list] == [{"BrokerId": "a1"}]
+    assert [c.kwargs for c in connections["region-b"].describe_broker.call_args_list] == [{"BrokerId": "b1"}]
+
+
+@pytest.mark.parametrize("cache", [True, False])
+@patch(BASE_INVENTORY_PARSE)
+def test_inventory_parse_region_cache(m_parse, inventory, cache):
+    options = {"regions": ["us-east-1"], "strict_permissions": True, "statuses": ["all"], "cache": True}
+    options["region_cache_ttl"] = 0
+    inventory.get_option.side_effect = options.get
+    inventory.get_cache_key.return_value = "key"
+    inventory._cache = {"key": {"aws_mq": {}}, "key_regions": {"us-east-1": "cached"}}
+    inventory._populate = MagicMock()
+    inventory._get_all_hosts = MagicMock(return_value=["host"])
+
+    inventory.parse(MagicMock(), MagicMock(), "path", cache)
+
+    region_cache = inventory._get_all_hosts.call_args.args[3]
+    assert region_cache == ({"us-east-1": "cached"} if cache else {})
+    inventory._populate.assert_called_with(["host"])
+    assert inventory._cache["key_regions"] is region_cache
+    assert inventory._cache["key"] == {"aws_mq": {}}
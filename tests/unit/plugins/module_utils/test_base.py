@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the Ansible project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from unittest.mock import MagicMock
+
+import botocore.exceptions
+import botocore.session
+import botocore.waiter
+import pytest
+
+from ansible_collections.community.aws.plugins.module_utils import base
+
+WAITER_DATA = dict(
+    parameter_exists=dict(
+        operation="DescribeParameters",
+        delay=1,
+        maxAttempts=20,
+        acceptors=[
+            dict(state="success", matcher="path", expected=True, argument="length(Parameters[].Name) > `0`"),
+        ],
+    ),
+)
+
+
+class ExampleWaiterFactory(base.BaseWaiterFactory):
+    @property
+    def _waiter_model_data(self):
+        return WAITER_DATA
+
+
+class OtherWaiterFactory(base.BaseWaiterFactory):
+    @property
+    def _waiter_model_data(self):
+        return dict(parameter_deleted=dict(WAITER_DATA["parameter_exists"]))
+
+
+@pytest.fixture
+def waiter_model(mocker):
+    mocker.patch.dict(base.BaseWaiterFactory._waiter_models, clear=True)
+    return mocker.spy(base.botocore.waiter, "WaiterModel")
+
+
+def test_waiter_model_compiled_once_per_class(waiter_model):
+    first = ExampleWaiterFactory(MagicMock(), MagicMock())
+    second = ExampleWaiterFactory(MagicMock(), MagicMock())
+    other = OtherWaiterFactory(MagicMock(), MagicMock())
+
+    assert waiter_model.call_count == 2
+    assert first._model is second._model
+    assert other._model.waiter_names == ["parameter_deleted"]
+
+
+def test_ratelimit_retries(waiter_model):
+    factory = ExampleWaiterFactory(MagicMock(), MagicMock())
+
+    acceptors = factory._model.get_waiter("parameter_exists").acceptors
+    assert [a.expected for a in acceptors[1:]] == list(base.RATELIMIT_ERRORS)
+    assert all(a.state == "retry" and a.matcher == "error" for a in acceptors[1:])
+    # the subclass's data isn't modified
+    assert len(WAITER_DATA["parameter_exists"]["acceptors"]) == 1
+
+
+def test_get_waiter_cached(waiter_model):
+    client = botocore.session.get_session().create_client("ssm", region_name="us-east-1")
+    factory = ExampleWaiterFactory(MagicMock(), client)
+
+    waiter = factory.get_waiter("parameter_exists")
+
+    assert factory.get_waiter("parameter_exists") is waiter
+    assert ExampleWaiterFactory(MagicMock(), client).get_waiter("parameter_exists") is not waiter
+
+
+def test_get_waiter_unknown(waiter_model):
+    module = MagicMock()
+    module.fail_json.side_effect = SystemExit
+
+    with pytest.raises(SystemExit):
+        ExampleWaiterFactory(module, MagicMock()).get_waiter("missing")
+    assert "parameter_exists" in module.fail_json.call_args.args[0]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(mocker):
+    clock = FakeClock()
+    mocker.patch.object(base.time, "monotonic", clock.monotonic)
+    mocker.patch.object(base.time, "sleep", clock.sleep)
+    return clock
+
+
+def _resources(converge_after):
+    # Resource 'id' becomes available after converge_after[id] polls
+    polls = dict()
+    describe = MagicMock()
+
+    def describe_resources(ids):
+        result = dict()
+        for resource_id in ids:
+            polls[resource_id] = polls.get(resource_id, 0) + 1
+            state = "available" if polls[resource_id] > converge_after[resource_id] else "pending"
+            if converge_after[resource_id] >= 0:
+                result[resource_id] = dict(Id=resource_id, State=state)
+        return result
+
+    describe.side_effect = describe_resources
+    return describe
+
+
+def _status(resource):
+    if resource is None:
+        return "failure"
+    return "success" if resource["State"] == "available" else "retry"
+
+
+def test_multi_resource_waiter(clock, mocker):
+    mocker.patch.object(base.random, "random", return_value=0.0)
+    converge_after = dict((f"r-{index}", index % 5) for index in range(250))
+    describe = _resources(converge_after)
+    waiter = base.MultiResourceWaiter(describe, _status, delay=1, max_delay=3, backoff=2, batch_size=100)
+
+    resources = waiter.wait(list(converge_after))
+
+    assert all(resource["State"] == "available" for resource in resources.values())
+    assert len(resources) == 250
+    # only the resources still pending are described
+    assert [len(call.args[0]) for call in describe.call_args_list] == [100, 100, 50, 100, 100, 100, 50, 100, 50]
+    assert clock.sleeps == [1, 2, 3, 3]
+    assert waiter.metrics["polls"] == 5
+    assert waiter.metrics["describe_calls"] == 9
+    assert waiter.metrics["sleeping"] == waiter.metrics["elapsed"] == 9
+    assert waiter.metrics["converged"]["r-0"] == 0
+    assert waiter.metrics["converged"]["r-4"] == 9
+
+
+def test_multi_resource_waiter_jitter(clock, mocker):
+    mocker.patch.object(base.random, "random", return_value=1.0)
+    waiter = base.MultiResourceWaiter(_resources({"a": 3}), _status, delay=2, backoff=2, jitter=0.25)
+
+    waiter.wait(["a"])
+
+    assert clock.sleeps == [1.5, 3, 6]
+
+
+def test_multi_resource_waiter_failure(clock):
+    waiter = base.MultiResourceWaiter(_resources({"a": 5, "gone": -1}), _status, name="attachments")
+
+    with pytest.raises(botocore.exceptions.WaiterError) as e:
+        waiter.wait(["a", "gone"])
+
+    assert "gone reached a terminal failure state" in str(e.value)
+    assert e.value.last_response["gone"] is None
+    assert clock.sleeps == []
+
+
+def test_multi_resource_waiter_timeout(clock):
+    waiter = base.MultiResourceWaiter(_resources({"a": 1, "b": 1000}), _status, timeout=60, max_delay=10)
+
+    with pytest.raises(botocore.exceptions.WaiterError) as e:
+        waiter.wait(["a", "b"])
+
+    assert "waiting for b" in str(e.value)
+    # the last sleep is shortened to the deadline
+    assert sum(clock.sleeps) == 60
+    assert waiter.metrics["elapsed"] == 60
+    assert list(waiter.metrics["converged"]) == ["a"]
+
+
+def test_multi_resource_waiter_timeout_non_string_ids(clock):
+    waiter = base.MultiResourceWaiter(_resources({1: 0, 2: 1000}), _status, timeout=60)
+
+    with pytest.raises(botocore.exceptions.WaiterError) as e:
+        waiter.wait([1, 2])
+
+    assert "waiting for 2" in str(e.value)
+
+
+@pytest.mark.parametrize("batch_size", [0, -1])
+def test_multi_resource_waiter_batch_size(batch_size):
+    with pytest.raises(ValueError, match="batch_size must be at least 1"):
+        base.MultiResourceWaiter(_resources({}), _status, batch_size=batch_size)
+
+
+class ExampleResourceManager(base.BaseResourceManager):
+    def __init__(self, module):
+        super().__init__(module)
+        self.waits = []
+
+    def _do_create_resource(self):
+        return True
+
+    def _do_creation_wait(self, **params):
+        self.waits.append(params)
+
+    def get_resource(self):
+        return dict(Id="r-1")
+
+
+@pytest.mark.parametrize("wait,expected", [(True, [dict(WaiterConfig=dict(Delay=5, MaxAttempts=12))]), (False, [])])
+def test_flush_create_waits_once(wait, expected):
+    module = MagicMock()
+    module.check_mode = False
+    manager = ExampleResourceManager(module)
+    manager.set_wait(wait)
+    manager.set_wait_timeout(60)
+
+    manager.flush_changes()
+
+    assert manager.waits == expected
+    assert manager.updated_resource == dict(Id="r-1")
+
+
+def test_wait_for_resources(clock):
+    manager = ExampleResourceManager(MagicMock())
+    manager.set_wait_timeout(30)
+
+    with pytest.raises(botocore.exceptions.WaiterError):
+        manager._wait_for_resources(["a"], _resources({"a": 1000}), _status)
+
+    assert manager.wait_metrics["elapsed"] == 30
+
+    manager.set_wait(False)
+    assert manager._wait_for_resources(["a"], _resources({"a": 1000}), _status) is None
@@ -0,0 +1,74 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Benchmarks for creating waiter factories and performing their first wait,
+# skipped unless the COMMUNITY_AWS_BENCHMARK environment variable is set.
+
+import os
+import time
+from copy import deepcopy
+from unittest.mock import MagicMock
+
+import botocore.session
+import botocore.waiter
+import pytest
+from botocore.stub import Stubber
+
+from ansible_collections.community.aws.plugins.module_utils import base
+from ansible_collections.community.aws.plugins.module_utils.dynamodb import DynamodbWaiterFactory
+
+if not os.environ.get("COMMUNITY_AWS_BENCHMARK"):
+    pytestmark = pytest.mark.skip("set COMMUNITY_AWS_BENCHMARK to run the benchmarks")
+
+ROUNDS = 200
+
+
+class LegacyDynamodbWaiterFactory(DynamodbWaiterFactory):
+    # The previous implementation, the model is rebuilt from a deep copy of
+    # the data for every factory and every get_waiter() call creates a waiter
+    def __init__(self, module):
+        self.module = module
+        self.client = module.client("dynamodb")
+        _model = deepcopy(self._waiter_model_data)
+        for waiter in _model:
+            _model[waiter]["acceptors"].extend(
+                [dict(state="retry", matcher="error", expected=error) for error in base.RATELIMIT_ERRORS]
+            )
+        self._model = botocore.waiter.WaiterModel(waiter_config=dict(version=2, waiters=_model))
+
+    def get_waiter(self, waiter_name):
+        return botocore.waiter.create_waiter_with_client(waiter_name, self._model, self.client)
+
+
+def _wait(factory_class, module, rounds):
+    # Like dynamodb_table, a new factory per wait, and a few waits per factory
+    for _ in range(rounds):
+        factory = factory_class(module)
+        for _ in range(3):
+            factory.get_waiter("table_exists").wait(TableName="table")
+
+
+@pytest.mark.parametrize("factory_class", [LegacyDynamodbWaiterFactory, DynamodbWaiterFactory])
+def test_benchmark_waiter_factory(factory_class, mocker):
+    mocker.patch.dict(base.BaseWaiterFactory._waiter_models, clear=True)
+    client = botocore.session.get_session().create_client(
+        "dynamodb", region_name="us-east-1", aws_access_key_id="a", aws_secret_access_key="b"
+    )
+    module = MagicMock()
+    module.client.return_value = client
+
+    with Stubber(client) as stubber:
+        for _ in range(3 * (ROUNDS + 1)):
+            stubber.add_response("describe_table", {"Table": {"TableStatus": "ACTIVE"}})
+
+        start = time.perf_counter()
+        _wait(factory_class, module, 1)
+        first = time.perf_counter() - start
+
+        start = time.perf_counter()
+        _wait(factory_class, module, ROUNDS)
+        repeated = time.perf_counter() - start
+
+    print(
+        f"\n{factory_class.__name__}: first factory and waits {first * 1000:.2f} ms,"
+        f" then {repeated * 1000 / ROUNDS:.2f} ms per factory"
+    )
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the Ansible project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import hashlib
+import os
+
+import pytest
+
+from ansible_collections.community.aws.plugins.module_utils import etag
+
+
+def test_calculate_multipart_etag(tmp_path):
+    source = tmp_path / "source"
+    data = os.urandom(2500)
+    source.write_bytes(data)
+
+    parts = [hashlib.md5(data[i:i + 1000]).digest() for i in range(0, 2500, 1000)]  # fmt:skip
+    expected = f'"{hashlib.md5(b"".join(parts)).hexdigest()}-3"'
+    assert etag.calculate_multipart_etag(str(source), 1000) == expected
+    assert etag.calculate_multipart_etag(str(source), 4096) == f'"{hashlib.md5(data).hexdigest()}"'
+
+
+def _reference_etag(data, chunk_size):
+    md5s = [hashlib.md5(data[i:i + chunk_size]).digest() for i in range(0, len(data), chunk_size)]  # fmt:skip
+    if len(md5s) == 1:
+        return f'"{md5s[0].hex()}"'
+    return f'"{hashlib.md5(b"".join(md5s)).hexdigest()}-{len(md5s)}"'
+
+
+def test_calculate_multipart_etag_empty(tmp_path):
+    source = tmp_path / "source"
+    source.write_bytes(b"")
+    # S3 returns the MD5 of the empty string for empty objects
+    assert etag.calculate_multipart_etag(str(source)) == '"d41d8cd98f00b204e9800998ecf8427e"'
+
+
+@pytest.mark.parametrize(
+    "etag_value,expected",
+    [
+        ('"d41d8cd98f00b204e9800998ecf8427e"', 1),
+        ("d41d8cd98f00b204e9800998ecf8427e-12", 12),
+        ('"d41d8cd98f00b204e9800998ecf8427e-3"', 3),
+        ('"not-an-md5"', None),
+        (None, None),
+    ],
+)
+def test_remote_part_count(etag_value, expected):
+    assert etag.remote_part_count(etag_value) == expected
+
+
+@pytest.mark.parametrize(
+    "size,part_size,expected",
+    [
+        (100 * etag.MIB, 8 * etag.MIB, 8 * etag.MIB),
+        (100 * etag.MIB, 5 * etag.MIB, 5 * etag.MIB),
+        (100 * etag.MIB + 1, 16 * etag.MIB, 16 * etag.MIB),
+        (64 * etag.MIB, 8 * etag.MIB, 8 * etag.MIB),
+        (300 * etag.MIB, 15 * etag.MIB, 15 * etag.MIB),
+        (3000 * etag.MIB, 256 * etag.MIB, 256 * etag.MIB),
+        # Ambiguous, 8 MiB parts give the same part count
+        (15 * etag.MIB + 7, 15 * etag.MIB, 8 * etag.MIB),
+        # No whole number of MiB gives the same part count
+        (10 * etag.MIB, 1000 * 1000, None),
+    ],
+)
+def test_infer_chunk_size(size, part_size, expected):
+    part_count = -(-size // part_size)
+    inferred = etag.infer_chunk_size(size, part_count=part_count)
+    assert -(-size // inferred) == part_count
+    if expected:
+        assert inferred == expected
+
+
+def test_infer_chunk_size_single_part():
+    assert etag.infer_chunk_size(100, etag='"d41d8cd98f00b204e9800998ecf8427e"') == 100
+    assert etag.infer_chunk_size(100, etag='"not-an-md5"', default=5) == 5
+
+
+def test_calculate_multipart_etag_remote_etag(tmp_path):
+    source = tmp_path / "source"
+    data = os.urandom(3 * etag.MIB + 100)
+    source.write_bytes(data)
+
+    remote = _reference_etag(data, 2 * etag.MIB)
+    assert etag.calculate_multipart_etag(str(source), etag.MIB, remote_etag=remote) == remote
+    remote = _reference_etag(data, len(data))
+    assert etag.calculate_multipart_etag(str(source), etag.MIB, remote_etag=remote) == remote
+
+
+def test_calculate_multipart_etags(tmp_path, monkeypatch):
+    monkeypatch.setattr(etag, "BATCH_WINDOW", 2)
+    sources = []
+    expected = []
+    for index, size in enumerate([0, 1, 1000, 4096, 10000]):
+        source = tmp_path / f"source{index}"
+        data = os.urandom(size)
+        source.write_bytes(data)
+        sources.append((str(source), 1024, None))
+        expected.append(_reference_etag(data, 1024) if data else f'"{hashlib.md5(b"").hexdigest()}"')
+
+    assert etag.calculate_multipart_etags(sources, max_workers=3) == expected
+
+
+def test_cached_multipart_etag(tmp_path, mocker):
+    source = tmp_path / "source"
+    source.write_bytes(b"0123456789")
+    calculate = mocker.spy(etag, "_hash_parts")
+
+    with etag.EtagCache(str(tmp_path / "cache" / "etags.db")) as cache:
+        first = etag.cached_multipart_etag(str(source), 4, cache)
+        assert etag.cached_multipart_etag(str(source), 4, cache) == first
+        assert calculate.call_count == 1
+        # A different chunk size is a different etag
+        etag.cached_multipart_etag(str(source), 8, cache)
+        assert calculate.call_count == 2
+
+    # The cache persists, and is invalidated when the file changes
+    with etag.EtagCache(str(tmp_path / "cache" / "etags.db")) as cache:
+        assert etag.cached_multipart_etag(str(source), 4, cache) == first
+        assert calculate.call_count == 2
+        source.write_bytes(b"abcdefghij")
+        os.utime(source, ns=(0, 12345))
+        assert etag.cached_multipart_etag(str(source), 4, cache) != first
+        assert calculate.call_count == 3
+
+
+def test_cached_multipart_etag_without_cache(tmp_path):
+    source = tmp_path / "source"
+    source.write_bytes(b"0123456789")
+    assert etag.cached_multipart_etag(str(source)) == f'"{hashlib.md5(b"0123456789").hexdigest()}"'
@@ -0,0 +1,60 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Benchmarks for the multipart etag calculation, these hash multi-GB files and
+# are skipped unless the COMMUNITY_AWS_BENCHMARK environment variable is set.
+# COMMUNITY_AWS_BENCHMARK_ETAG_SIZE sets the size in bytes of the file hashed.
+
+import hashlib
+import os
+import time
+
+import pytest
+
+from ansible_collections.community.aws.plugins.module_utils import etag
+
+if not os.environ.get("COMMUNITY_AWS_BENCHMARK"):
+    pytestmark = pytest.mark.skip("set COMMUNITY_AWS_BENCHMARK to run the benchmarks")
+
+SIZE = int(os.environ.get("COMMUNITY_AWS_BENCHMARK_ETAG_SIZE", 4 * 1024 * 1024 * 1024))
+CHUNK_SIZE = 8 * 1024 * 1024
+
+
+def serial_etag(source_path, chunk_size):
+    # The previous implementation, a fresh bytes object per chunk hashed in a single thread
+    md5s = []
+    with open(source_path, "rb") as fp:
+        for data in iter(lambda: fp.read(chunk_size), b""):
+            md5s.append(hashlib.md5(data))
+    if len(md5s) == 1:
+        return f'"{md5s[0].hexdigest()}"'
+    return f'"{hashlib.md5(b"".join(m.digest() for m in md5s)).hexdigest()}-{len(md5s)}"'
+
+
+@pytest.fixture(scope="module")
+def large_file(tmp_path_factory):
+    source = tmp_path_factory.mktemp("etag") / "large"
+    block = os.urandom(CHUNK_SIZE)
+    with open(source, "wb") as fp:
+        for _x in range(SIZE // CHUNK_SIZE):
+            fp.write(block)
+    # Warm the page cache so that both implementations are measured on the same footing
+    serial_etag(source, CHUNK_SIZE)
+    return str(source)
+
+
+def _measure(name, func):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"\n{name}: {SIZE / elapsed / 1024 / 1024:.1f} MiB/s ({SIZE} bytes in {elapsed:.2f}s)")
+    return result
+
+
+def test_benchmark_calculate_multipart_etag(large_file):
+    expected = _measure("serial read()", lambda: serial_etag(large_file, CHUNK_SIZE))
+    for workers in sorted({1, etag.DEFAULT_MAX_WORKERS}):
+        result = _measure(
+            f"mmap, {workers} thread(s)",
+            lambda: etag.calculate_multipart_etag(large_file, CHUNK_SIZE, max_workers=workers),
+        )
+        assert result == expected
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the Ansible project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import random
+from unittest.mock import MagicMock
+
+import pytest
+
+from ansible_collections.community.aws.plugins.module_utils import wafv2
+
+
+def _client(count, page_size=100, method="list_web_acls", result_key="WebACLs"):
+    client = MagicMock()
+    items = [
+        {"Name": f"acl-{index}", "Id": f"id-{index}", "ARN": f"arn-{index}", "LockToken": "lock"}
+        for index in range(count)
+    ]
+
+    def list_method(Scope, Limit, NextMarker=None):
+        start = int(NextMarker or 0)
+        # like WAFv2, always return a marker, even with the last page
+        return {result_key: items[start:start + page_size], "NextMarker": str(start + page_size)}  # fmt:skip
+
+    getattr(client, method).side_effect = list_method
+    return client
+
+
+def test_paginate():
+    client = _client(250)
+
+    items = list(wafv2.wafv2_paginate(client, "web_acl", "REGIONAL", MagicMock()))
+
+    assert [item["Name"] for item in items] == [f"acl-{index}" for index in range(250)]
+    # the last page is empty
+    assert client.list_web_acls.call_count == 4
+
+
+def test_paginate_repeated_marker():
+    client = MagicMock()
+    client.list_ip_sets.return_value = {"IPSets": [{"Name": "set"}], "NextMarker": "same"}
+
+    items = list(wafv2.wafv2_paginate(client, "ip_set", "REGIONAL", MagicMock()))
+
+    assert len(items) == 2
+    assert client.list_ip_sets.call_count == 2
+
+
+def test_list_rule_groups():
+    client = _client(150, method="list_rule_groups", result_key="RuleGroups")
+
+    assert len(wafv2.wafv2_list_rule_groups(client, "CLOUDFRONT", MagicMock())["RuleGroups"]) == 150
+
+
+def test_name_index_lists_until_found():
+    client = _client(1000)
+    index = wafv2.Wafv2NameIndex(client, "web_acl", MagicMock())
+
+    assert index.lookup("REGIONAL", "acl-150") == ("id-150", "arn-150", "lock")
+    assert client.list_web_acls.call_count == 2
+    # already seen
+    assert index.lookup("REGIONAL", "acl-3") == ("id-3", "arn-3", "lock")
+    assert client.list_web_acls.call_count == 2
+    # resume listing from where we stopped
+    assert index.lookup("REGIONAL", "acl-250") == ("id-250", "arn-250", "lock")
+    assert client.list_web_acls.call_count == 3
+
+
+def test_name_index_missing():
+    client = _client(120)
+    index = wafv2.Wafv2NameIndex(client, "web_acl", MagicMock())
+
+    assert index.lookup("REGIONAL", "missing") == (None, None, None)
+    assert index.lookup("REGIONAL", "other") == (None, None, None)
+    assert client.list_web_acls.call_count == 3
+
+    # scopes are indexed separately
+    assert index.lookup("CLOUDFRONT", "acl-1") == ("id-1", "arn-1", "lock")
+    assert client.list_web_acls.call_args.kwargs["Scope"] == "CLOUDFRONT"
+
+    index.invalidate("REGIONAL")
+    assert index.lookup("REGIONAL", "acl-0") == ("id-0", "arn-0", "lock")
+    assert client.list_web_acls.call_count == 5
+
+
+@pytest.mark.parametrize("markers", [[None], ["1", "2", None], ["1", "1"]])
+def test_describe_wafv2_tags(markers):
+    client = MagicMock()
+    responses = [
+        {"TagInfoForResource": {"TagList": [{"Key": f"key{index}", "Value": "value"}]}, "NextMarker": marker}
+        for index, marker in enumerate(markers)
+    ]
+    client.list_tags_for_resource.side_effect = responses
+
+    tags = wafv2.describe_wafv2_tags(client, "arn", MagicMock())
+
+    assert tags == {f"key{index}": "value" for index in range(len(markers))}
+    next_markers = [call.kwargs.get("NextMarker") for call in client.list_tags_for_resource.call_args_list]
+    assert next_markers == [None] + markers[:-1]
+
+
+def _rule(priority, search_string="admin", action="Block"):
+    return {
+        "Name": f"rule-{priority}",
+        "Priority": priority,
+        "Action": {action: {}},
+        "Statement": {
+            "NotStatement": {
+                "Statement": {
+                    "ByteMatchStatement": {
+                        "SearchString": search_string,
+                        "FieldToMatch": {"UriPath": {}},
+                        "TextTransformations": [{"Priority": 0, "Type": "NONE"}],
+                        "PositionalConstraint": "CONTAINS",
+                    }
+                }
+            }
+        },
+    }
+
+
+def test_byte_values_to_strings():
+    rule = _rule(1, search_string=b"admin")
+
+    converted = wafv2.byte_values_to_strings(rule)
+
+    assert converted == _rule(1)
+    # the original rule isn't modified
+    assert rule["Statement"]["NotStatement"]["Statement"]["ByteMatchStatement"]["SearchString"] == b"admin"
+
+
+def test_rule_fingerprint():
+    assert wafv2.rule_fingerprint(_rule(1, search_string=b"admin")) == wafv2.rule_fingerprint(_rule(1))
+    assert wafv2.rule_fingerprint(_rule(1)) != wafv2.rule_fingerprint(_rule(1, action="Allow"))
+    reordered = dict(reversed(list(_rule(1).items())))
+    assert wafv2.rule_fingerprint(reordered) == wafv2.rule_fingerprint(_rule(1))
+
+
+def test_compare_priority_rules_replaces_by_priority():
+    existing = [_rule(priority, search_string=b"admin") for priority in (1, 2, 3, 4)]
+    requested = [_rule(2, action="Allow"), _rule(3, action="Allow")]
+
+    diff, merged = wafv2.compare_priority_rules(existing, requested, False, "present")
+
+    # popping indexes 1 and 2 one after the other used to remove rules 2 and 4
+    assert diff
+    assert merged == [_rule(1), _rule(4), _rule(2, action="Allow"), _rule(3, action="Allow")]
+
+
+def test_compare_priority_rules_absent():
+    existing = [_rule(priority, search_string=b"admin") for priority in (1, 2, 3, 4)]
+    requested = [_rule(2), _rule(3), _rule(4, action="Allow")]
+
+    diff, merged = wafv2.compare_priority_rules(existing, requested, False, "absent")
+
+    assert diff
+    assert merged == [_rule(1), _rule(4)]
+    assert wafv2.compare_priority_rules(merged, requested, False, "absent") == (False, merged)
+
+
+# Randomized property checks, each seed generates a different pair of rule lists
+
+
+def _random_rules(rng, priorities):
+    return [
+        _rule(priority, search_string=rng.choice(["admin", "login"]), action=rng.choice(["Allow", "Block"]))
+        for priority in rng.sample(priorities, rng.randint(0, len(priorities)))
+    ]
+
+
+def _random_case(seed):
+    rng = random.Random(seed)
+    priorities = list(range(rng.randint(1, 30)))
+    existing = _random_rules(rng, priorities)
+    requested = _random_rules(rng, priorities)
+    # boto3 returns the search strings as bytes
+    as_returned = [wafv2.byte_values_to_strings(rule) for rule in existing]
+    for rule in as_returned:
+        match = rule["Statement"]["NotStatement"]["Statement"]["ByteMatchStatement"]
+        match["SearchString"] = match["SearchString"].encode("utf-8")
+    return existing, as_returned, requested
+
+
+def _by_priority(rules):
+    return dict((rule["Priority"], rule) for rule in rules)
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_compare_priority_rules_present_properties(seed):
+    existing, as_returned, requested = _random_case(seed)
+
+    diff, merged = wafv2.compare_priority_rules(as_returned, requested, False, "present")
+
+    expected = _by_priority(existing)
+    expected.update(_by_priority(requested))
+    assert len(merged) == len(expected)
+    assert _by_priority(merged) == expected
+    assert diff == (expected != _by_priority(existing))
+    # applying the result again changes nothing
+    assert wafv2.compare_priority_rules(merged, requested, False, "present")[0] is False
+
+    diff, merged = wafv2.compare_priority_rules(as_returned, requested, True, "present")
+
+    assert merged == sorted(requested, key=lambda rule: rule["Priority"])
+    assert diff == (_by_priority(requested) != _by_priority(existing))
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_compare_priority_rules_absent_properties(seed):
+    existing, as_returned, requested = _random_case(seed)
+
+    diff, merged = wafv2.compare_priority_rules(as_returned, requested, False, "absent")
+
+    requested_rules = _by_priority(requested)
+    assert merged == [
+        rule for rule in sorted(existing, key=lambda r: r["Priority"]) if requested_rules.get(rule["Priority"]) != rule
+    ]
+    assert diff == (len(merged) != len(existing))
+    assert wafv2.compare_priority_rules(merged, requested, False, "absent") == (False, merged)
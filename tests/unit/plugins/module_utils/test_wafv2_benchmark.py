@@ -0,0 +1,81 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Benchmarks for the WAFv2 rule comparison with web ACLs holding hundreds of
+# rules, skipped unless the COMMUNITY_AWS_BENCHMARK environment variable is set.
+
+import os
+import time
+
+import pytest
+
+from ansible_collections.community.aws.plugins.module_utils import wafv2
+
+if not os.environ.get("COMMUNITY_AWS_BENCHMARK"):
+    pytestmark = pytest.mark.skip("set COMMUNITY_AWS_BENCHMARK to run the benchmarks")
+
+SIZE = 1500
+
+
+def nested_compare(existing_rules, requested_rules, purge_rules, state):
+    # The previous implementation, every existing rule against every requested rule
+    diff = False
+    existing_rules = sorted(existing_rules, key=lambda k: k["Priority"])
+    requested_rules = sorted(requested_rules, key=lambda k: k["Priority"])
+    ex_idx_pop = []
+    for existing_idx in range(len(existing_rules)):
+        for requested_idx in range(len(requested_rules)):
+            if existing_rules[existing_idx].get("Priority") == requested_rules[requested_idx].get("Priority"):
+                if state == "present":
+                    ex_idx_pop.append(existing_idx)
+                    if existing_rules[existing_idx] != requested_rules[requested_idx]:
+                        diff = True
+                elif existing_rules[existing_idx] == requested_rules[requested_idx]:
+                    ex_idx_pop.append(existing_idx)
+                    diff = True
+    return diff
+
+
+def _rules(priorities, action="Block"):
+    return [
+        {
+            "Name": f"rule-{priority}",
+            "Priority": priority,
+            "Action": {action: {}},
+            "Statement": {
+                "ByteMatchStatement": {
+                    "SearchString": f"/path/{priority}",
+                    "FieldToMatch": {"UriPath": {}},
+                    "TextTransformations": [{"Priority": 0, "Type": "NONE"}],
+                    "PositionalConstraint": "STARTS_WITH",
+                }
+            },
+            "VisibilityConfig": {
+                "SampledRequestsEnabled": True,
+                "CloudWatchMetricsEnabled": True,
+                "MetricName": f"rule-{priority}",
+            },
+        }
+        for priority in priorities
+    ]
+
+
+def _measure(name, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"\n{name}: {(time.perf_counter() - start) * 1000:.1f} ms")
+    return result
+
+
+@pytest.mark.parametrize("state", ["present", "absent"])
+def test_benchmark_compare_priority_rules(state):
+    # half of the requested rules replace existing rules
+    existing = _rules(range(SIZE))
+    requested = _rules(range(SIZE // 2, SIZE + SIZE // 2), action="Allow")
+
+    legacy = _measure(f"nested compare ({state})", lambda: nested_compare(existing, requested, False, state))
+    diff, merged = _measure(
+        f"priority keyed compare ({state})",
+        lambda: wafv2.compare_priority_rules(existing, requested, False, state),
+    )
+
+    assert diff == legacy
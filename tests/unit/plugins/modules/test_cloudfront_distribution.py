@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the Ansible project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from ansible_collections.community.aws.plugins.modules import cloudfront_distribution
+
+
+def _distributions(count):
+    return [
+        {
+            "Id": f"E{index:04d}",
+            "Aliases": {"Items": [f"www{index}.example.com", f"cdn{index}.example.com"]},
+            "CallerReference": f"ref-{index}",
+        }
+        for index in range(count)
+    ]
+
+
+@pytest.fixture
+def client():
+    return MagicMock()
+
+
+def _manager(client, distributions, tmp_path=None, ttl=0):
+    by_id = dict((d["Id"], d) for d in distributions)
+
+    def get_distribution(aws_retry, Id):
+        if Id not in by_id:
+            raise ClientError({"Error": {"Code": "NoSuchDistribution", "Message": ""}}, "GetDistribution")
+        d = by_id[Id]
+        return {
+            "Distribution": {
+                "Id": Id,
+                "DistributionConfig": {"CallerReference": d["CallerReference"], "Aliases": d["Aliases"]},
+            },
+            "ETag": "etag",
+        }
+
+    client.get_distribution.side_effect = get_distribution
+    # list_distributions doesn't return the caller references
+    summaries = [dict((k, v) for k, v in d.items() if k != "CallerReference") for d in distributions]
+    client.get_paginator.return_value.paginate.return_value.build_full_result.return_value = {
+        "DistributionList": {"Items": summaries}
+    }
+    module = MagicMock()
+    module.client.return_value = client
+    module.params = {
+        "lookup_cache_ttl": ttl,
+        "lookup_cache_path": str(tmp_path / "cache.json") if tmp_path else None,
+    }
+    module.fail_json_aws.side_effect = SystemExit
+    return cloudfront_distribution.CloudFrontValidationManager(module)
+
+
+def test_caller_reference_search_stops_early(client):
+    validation_mgr = _manager(client, _distributions(900))
+
+    distribution = validation_mgr.validate_distribution_from_caller_reference("ref-15")
+
+    assert distribution["Distribution"]["Id"] == "E0015"
+    assert client.get_distribution.call_count == 2 * cloudfront_distribution.DESCRIBE_WINDOW
+
+
+def test_caller_reference_not_found(client):
+    validation_mgr = _manager(client, _distributions(25))
+
+    assert validation_mgr.validate_distribution_from_caller_reference("missing") is None
+    assert client.get_distribution.call_count == 25
+
+
+def test_caller_reference_cache(client, tmp_path):
+    distributions = _distributions(50)
+    _manager(client, distributions, tmp_path, ttl=60).validate_distribution_from_caller_reference("ref-42")
+
+    # a later task only checks the remembered distribution
+    client.reset_mock()
+    validation_mgr = _manager(client, distributions, tmp_path, ttl=60)
+    distribution = validation_mgr.validate_distribution_from_caller_reference("ref-42")
+    assert distribution["Distribution"]["Id"] == "E0042"
+    client.get_distribution.assert_called_once_with(aws_retry=True, Id="E0042")
+    client.get_paginator.assert_not_called()
+
+    # stale entries cause a new search
+    client.reset_mock()
+    del distributions[42]
+    distributions.append(dict(Id="E9999", Aliases={"Items": []}, CallerReference="ref-42"))
+    validation_mgr = _manager(client, distributions, tmp_path, ttl=60)
+    distribution = validation_mgr.validate_distribution_from_caller_reference("ref-42")
+    assert distribution["Distribution"]["Id"] == "E9999"
+    client.get_paginator.assert_called()
+
+
+def test_alias_index(client):
+    validation_mgr = _manager(client, _distributions(900))
+
+    assert validation_mgr.validate_distribution_id_from_alias(["cdn5.example.com"]) == "E0005"
+    # the first distribution listed wins, whatever the order of the aliases
+    assert validation_mgr.validate_distribution_id_from_alias(["www7.example.com", "cdn3.example.com"]) == "E0003"
+    assert validation_mgr.validate_distribution_id_from_alias(["other.example.com"]) is None
+    client.get_distribution.assert_not_called()
+
+
+def test_alias_cache(client, tmp_path):
+    distributions = _distributions(20)
+    validation_mgr = _manager(client, distributions, tmp_path, ttl=60)
+    distribution = validation_mgr.validate_distribution_from_aliases_caller_reference(None, ["www3.example.com"], None)
+    assert distribution["Distribution"]["Id"] == "E0003"
+
+    client.reset_mock()
+    validation_mgr = _manager(client, distributions, tmp_path, ttl=60)
+    distribution = validation_mgr.validate_distribution_from_aliases_caller_reference(None, ["www3.example.com"], None)
+    assert distribution["Distribution"]["Id"] == "E0003"
+    client.get_paginator.assert_not_called()
+
+    # the alias moved to another distribution
+    client.reset_mock()
+    distributions[3]["Aliases"] = {"Items": []}
+    distributions[10]["Aliases"]["Items"].append("www3.example.com")
+    validation_mgr = _manager(client, distributions, tmp_path, ttl=60)
+    distribution = validation_mgr.validate_distribution_from_aliases_caller_reference(None, ["www3.example.com"], None)
+    assert distribution["Distribution"]["Id"] == "E0010"
+
+
+def test_lookup_cache_expiry(tmp_path, mocker):
+    cache = cloudfront_distribution.DistributionLookupCache(str(tmp_path / "cache.json"), 60)
+    time = mocker.patch.object(cloudfront_distribution.time, "time", return_value=1000)
+    cache.set("alias", "www.example.com", "E1")
+    assert cache.get("alias", "www.example.com") == "E1"
+    time.return_value = 1061
+    assert cache.get("alias", "www.example.com") is None
+
+    assert cloudfront_distribution.DistributionLookupCache(str(tmp_path / "cache.json"), 0).get("alias", "x") is None
+    (tmp_path / "corrupt.json").write_text("{")
+    assert cloudfront_distribution.DistributionLookupCache(str(tmp_path / "corrupt.json"), 60).get("alias", "x") is None
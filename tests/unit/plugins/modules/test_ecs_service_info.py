@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the Ansible project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from ansible_collections.community.aws.plugins.modules import ecs_service_info
+
+CREATED = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def _service(cluster, name):
+    return {
+        "clusterArn": cluster,
+        "serviceName": name,
+        "deployments": [{"id": "ecs-svc/1", "createdAt": CREATED, "updatedAt": CREATED}],
+        "events": [{"id": "1", "createdAt": CREATED, "message": "steady"}],
+    }
+
+
+@pytest.fixture
+def ecs():
+    services = {"cluster-a": [f"svc-{index:02d}" for index in range(25)], "cluster-b": ["web"], "gone": []}
+    ecs = MagicMock()
+
+    def get_paginator(name):
+        paginator = MagicMock()
+
+        def paginate(cluster=None):
+            if name == "list_clusters":
+                result = {"clusterArns": list(services)}
+            elif cluster == "gone":
+                raise ClientError({"Error": {"Code": "ClusterNotFoundException", "Message": ""}}, "ListServices")
+            else:
+                result = {"serviceArns": services[cluster]}
+            return MagicMock(**{"build_full_result.return_value": result})
+
+        paginator.paginate.side_effect = paginate
+        return paginator
+
+    ecs.get_paginator.side_effect = get_paginator
+    ecs.describe_services.side_effect = lambda cluster, services: {
+        "services": [_service(cluster, name) for name in services if name != "missing"],
+        "failures": [{"arn": name, "reason": "MISSING"} for name in services if name == "missing"],
+    }
+    return ecs
+
+
+def _manager(ecs, **params):
+    module = MagicMock()
+    module.client.return_value = ecs
+    module.params = dict(events=True, max_concurrency=4, **params)
+    return ecs_service_info.EcsServiceManager(module)
+
+
+def test_describe_services(ecs):
+    task_mgr = _manager(ecs)
+
+    running, not_running = task_mgr.describe_services(
+        [("cluster-a", [f"svc-{index:02d}" for index in range(25)] + ["missing"]), ("cluster-b", ["web"])]
+    )
+
+    assert sorted(len(call.kwargs["services"]) for call in ecs.describe_services.call_args_list) == [1, 6, 10, 10]
+    assert [s["serviceName"] for s in running] == [f"svc-{index:02d}" for index in range(25)] + ["web"]
+    assert not_running == [{"arn": "missing", "reason": "MISSING"}]
+    assert running[0]["deployments"][0]["createdAt"] == str(CREATED)
+    assert running[0]["deployments"][0]["updatedAt"] == str(CREATED)
+    assert running[0]["events"][0]["createdAt"] == str(CREATED)
+
+
+def test_describe_services_without_events(ecs):
+    task_mgr = _manager(ecs)
+    task_mgr.module.params["events"] = False
+
+    running, _not_running = task_mgr.describe_services([("cluster-b", ["web"])])
+
+    assert "events" not in running[0]
+
+
+def test_list_clusters_services(ecs):
+    task_mgr = _manager(ecs)
+
+    clusters_services = task_mgr.list_clusters_services(task_mgr.list_clusters())
+
+    assert [(cluster, len(services)) for cluster, services in clusters_services] == [
+        ("cluster-a", 25),
+        ("cluster-b", 1),
+        ("gone", 0),
+    ]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [CREATED, datetime.datetime(2024, 5, 6, 7, 8, 9, 123456), "2024-01-01 00:00:00+00:00"],
+)
+def test_dates_to_str(value):
+    items = [{"createdAt": value, "id": "1"}, {"id": "2"}]
+
+    ecs_service_info.dates_to_str(items)
+
+    assert items == [{"createdAt": str(value), "id": "1"}, {"id": "2"}]
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the Ansible project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from unittest.mock import MagicMock
+
+from ansible_collections.community.aws.plugins.modules import ecs_taskdefinition
+
+ARN = "arn:aws:ecs:us-east-1:123456789012:task-definition/web:{0}"
+
+
+def _task_manager(revisions, page_size=100):
+    ecs = MagicMock()
+    arns = [ARN.format(revision) for revision in sorted(revisions, reverse=True)]
+
+    def list_task_definitions(aws_retry, familyPrefix, sort, nextToken=None):
+        assert sort == "DESC"
+        start = int(nextToken or 0)
+        result = {"taskDefinitionArns": arns[start:start + page_size]}  # fmt:skip
+        if start + page_size < len(arns):
+            result["nextToken"] = str(start + page_size)
+        return result
+
+    ecs.list_task_definitions.side_effect = list_task_definitions
+    ecs.describe_task_definition.side_effect = lambda aws_retry, taskDefinition: {
+        "taskDefinition": {"revision": ecs_taskdefinition.task_definition_revision(taskDefinition), "status": "ACTIVE"}
+    }
+    module = MagicMock()
+    module.client.return_value = ecs
+    return ecs_taskdefinition.EcsTaskManager(module), ecs
+
+
+def test_list_task_definition_arns():
+    task_mgr, ecs = _task_manager(range(1, 251))
+
+    arns = list(task_mgr.list_task_definition_arns("web"))
+
+    assert [ecs_taskdefinition.task_definition_revision(arn) for arn in arns] == list(range(250, 0, -1))
+    assert ecs.list_task_definitions.call_count == 3
+
+
+def test_find_task_definition_stops_early():
+    task_mgr, ecs = _task_manager(range(1, 3001))
+
+    found = task_mgr.find_task_definition("web", lambda td: td["revision"] % 1000 == 985)
+
+    assert found["revision"] == 2985
+    # only the first page is listed, and only the first two windows are described
+    assert ecs.list_task_definitions.call_count == 1
+    assert ecs.describe_task_definition.call_count == 2 * ecs_taskdefinition.DESCRIBE_WINDOW
+
+
+def test_find_task_definition_no_match():
+    task_mgr, ecs = _task_manager(range(1, 26), page_size=10)
+
+    assert task_mgr.find_task_definition("web", lambda td: False) is None
+    assert ecs.list_task_definitions.call_count == 3
+    assert ecs.describe_task_definition.call_count == 25
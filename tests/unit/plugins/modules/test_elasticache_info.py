@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the Ansible project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from ansible_collections.community.aws.plugins.modules import elasticache_info
+
+
+def _client_error(code, operation):
+    return ClientError({"Error": {"Code": code, "Message": code}}, operation)
+
+
+def _client(clusters, replication_groups):
+    client = MagicMock()
+
+    def get_paginator(name):
+        paginator = MagicMock()
+        result = {
+            "describe_cache_clusters": {"CacheClusters": clusters},
+            "describe_replication_groups": {"ReplicationGroups": replication_groups},
+        }[name]
+        paginator.paginate.return_value.build_full_result.return_value = result
+        return paginator
+
+    def list_tags_for_resource(ResourceName):
+        if ResourceName.endswith(":deleted"):
+            raise _client_error("CacheClusterNotFound", "ListTagsForResource")
+        return {"TagList": [{"Key": "Name", "Value": ResourceName.split(":")[-1]}]}
+
+    def describe_replication_groups(ReplicationGroupId):
+        return {"ReplicationGroups": [g for g in replication_groups if g["ReplicationGroupId"] == ReplicationGroupId]}
+
+    client.get_paginator.side_effect = get_paginator
+    client.list_tags_for_resource.side_effect = list_tags_for_resource
+    client.describe_replication_groups.side_effect = describe_replication_groups
+    return client
+
+
+@pytest.fixture
+def module(mocker):
+    mocker.patch.object(elasticache_info, "get_aws_account_info", return_value=("123456789012", "aws"))
+    module = MagicMock()
+    module.region = "us-east-1"
+    module.params = {"name": None, "max_concurrency": 4}
+    return module
+
+
+def test_get_elasticache_clusters(module):
+    clusters = [
+        {"CacheClusterId": f"redis-{g}-{n}", "ReplicationGroupId": f"redis-{g}"} for g in "ab" for n in range(9)
+    ]
+    clusters += [{"CacheClusterId": "memcached"}, {"CacheClusterId": "deleted", "ReplicationGroupId": "redis-c"}]
+    replication_groups = [{"ReplicationGroupId": f"redis-{g}", "Status": "available"} for g in "abz"]
+    client = _client(clusters, replication_groups)
+
+    results = elasticache_info.get_elasticache_clusters(client, module)
+
+    # a single paginated call instead of one call per node
+    client.describe_replication_groups.assert_not_called()
+    assert client.list_tags_for_resource.call_count == 20
+    assert [c["cache_cluster_id"] for c in results] == [c["CacheClusterId"] for c in clusters[:-1]]
+    assert results[0]["tags"] == {"Name": "redis-a-0"}
+    assert results[0]["replication_group"] == {"replication_group_id": "redis-a", "status": "available"}
+    assert results[17]["replication_group"]["replication_group_id"] == "redis-b"
+    assert "replication_group" not in results[-1]
+
+
+def test_get_elasticache_clusters_single_group(module):
+    module.params["name"] = "redis-a-0"
+    client = _client(
+        [{"CacheClusterId": "redis-a-0", "ReplicationGroupId": "redis-a"}],
+        [{"ReplicationGroupId": "redis-a"}, {"ReplicationGroupId": "redis-b"}],
+    )
+
+    results = elasticache_info.get_elasticache_clusters(client, module)
+
+    client.describe_replication_groups.assert_called_once_with(ReplicationGroupId="redis-a")
+    assert results[0]["replication_group"] == {"replication_group_id": "redis-a"}
+
+
+def test_get_elasticache_clusters_tag_failure(module):
+    module.fail_json_aws.side_effect = SystemExit
+    client = _client([{"CacheClusterId": "one"}, {"CacheClusterId": "two"}], [])
+    error = _client_error("AccessDenied", "ListTagsForResource")
+    client.list_tags_for_resource.side_effect = [{"TagList": []}, error]
+
+    with pytest.raises(SystemExit):
+        elasticache_info.get_elasticache_clusters(client, module)
+
+    module.fail_json_aws.assert_called_once_with(error, msg="Couldn't get tags for cluster two")
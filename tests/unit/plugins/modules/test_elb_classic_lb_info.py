@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the Ansible project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from unittest.mock import MagicMock
+
+from botocore.exceptions import ClientError
+
+from ansible_collections.community.aws.plugins.modules import elb_classic_lb_info
+
+
+def _lb(name):
+    return {"LoadBalancerName": name, "Instances": [{"InstanceId": f"i-{name}-1"}, {"InstanceId": f"i-{name}-2"}]}
+
+
+def _connection(names):
+    lbs = dict((name, _lb(name)) for name in names)
+    connection = MagicMock()
+
+    def paginate(LoadBalancerNames=None):
+        if LoadBalancerNames is None:
+            LoadBalancerNames = list(lbs)
+        if any(name not in lbs for name in LoadBalancerNames):
+            raise ClientError({"Error": {"Code": "LoadBalancerNotFound", "Message": ""}}, "DescribeLoadBalancers")
+        result = MagicMock()
+        # returned in a different order from the one requested
+        result.build_full_result.return_value = {
+            "LoadBalancerDescriptions": [lbs[name] for name in sorted(LoadBalancerNames)]
+        }
+        return result
+
+    def describe_load_balancers(aws_retry, LoadBalancerNames):
+        if LoadBalancerNames[0] not in lbs:
+            raise ClientError({"Error": {"Code": "LoadBalancerNotFound", "Message": ""}}, "DescribeLoadBalancers")
+        return {"LoadBalancerDescriptions": [lbs[LoadBalancerNames[0]]]}
+
+    connection.get_paginator.return_value.paginate.side_effect = paginate
+    connection.describe_load_balancers.side_effect = describe_load_balancers
+    connection.describe_tags.side_effect = lambda aws_retry, LoadBalancerNames: {
+        "TagDescriptions": [
+            {"LoadBalancerName": name, "Tags": [{"Key": "Name", "Value": name}]} for name in LoadBalancerNames
+        ]
+    }
+    connection.describe_load_balancer_attributes.side_effect = lambda aws_retry, LoadBalancerName: {
+        "LoadBalancerAttributes": {"CrossZoneLoadBalancing": {"Enabled": LoadBalancerName == "lb-00"}}
+    }
+    connection.describe_instance_health.side_effect = lambda aws_retry, LoadBalancerName, Instances: {
+        "InstanceStates": [
+            {"InstanceId": Instances[0]["InstanceId"], "State": "InService"},
+            {"InstanceId": Instances[1]["InstanceId"], "State": "OutOfService"},
+        ]
+    }
+    return connection
+
+
+def test_list_all_elbs():
+    names = [f"lb-{index:02d}" for index in range(45)]
+    connection = _connection(names)
+
+    elbs = elb_classic_lb_info.list_elbs(connection, [], max_concurrency=4)
+
+    batches = [call.kwargs["LoadBalancerNames"] for call in connection.describe_tags.call_args_list]
+    assert sorted(len(batch) for batch in batches) == [5, 20, 20]
+    # a single instance health call per ELB
+    assert connection.describe_instance_health.call_count == 45
+    assert connection.describe_load_balancer_attributes.call_count == 45
+    assert [elb["load_balancer_name"] for elb in elbs] == names
+    assert elbs[0]["tags"] == {"Name": "lb-00"}
+    assert elbs[0]["attributes"] == {"cross_zone_load_balancing": {"enabled": True}}
+    assert elbs[1]["attributes"] == {"cross_zone_load_balancing": {"enabled": False}}
+    assert elbs[1]["instances_inservice"] == ["i-lb-01-1"]
+    assert elbs[1]["instances_inservice_count"] == 1
+    assert elbs[1]["instances_outofservice"] == ["i-lb-01-2"]
+    assert elbs[1]["instances_unknownservice_count"] == 0
+
+
+def test_list_named_elbs():
+    connection = _connection(["a", "b", "c"])
+
+    elbs = elb_classic_lb_info.list_elbs(connection, ["c", "a", "c"])
+
+    connection.get_paginator.return_value.paginate.assert_called_once_with(LoadBalancerNames=["c", "a"])
+    connection.describe_load_balancers.assert_not_called()
+    assert [elb["load_balancer_name"] for elb in elbs] == ["c", "a"]
+
+
+def test_list_named_elbs_missing():
+    connection = _connection(["a", "b"])
+
+    elbs = elb_classic_lb_info.list_elbs(connection, ["b", "missing", "a"])
+
+    assert connection.describe_load_balancers.call_count == 3
+    assert [elb["load_balancer_name"] for elb in elbs] == ["b", "a"]
+
+
+def test_list_named_elbs_none_found():
+    connection = _connection([])
+
+    assert elb_classic_lb_info.list_elbs(connection, ["missing"]) == []
+    connection.describe_tags.assert_not_called()
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the Ansible project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from ansible_collections.community.aws.plugins.modules import elb_target_group_info
+
+
+class ExitJson(Exception):
+    pass
+
+
+class FailJson(Exception):
+    pass
+
+
+def _arn(index):
+    return f"arn:aws:elasticloadbalancing:us-east-1:123456789012:targetgroup/tg-{index}/{index:016x}"
+
+
+@pytest.fixture
+def client(mocker):
+    client = MagicMock()
+    mocker.patch.object(elb_target_group_info, "client", client, create=True)
+    return client
+
+
+@pytest.fixture
+def module(mocker):
+    module = MagicMock()
+    module.params = {
+        "load_balancer_arn": None,
+        "target_group_arns": None,
+        "names": None,
+        "collect_targets_health": False,
+        "include_attributes": True,
+        "max_concurrency": 4,
+    }
+    module.exit_json.side_effect = ExitJson
+    module.fail_json_aws.side_effect = FailJson
+    mocker.patch.object(elb_target_group_info, "module", module, create=True)
+    return module
+
+
+def _target_groups(client, count):
+    arns = [_arn(index) for index in range(count)]
+    client.get_paginator.return_value.paginate.return_value.build_full_result.return_value = {
+        "TargetGroups": [{"TargetGroupArn": arn, "TargetGroupName": arn.split("/")[1]} for arn in arns]
+    }
+    # Tags are returned in a different order from the ARNs we asked for
+    client.describe_tags.side_effect = lambda ResourceArns, aws_retry: {
+        "TagDescriptions": [
+            {"ResourceArn": arn, "Tags": [{"Key": "Name", "Value": arn.split("/")[1]}]}
+            for arn in reversed(ResourceArns)
+        ]
+    }
+    client.describe_target_group_attributes.side_effect = lambda TargetGroupArn, aws_retry: {
+        "Attributes": [{"Key": "deregistration_delay.timeout_seconds", "Value": TargetGroupArn.split("/")[1]}]
+    }
+    client.describe_target_health.side_effect = lambda TargetGroupArn, aws_retry: {
+        "TargetHealthDescriptions": [{"Target": {"Id": TargetGroupArn.split("/")[1]}}]
+    }
+    return arns
+
+
+def test_list_target_groups(client, module):
+    arns = _target_groups(client, 45)
+    module.params["collect_targets_health"] = True
+
+    with pytest.raises(ExitJson):
+        elb_target_group_info.list_target_groups()
+
+    batches = [call.kwargs["ResourceArns"] for call in client.describe_tags.call_args_list]
+    assert sorted(len(batch) for batch in batches) == [5, 20, 20]
+    assert sorted(arn for batch in batches for arn in batch) == sorted(arns)
+    assert client.describe_target_group_attributes.call_count == 45
+    assert client.describe_target_health.call_count == 45
+
+    target_groups = module.exit_json.call_args.kwargs["target_groups"]
+    assert [tg["target_group_arn"] for tg in target_groups] == arns
+    for target_group in target_groups:
+        name = target_group["target_group_name"]
+        assert target_group["tags"] == {"Name": name}
+        assert target_group["deregistration_delay_timeout_seconds"] == name
+        assert target_group["targets_health_description"] == [{"target": {"id": name}}]
+
+
+def test_list_target_groups_without_attributes(client, module):
+    _target_groups(client, 3)
+    module.params["include_attributes"] = False
+
+    with pytest.raises(ExitJson):
+        elb_target_group_info.list_target_groups()
+
+    client.describe_target_group_attributes.assert_not_called()
+    client.describe_target_health.assert_not_called()
+    target_groups = module.exit_json.call_args.kwargs["target_groups"]
+    assert len(target_groups) == 3
+    assert all("deregistration_delay_timeout_seconds" not in tg for tg in target_groups)
+    assert all("targets_health_description" not in tg for tg in target_groups)
+
+
+def test_list_target_groups_empty(client, module):
+    _target_groups(client, 0)
+
+    with pytest.raises(ExitJson):
+        elb_target_group_info.list_target_groups()
+
+    client.describe_tags.assert_not_called()
+    assert module.exit_json.call_args.kwargs["target_groups"] == []
+
+
+def test_list_target_groups_failure(client, module):
+    _target_groups(client, 3)
+    error = ClientError({"Error": {"Code": "AccessDenied", "Message": ""}}, "DescribeTargetGroupAttributes")
+    client.describe_target_group_attributes.side_effect = error
+
+    with pytest.raises(FailJson):
+        elb_target_group_info.list_target_groups()
+
+    module.fail_json_aws.assert_called_once_with(error, msg="Failed to describe target group attributes")
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the Ansible project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from ansible_collections.community.aws.plugins.modules import elb_target_info
+
+
+class FailJson(Exception):
+    pass
+
+
+def _instance(instance_id, vpc_id, ip):
+    return {
+        "InstanceId": instance_id,
+        "VpcId": vpc_id,
+        "PrivateIpAddress": ip,
+        "NetworkInterfaces": [{"PrivateIpAddress": ip, "PrivateIpAddresses": [{"PrivateIpAddress": ip}]}],
+    }
+
+
+def _target_group(name, target_type, vpc_id="vpc-1", lbs=1):
+    return {
+        "TargetGroupArn": f"arn:aws:elasticloadbalancing:us-east-1:123456789012:targetgroup/{name}/0123456789abcdef",
+        "TargetType": target_type,
+        "VpcId": vpc_id,
+        "LoadBalancerArns": ["arn:lb"] * lbs,
+    }
+
+
+def _health(target_id, port=80):
+    return {"Target": {"Id": target_id, "Port": port}, "TargetHealth": {"State": "healthy"}}
+
+
+TARGET_GROUPS = {
+    "web": (_target_group("web", "instance"), [_health("i-1"), _health("i-1", 8080), _health("i-2")]),
+    "ips": (_target_group("ips", "ip"), [_health("10.0.0.2"), _health("10.9.9.9")]),
+    "other-vpc": (_target_group("other-vpc", "instance", vpc_id="vpc-2"), [_health("i-9")]),
+    "lambda": (_target_group("lambda", "lambda", vpc_id=None), [_health("arn:aws:lambda:function")]),
+    "unused": (_target_group("unused", "instance", lbs=0), [_health("i-2")]),
+}
+
+
+@pytest.fixture
+def module():
+    ec2 = MagicMock()
+    ec2.get_paginator.return_value.paginate.return_value.build_full_result.return_value = {
+        "Reservations": [
+            {"Instances": [_instance("i-1", "vpc-1", "10.0.0.1")]},
+            {"Instances": [_instance("i-2", "vpc-1", "10.0.0.2"), _instance("i-3", "vpc-1", "10.0.0.3")]},
+        ]
+    }
+    elbv2 = MagicMock()
+    elbv2.get_paginator.return_value.paginate.return_value.build_full_result.return_value = {
+        "TargetGroups": [tg for tg, _targets in TARGET_GROUPS.values()]
+    }
+    elbv2.describe_target_health.side_effect = lambda TargetGroupArn, aws_retry: {
+        "TargetHealthDescriptions": TARGET_GROUPS[TargetGroupArn.split("/")[1]][1]
+    }
+
+    module = MagicMock()
+    module.client.side_effect = lambda service, retry_decorator: {"ec2": ec2, "elbv2": elbv2}[service]
+    module.fail_json.side_effect = FailJson
+    return module
+
+
+def _summary(tgs):
+    return [(tg.target_group_arn.split("/")[1], [(t.target_id, t.target_port) for t in tg.targets]) for tg in tgs]
+
+
+def test_target_index(module):
+    gatherer = elb_target_info.TargetInfoGatherer(module, ["i-1", "i-2", "i-3", "i-1"], True)
+
+    elbv2 = module.client("elbv2", retry_decorator=None)
+    described = [call.kwargs["TargetGroupArn"].split("/")[1] for call in elbv2.describe_target_health.call_args_list]
+    # each candidate target group is only described once, whatever the number of instances
+    assert described == ["web", "ips", "unused"]
+    assert list(gatherer.tgs_by_instance) == ["i-1", "i-2", "i-3"]
+    assert _summary(gatherer.tgs_by_instance["i-1"]) == [("web", [("i-1", 80), ("i-1", 8080)])]
+    assert _summary(gatherer.tgs_by_instance["i-2"]) == [
+        ("web", [("i-2", 80)]),
+        ("unused", [("i-2", 80)]),
+        ("ips", [("10.0.0.2", 80)]),
+    ]
+    assert gatherer.tgs_by_instance["i-3"] == []
+
+
+def test_single_instance(module):
+    gatherer = elb_target_info.TargetInfoGatherer(module, "i-2", False)
+
+    assert _summary(gatherer.tgs) == [("web", [("i-2", 80)]), ("ips", [("10.0.0.2", 80)])]
+    assert gatherer.tgs[0].to_dict()["targets"][0]["target_health"] == {"state": "healthy"}
+
+
+def test_missing_instance(module):
+    with pytest.raises(FailJson):
+        elb_target_info.TargetInfoGatherer(module, ["i-1", "i-404"], True)
+    module.fail_json.assert_called_once_with(msg="Instance ID i-404 could not be found")
+
+
+def test_describe_instances_retries_throttling(module, mocker):
+    mocker.patch("time.sleep")
+    ec2 = module.client("ec2", retry_decorator=None)
+    build_full_result = ec2.get_paginator.return_value.paginate.return_value.build_full_result
+    reservations = build_full_result.return_value
+    build_full_result.side_effect = [
+        ClientError({"Error": {"Code": "RequestLimitExceeded", "Message": ""}}, "DescribeInstances"),
+        reservations,
+    ]
+
+    gatherer = elb_target_info.TargetInfoGatherer(module, "i-1", False)
+
+    assert build_full_result.call_count == 2
+    assert _summary(gatherer.tgs) == [("web", [("i-1", 80), ("i-1", 8080)])]
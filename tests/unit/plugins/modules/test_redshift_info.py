@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the Ansible project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from ansible_collections.community.aws.plugins.modules import redshift_info
+
+
+def _cluster(identifier, **tags):
+    return {"ClusterIdentifier": identifier, "Tags": [{"Key": k, "Value": v} for k, v in tags.items()]}
+
+
+CLUSTERS = [
+    _cluster("prod-a", env="prod", team="data"),
+    _cluster("prod-b", env="prod"),
+    _cluster("dev-a", env="dev", team="data"),
+    _cluster("production"),
+]
+
+
+def _conn(clusters=CLUSTERS):
+    conn = MagicMock()
+    conn.get_paginator.return_value.paginate.return_value = [{"Clusters": clusters[:2]}, {"Clusters": clusters[2:]}]
+    return conn
+
+
+@pytest.mark.parametrize(
+    "identifier,tags,expected",
+    [
+        (None, None, ["prod-a", "prod-b", "dev-a", "production"]),
+        ("prod", None, ["prod-a", "prod-b", "production"]),
+        ("prod-.$", None, ["prod-a", "prod-b"]),
+        (None, {"env": "prod"}, ["prod-a", "prod-b"]),
+        # any of the tags matches
+        (None, {"env": "dev", "team": "data"}, ["prod-a", "dev-a"]),
+        ("prod", {"team": "data"}, ["prod-a"]),
+        (None, {"env": "data"}, []),
+    ],
+)
+def test_compile_matcher(identifier, tags, expected):
+    matcher = redshift_info.compile_matcher(identifier, tags)
+    assert [c["ClusterIdentifier"] for c in CLUSTERS if matcher(c)] == expected
+
+
+@pytest.mark.parametrize(
+    "identifier,tags,expected",
+    [
+        (None, None, {}),
+        ("prod", None, {}),
+        ("prod-.$", None, {}),
+        ("prod-a$", None, {"ClusterIdentifier": "prod-a"}),
+        ("prod-a$", {"env": "prod"}, {"ClusterIdentifier": "prod-a"}),
+        ("prod", {"env": "prod", "size": 3}, {"TagKeys": ["env", "size"], "TagValues": ["prod", "3"]}),
+    ],
+)
+def test_describe_clusters_params(identifier, tags, expected):
+    assert redshift_info.describe_clusters_params(identifier, tags) == expected
+
+
+def test_find_clusters():
+    conn = _conn()
+
+    results = redshift_info.find_clusters(conn, MagicMock(), identifier="prod", tags={"env": "prod"})
+
+    conn.get_paginator.return_value.paginate.assert_called_once_with(TagKeys=["env"], TagValues=["prod"])
+    assert [c["cluster_identifier"] for c in results] == ["prod-a", "prod-b"]
+    assert results[0]["tags"] == [{"key": "env", "value": "prod"}, {"key": "team", "value": "data"}]
+
+
+def test_find_clusters_not_found():
+    conn = _conn()
+    conn.get_paginator.return_value.paginate.side_effect = ClientError(
+        {"Error": {"Code": "ClusterNotFound", "Message": ""}}, "DescribeClusters"
+    )
+
+    assert redshift_info.find_clusters(conn, MagicMock(), identifier="missing$") == []
+    conn.get_paginator.return_value.paginate.assert_called_once_with(ClusterIdentifier="missing")
@@ -0,0 +1,329 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the Ansible project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import datetime
+import hashlib
+import os
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from ansible_collections.community.aws.plugins.modules import s3_sync
+
+if not s3_sync.HAS_DATEUTIL:
+    pytestmark = pytest.mark.skip("test_s3_sync.py requires the python module 'dateutil'")
+
+LAST_MODIFIED = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+EPOCH = int(LAST_MODIFIED.timestamp())
+
+
+def _client_error(code, operation):
+    return ClientError({"Error": {"Code": code, "Message": code}}, operation)
+
+
+def _entry(path, size=10, modified=EPOCH, root="/src", **fields):
+    entry = s3_sync.FileEntry(f"{root}/{path}", path, modified, size)
+    entry.s3_path = f"prefix/{path}"
+    for name, value in fields.items():
+        setattr(entry, name, value)
+    return entry
+
+
+def _s3_client(objects):
+    s3 = MagicMock()
+    pages = [{"Contents": objects[i:i + 2]} for i in range(0, len(objects), 2)]  # fmt:skip
+    s3.get_paginator.return_value.paginate.return_value = pages or [{}]
+    return s3
+
+
+def _object(key, size=10, etag='"abc"'):
+    return {"Key": key, "Size": size, "ETag": etag, "LastModified": LAST_MODIFIED}
+
+
+def test_list_s3_only_indexes_wanted_keys():
+    s3 = _s3_client([_object("prefix/a"), _object("prefix/b", size=20), _object("prefix/unrelated")])
+
+    index = s3_sync.list_s3(s3, "bucket", "prefix", [_entry("a"), _entry("b"), _entry("c")])
+
+    s3.get_paginator.assert_called_once_with("list_objects_v2")
+    s3.get_paginator.return_value.paginate.assert_called_once_with(Bucket="bucket", Prefix="prefix")
+    assert index == {
+        "prefix/a": {"ETag": '"abc"', "ContentLength": 10, "LastModified": LAST_MODIFIED},
+        "prefix/b": {"ETag": '"abc"', "ContentLength": 20, "LastModified": LAST_MODIFIED},
+    }
+
+
+def test_head_s3_uses_listing():
+    s3 = _s3_client([_object("prefix/a")])
+
+    result = s3_sync.head_s3(s3, "bucket", [_entry("a"), _entry("b")], "prefix")
+
+    s3.head_object.assert_not_called()
+    assert result[0].s3_head["ContentLength"] == 10
+    assert "s3_head" not in result[1].to_dict()
+
+
+def test_head_s3_falls_back_to_head_object():
+    s3 = _s3_client([])
+    s3.get_paginator.return_value.paginate.side_effect = _client_error("AccessDenied", "ListObjectsV2")
+    heads = {"prefix/a": {"ETag": '"abc"', "ContentLength": 10, "LastModified": LAST_MODIFIED}}
+
+    def head_object(Bucket, Key):
+        if Key not in heads:
+            raise _client_error("404", "HeadObject")
+        return heads[Key]
+
+    s3.head_object.side_effect = head_object
+    entries = [_entry("b"), _entry("a"), _entry("c")]
+
+    result = s3_sync.head_s3(s3, "bucket", entries, "prefix")
+
+    assert s3.head_object.call_count == 3
+    assert [e.chopped_path for e in result] == ["b", "a", "c"]
+    assert [bool(e.get("s3_head")) for e in result] == [False, True, False]
+
+
+@pytest.mark.parametrize(
+    "strategy,expected",
+    [
+        ("force", ["resized", "newer", "edited", "missing", "same"]),
+        ("date_size", ["resized", "newer", "missing"]),
+        ("checksum", ["resized", "edited", "missing"]),
+    ],
+)
+def test_filter_list(tmp_path, strategy, expected):
+    content = b"0123456789"
+    etag = f'"{hashlib.md5(content).hexdigest()}"'
+    s3 = _s3_client(
+        [
+            _object("prefix/resized", size=5),
+            _object("prefix/newer", etag=etag),
+            _object("prefix/edited", etag=etag),
+            _object("prefix/same", etag=etag),
+        ]
+    )
+    names = ["resized", "newer", "edited", "missing", "same"]
+    for name in names:
+        (tmp_path / name).write_bytes(b"9876543210" if name == "edited" else content)
+    entries = [_entry(name, modified=EPOCH + 60 if name == "newer" else EPOCH, root=tmp_path) for name in names]
+
+    result = s3_sync.filter_list(s3, "bucket", entries, strategy, "prefix")
+
+    assert [e.chopped_path for e in result] == expected
+
+
+def test_calculate_local_etag_only_when_needed(tmp_path, mocker):
+    etag = mocker.patch.object(s3_sync, "calculate_multipart_etags", return_value=['"abc"'])
+    head = {"ETag": '"abc"', "ContentLength": 10, "LastModified": LAST_MODIFIED}
+    entries = [
+        _entry("same_size", root=tmp_path, s3_head=head),
+        _entry("resized", size=20, root=tmp_path, s3_head=head),
+        _entry("missing", root=tmp_path),
+    ]
+
+    result = s3_sync.calculate_local_etag(entries, chunk_size=1024, cache="cache", max_workers=2)
+
+    etag.assert_called_once_with([(f"{tmp_path}/same_size", 1024, '"abc"')], max_workers=2, cache="cache")
+    assert [e.get("local_etag") for e in result] == ['"abc"', None, None]
+
+
+def test_calculate_local_etag_fips(tmp_path, mocker):
+    mocker.patch.object(s3_sync, "calculate_multipart_etags", side_effect=ValueError("unsupported hash type md5"))
+    head = {"ETag": '"abc"', "ContentLength": 10, "LastModified": LAST_MODIFIED}
+
+    with pytest.raises(s3_sync.ChecksumError):
+        s3_sync.calculate_local_etag([_entry("same_size", root=tmp_path, s3_head=head)])
+
+
+def test_upload_files():
+    s3 = MagicMock()
+    entries = [_entry(name, size=size, mime_type="text/plain") for name, size in (("a", 10), ("b", 20), ("c", 30))]
+    params = {
+        "permission": "private",
+        "cache_control": "",
+        "storage_class": "STANDARD",
+        "max_concurrency": 2,
+        "multipart_threshold": 16 * 1024 * 1024,
+        "multipart_chunksize": 6 * 1024 * 1024,
+    }
+
+    uploads, stats = s3_sync.upload_files(s3, "bucket", entries, params)
+
+    assert [e.chopped_path for e in uploads] == ["a", "b", "c"]
+    assert all(e.upload_seconds >= 0 for e in uploads)
+    assert stats["files"] == 3
+    assert stats["bytes"] == 60
+    assert s3.upload_file.call_count == 3
+    configs = set()
+    for call in s3.upload_file.call_args_list:
+        assert call.kwargs["ExtraArgs"] == {"ContentType": "text/plain", "ACL": "private", "StorageClass": "STANDARD"}
+        configs.add(id(call.kwargs["Config"]))
+    # A single TransferConfig is shared by every upload
+    assert len(configs) == 1
+    config = s3.upload_file.call_args.kwargs["Config"]
+    assert config.max_concurrency == 2
+    assert config.multipart_threshold == 16 * 1024 * 1024
+    assert config.multipart_chunksize == 6 * 1024 * 1024
+
+
+@pytest.mark.parametrize("max_concurrency, parts", [(1, 1), (10, 10), (20, 5), (64, 1), (200, 1)])
+def test_part_concurrency(max_concurrency, parts):
+    assert s3_sync.part_concurrency(max_concurrency) == parts
+
+
+def test_upload_files_failure():
+    s3 = MagicMock()
+
+    def upload_file(path, *args, **kwargs):
+        if path.endswith("file-1"):
+            raise _client_error("AccessDenied", "PutObject")
+        time.sleep(0.01)
+
+    s3.upload_file.side_effect = upload_file
+    entries = [_entry(f"file-{index}", mime_type="text/plain") for index in range(50)]
+
+    with pytest.raises(ClientError):
+        s3_sync.upload_files(s3, "bucket", entries, {"max_concurrency": 1})
+    # The queued uploads are cancelled
+    assert s3.upload_file.call_count < 50
+
+
+def _touch(path, data=b"x"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+
+
+def test_gather_files(tmp_path):
+    root = tmp_path / "root"
+    for name in ("a.txt", "b.gif", ".hidden", "sub/c.txt", "sub/deeper/d.txt", "sub/.e.txt", "other/f.gif"):
+        _touch(root / name)
+    (tmp_path / "outside").mkdir()
+    _touch(tmp_path / "outside" / "g.txt")
+    (root / "link").symlink_to(tmp_path / "outside")
+
+    def gather(**kwargs):
+        return sorted(e.chopped_path for e in s3_sync.gather_files(str(root), **kwargs))
+
+    assert gather(include="*", exclude=".*") == ["a.txt", "b.gif", "other/f.gif", "sub/c.txt", "sub/deeper/d.txt"]
+    assert gather(include="*.txt,*.gif", exclude="b*,.*") == ["a.txt", "other/f.gif", "sub/c.txt", "sub/deeper/d.txt"]
+    assert gather(include="*.txt", exclude="") == ["a.txt", "sub/.e.txt", "sub/c.txt", "sub/deeper/d.txt"]
+    assert gather(include="", exclude="*.txt") == [".hidden", "b.gif", "other/f.gif"]
+
+    entry = next(e for e in s3_sync.gather_files(str(root) + "/", include="a*") if e.chopped_path == "a.txt")
+    assert entry.fullpath == f"{root}/a.txt"
+    assert entry.bytes == 1
+    assert entry.to_dict() == {
+        "fullpath": f"{root}/a.txt",
+        "chopped_path": "a.txt",
+        "modified_epoch": int(os.stat(root / "a.txt").st_mtime),
+        "bytes": 1,
+    }
+
+
+def test_gather_files_single_file(tmp_path):
+    _touch(tmp_path / "file.txt", b"abc")
+    entries = list(s3_sync.gather_files(str(tmp_path / "file.txt"), include="*.gif"))
+    assert [(e.chopped_path, e.bytes) for e in entries] == [("file.txt", 3)]
+    assert list(s3_sync.gather_files(str(tmp_path / "missing"))) == []
+
+
+def test_pipeline_snapshots():
+    entries = [
+        s3_sync.FileEntry("/src/a.json", "a.json", EPOCH, 1),
+        s3_sync.FileEntry("/src/b.weird", "b.weird", EPOCH, 2),
+    ]
+    initial = []
+    typed = []
+
+    pipeline = s3_sync.snapshot_files(entries, initial)
+    pipeline = s3_sync.determine_mimetypes(pipeline, {".weird": "text/weird"})
+    pipeline = s3_sync.snapshot_files(pipeline, typed)
+    pipeline = s3_sync.calculate_s3_path(pipeline, "prefix")
+    # nothing happens until the pipeline is consumed
+    assert initial == []
+
+    result = list(s3_sync.snapshot_files(pipeline, None))
+
+    assert [e.s3_path for e in result] == ["prefix/a.json", "prefix/b.weird"]
+    assert initial[0] == {"fullpath": "/src/a.json", "chopped_path": "a.json", "modified_epoch": EPOCH, "bytes": 1}
+    assert typed[0]["mime_type"] == "application/json"
+    assert typed[1] == dict(initial[1], mime_type="text/weird")
+    assert "s3_path" not in typed[0]
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_keys_to_delete(ordered):
+    remote = ["prefix/a", "prefix/b", "prefix/b/c", "prefix/é", "prefix/z"]
+    if not ordered:
+        remote = [remote[2], remote[0], remote[4], remote[1], remote[3]]
+    pages = [{"Contents": [{"Key": key} for key in remote[:2]]}, {}, {"Contents": [{"Key": key} for key in remote[2:]]}]
+    keep = ["prefix/z", "prefix/b", "prefix/local-only", "prefix/é"]
+
+    result = list(s3_sync._keys_to_delete(pages, keep))
+
+    assert sorted(result) == ["prefix/a", "prefix/b/c"]
+
+
+def test_remove_files():
+    remote = [_object(f"prefix/{index:05d}") for index in range(2500)]
+    s3 = _s3_client(remote)
+    s3.delete_objects.side_effect = lambda Bucket, Delete: (
+        {"Errors": [{"Key": "prefix/00003", "Code": "AccessDenied"}]}
+        if {"Key": "prefix/00003"} in Delete["Objects"]
+        else {}
+    )
+    local = [_entry(f"{index:05d}") for index in range(0, 2500, 2)]
+    params = {"bucket": "bucket", "key_prefix": "prefix", "max_concurrency": 2, "delete_sample_size": 3}
+
+    count, sample, failures = s3_sync.remove_files(s3, local, params)
+
+    # 1250 odd keys, one of which failed to delete
+    assert count == 1249
+    assert sample == ["prefix/00001", "prefix/00005", "prefix/00007"]
+    assert failures == [{"key": "prefix/00003", "code": "AccessDenied", "message": None}]
+    batches = [call.kwargs["Delete"]["Objects"] for call in s3.delete_objects.call_args_list]
+    assert [len(batch) for batch in batches] == [1000, 250]
+
+
+def test_remove_files_returns_all_keys_by_default():
+    remote = [_object(f"prefix/{index:05d}") for index in range(2500)]
+    s3 = _s3_client(remote)
+    s3.delete_objects.return_value = {}
+    params = {"bucket": "bucket", "key_prefix": "prefix", "max_concurrency": 2}
+
+    count, sample, failures = s3_sync.remove_files(s3, [_entry("00000")], params)
+
+    assert count == 2499
+    assert sample == [f"prefix/{index:05d}" for index in range(1, 2500)]
+    assert failures == []
+
+
+def test_remove_files_reports_errors():
+    remote = [_object(f"prefix/{name}") for name in ("a", "b", "c", "d")]
+    s3 = _s3_client(remote)
+    s3.delete_objects.return_value = {
+        "Errors": [
+            {"Key": "prefix/d", "Code": "InternalError", "Message": "We encountered an internal error."},
+            {"Key": "prefix/b", "Code": "AccessDenied", "Message": "Access Denied"},
+        ]
+    }
+
+    count, sample, failures = s3_sync.remove_files(s3, [], {"bucket": "bucket", "key_prefix": "prefix"})
+
+    assert count == 2
+    assert sample == ["prefix/a", "prefix/c"]
+    assert failures == [
+        {"key": "prefix/b", "code": "AccessDenied", "message": "Access Denied"},
+        {"key": "prefix/d", "code": "InternalError", "message": "We encountered an internal error."},
+    ]
+
+
+def test_remove_files_nothing_to_delete():
+    s3 = _s3_client([_object("prefix/a")])
+    count, sample, failures = s3_sync.remove_files(s3, [_entry("a")], {"bucket": "bucket", "key_prefix": "prefix"})
+    assert (count, sample, failures) == (0, [], [])
+    s3.delete_objects.assert_not_called()
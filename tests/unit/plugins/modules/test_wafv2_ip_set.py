@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the Ansible project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import pytest
+
+from ansible_collections.community.aws.plugins.modules import wafv2_ip_set
+
+
+@pytest.mark.parametrize(
+    "address,expected",
+    [
+        ("10.0.0.1/32", "10.0.0.1/32"),
+        (" 10.0.0.1/32 ", "10.0.0.1/32"),
+        ("10.0.0.1", "10.0.0.1/32"),
+        ("10.0.0.5/24", "10.0.0.0/24"),
+        ("2001:DB8:0:0:0:0:0:1/128", "2001:db8::1/128"),
+        ("not-an-address ", "not-an-address"),
+    ],
+)
+def test_normalize_address(address, expected):
+    assert wafv2_ip_set.normalize_address(address) == expected
+
+
+def test_aggregate_addresses():
+    addresses = ["10.0.0.0/25", "10.0.0.128/25", "10.0.1.7/32", "10.0.1.0/24", "2001:db8::/33", "2001:db8:8000::/33"]
+    assert wafv2_ip_set.aggregate_addresses(addresses + ["bogus"]) == [
+        "10.0.0.0/23",
+        "2001:db8::/32",
+        "bogus",
+    ]
+
+
+EXISTING = {"addresses": ["10.0.0.1/32", "10.0.0.2/32", "192.168.0.0/24"]}
+
+
+@pytest.mark.parametrize(
+    "addresses,purge,expected_diff,expected",
+    [
+        # same addresses written differently
+        ([" 10.0.0.2", "192.168.0.7/24", "10.0.0.1/32"], True, False, EXISTING["addresses"]),
+        (["10.0.0.1/32", "10.0.0.3/32"], True, True, ["10.0.0.1/32", "10.0.0.3/32"]),
+        (["10.0.0.1", "10.0.0.3/32"], False, True, ["10.0.0.3/32", "10.0.0.1/32", "10.0.0.2/32", "192.168.0.0/24"]),
+        (["10.0.0.1"], False, False, EXISTING["addresses"]),
+    ],
+)
+def test_compare_present(addresses, purge, expected_diff, expected):
+    assert wafv2_ip_set.compare(dict(EXISTING), addresses, purge, "present") == (expected_diff, expected)
+
+
+def test_compare_present_aggregate():
+    existing = {"addresses": ["10.0.0.0/25"]}
+    assert wafv2_ip_set.compare(existing, ["10.0.0.128/25"], False, "present", aggregate=True) == (
+        True,
+        ["10.0.0.0/24"],
+    )
+    existing = {"addresses": ["10.0.0.0/24"]}
+    assert wafv2_ip_set.compare(existing, ["10.0.0.0/25", "10.0.0.128/25"], True, "present", aggregate=True) == (
+        False,
+        ["10.0.0.0/24"],
+    )
+
+
+@pytest.mark.parametrize(
+    "addresses,purge,expected_diff,expected",
+    [
+        (["10.0.0.1", "172.16.0.1/32"], True, True, ["10.0.0.2/32", "192.168.0.0/24"]),
+        (["172.16.0.1/32"], True, False, EXISTING["addresses"]),
+        (["10.0.0.1"], False, False, []),
+    ],
+)
+def test_compare_absent(addresses, purge, expected_diff, expected):
+    assert wafv2_ip_set.compare(dict(EXISTING), addresses, purge, "absent") == (expected_diff, expected)
@@ -0,0 +1,83 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Benchmarks for the wafv2_ip_set address comparison with IP sets of the
+# maximum size WAF allows, skipped unless the COMMUNITY_AWS_BENCHMARK
+# environment variable is set.
+
+import ipaddress
+import os
+import time
+
+import pytest
+
+from ansible_collections.community.aws.plugins.modules import wafv2_ip_set
+
+if not os.environ.get("COMMUNITY_AWS_BENCHMARK"):
+    pytestmark = pytest.mark.skip("set COMMUNITY_AWS_BENCHMARK to run the benchmarks")
+
+SIZE = 10000
+
+
+def list_compare(existing_set, addresses, purge_addresses, state):
+    # The previous implementation, list membership tests and list.index()
+    diff = False
+    new_rules = []
+    existing_rules = existing_set.get("addresses")
+    if state == "present":
+        if purge_addresses:
+            new_rules = addresses
+            if sorted(addresses) != sorted(existing_set.get("addresses")):
+                diff = True
+        else:
+            for requested_rule in addresses:
+                if requested_rule not in existing_rules:
+                    diff = True
+                    new_rules.append(requested_rule)
+            new_rules += existing_rules
+    else:
+        if purge_addresses and addresses:
+            for requested_rule in addresses:
+                if requested_rule in existing_rules:
+                    diff = True
+                    existing_rules.pop(existing_rules.index(requested_rule))
+            new_rules = existing_rules
+    return diff, new_rules
+
+
+def _addresses(start, count):
+    base = int(ipaddress.ip_address("10.0.0.0"))
+    return [f"{ipaddress.ip_address(base + index)}/32" for index in range(start, start + count)]
+
+
+def _measure(name, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"\n{name}: {(time.perf_counter() - start) * 1000:.1f} ms")
+    return result
+
+
+@pytest.mark.parametrize("purge,state", [(False, "present"), (True, "absent")])
+def test_benchmark_compare(purge, state):
+    # half of the requested addresses are already in the IP set
+    existing = _addresses(0, SIZE)
+    requested = _addresses(SIZE // 2, SIZE)
+
+    legacy = _measure(
+        f"list compare ({state})", lambda: list_compare({"addresses": list(existing)}, requested, purge, state)
+    )
+    result = _measure(
+        f"set compare ({state})", lambda: wafv2_ip_set.compare({"addresses": existing}, requested, purge, state)
+    )
+
+    assert result[0] == legacy[0]
+    assert sorted(result[1]) == sorted(legacy[1])
+
+
+def test_benchmark_aggregate():
+    # 10000 contiguous /32 addresses collapse into a handful of networks
+    addresses = _addresses(0, SIZE)
+
+    result = _measure("aggregate", lambda: wafv2_ip_set.compare({"addresses": []}, addresses, True, "present", True))
+
+    assert len(result[1]) < 10
+    print(f"{SIZE} addresses aggregated into {len(result[1])} networks")
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the Ansible project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import os
+import pty
+import subprocess
+import threading
+import time
+
+import pytest
+
+from ansible_collections.community.aws.plugins.plugin_utils.ssm.sessionpool import SessionPoolServer
+from ansible_collections.community.aws.plugins.plugin_utils.ssm.sessionpool import connect_session_pool
+from ansible_collections.community.aws.plugins.plugin_utils.ssm.sessionpool import session_pool_key
+from ansible_collections.community.aws.plugins.plugin_utils.ssm.sessionpool import session_pool_path
+from ansible_collections.community.aws.plugins.plugin_utils.ssm.sessionpool import spawn_session_pool
+
+
+def start_fake_session():
+    stdout_r, stdout_w = pty.openpty()
+    session = subprocess.Popen(
+        ["cat"], stdin=subprocess.PIPE, stdout=stdout_w, stderr=subprocess.PIPE, close_fds=True, bufsize=0
+    )
+    os.close(stdout_w)
+    return session, os.fdopen(stdout_r, "rb", 0), "s-0123456789"
+
+
+def read_until(pooled, expected, timeout=5):
+    output = b""
+    stop_time = time.monotonic() + timeout
+    while expected not in output and time.monotonic() < stop_time:
+        output += pooled.stdout.read(1024)
+    return output
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    return session_pool_path(str(tmp_path / "cp"), session_pool_key("i-123", "us-east-1", "", None))
+
+
+def test_session_pool_key():
+    key = session_pool_key("i-123", "us-east-1", "default", None)
+    assert key == session_pool_key("i-123", "us-east-1", "default", None)
+    assert key != session_pool_key("i-123", "us-east-2", "default", None)
+    assert key != session_pool_key("i-123", "us-east-1", "default", "MyDocument")
+
+
+def test_session_pool_path(tmp_path):
+    path = session_pool_path(str(tmp_path / "cp"), "abc")
+    assert path == str(tmp_path / "cp" / "ssm-abc")
+    assert os.stat(str(tmp_path / "cp")).st_mode & 0o777 == 0o700
+
+
+def test_connect_session_pool_missing(socket_path):
+    assert connect_session_pool(socket_path) is None
+
+
+def test_session_pool_server_relay(socket_path):
+    session, stdout, session_id = start_fake_session()
+    server = SessionPoolServer(socket_path, session, stdout, session_id, idle_timeout=2)
+    server.bind()
+    thread = threading.Thread(target=server.serve)
+    thread.start()
+    try:
+        # Clients are served one at a time, each one sees the same terminal
+        for message in (b"first", b"second"):
+            pooled = connect_session_pool(socket_path)
+            assert pooled.handshake(5)
+            assert pooled.session_id == session_id
+            assert pooled.server_pid == os.getpid()
+            assert pooled.poll() is None
+            pooled.stdin.write(message + b"\n")
+            assert message in read_until(pooled, message)
+            pooled.close()
+
+        # Nobody attached, the pool process gives up after idle_timeout
+        thread.join(10)
+        assert not thread.is_alive()
+        assert not os.path.exists(socket_path)
+    finally:
+        session.kill()
+        session.wait()
+
+
+def test_spawn_session_pool(socket_path):
+    closed = os.path.join(os.path.dirname(socket_path), "closed")
+
+    def close_session():
+        open(closed, "w").close()
+
+    assert spawn_session_pool(socket_path, start_fake_session, close_session, 30) is None
+
+    pooled = connect_session_pool(socket_path)
+    assert pooled.handshake(5)
+    assert pooled.server_pid != os.getpid()
+    pooled.stdin.write(b"pooled\n")
+    assert b"pooled" in read_until(pooled, b"pooled")
+
+    pooled.terminate()
+    stop_time = time.monotonic() + 10
+    while not os.path.exists(closed) and time.monotonic() < stop_time:
+        time.sleep(0.1)
+    assert os.path.exists(closed)
+    assert not os.path.exists(socket_path)
+
+
+def test_spawn_session_pool_failure(socket_path):
+    def start_session():
+        raise RuntimeError("StartSession denied")
+
+    error = spawn_session_pool(socket_path, start_session, lambda: None, 30)
+    assert error == "RuntimeError: StartSession denied"
+    assert connect_session_pool(socket_path) is None